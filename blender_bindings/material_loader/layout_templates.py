@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import bpy
+
+from ...library.utils.singleton import SingletonMeta
+from ...logger import SLoggingManager
+from .node_arranger import nodes_iterate
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('MaterialLoader::Layout')
+
+
+def graph_signature(node_tree: bpy.types.NodeTree) -> Hashable:
+    """Structure of a node tree: node types, names, groups and sizes plus all links.
+
+    Everything the layout pass looks at is part of the signature, textures and parameter values are not.
+    """
+    nodes = tuple((node.bl_idname, node.name, node.node_tree.name if getattr(node, 'node_tree', None) else None,
+                   node.hide, round(node.width)) for node in node_tree.nodes)
+    links = tuple(sorted((link.from_node.name, link.from_socket.identifier,
+                          link.to_node.name, link.to_socket.identifier) for link in node_tree.links))
+    return nodes, links
+
+
+def _find_socket(sockets, identifier: str):
+    for socket in sockets:
+        if socket.identifier == identifier:
+            return socket
+    return None
+
+
+def _arranged_nodes(node_tree: bpy.types.NodeTree) -> List[str]:
+    """Names of the nodes the layout pass moves, everything upstream of an output node."""
+    upstream: Dict[str, List[str]] = {}
+    for link in node_tree.links:
+        upstream.setdefault(link.to_node.name, []).append(link.from_node.name)
+    queue = [node.name for node in node_tree.nodes
+             if not node.outputs and any(socket.is_linked for socket in node.inputs)]
+    seen = set(queue)
+    for name in queue:
+        for source in upstream.get(name, ()):
+            if source not in seen:
+                seen.add(source)
+                queue.append(source)
+    return queue
+
+
+class LayoutTemplates(metaclass=SingletonMeta):
+    """Node layouts shared by every material with the same graph structure.
+
+    Materials of one shader mostly differ in their textures and parameters only, so the
+    layout pass runs once per graph signature and the resulting node locations are replayed
+    on every other material with that signature.
+    """
+
+    def __init__(self):
+        self._layouts: Dict[Hashable, Tuple[Tuple[str, Tuple[float, float]], ...]] = {}
+
+    def arrange(self, node_tree: bpy.types.NodeTree):
+        signature = graph_signature(node_tree)
+        layout = self._layouts.get(signature, None)
+        if layout is not None:
+            nodes = node_tree.nodes
+            for name, location in layout:
+                nodes[name].location = location
+            return
+        nodes_iterate(node_tree)
+        nodes = node_tree.nodes
+        self._layouts[signature] = tuple((name, tuple(nodes[name].location))
+                                         for name in _arranged_nodes(node_tree))
+        logger.debug(f'New layout template, {len(self._layouts)} known')
+
+    def clear(self):
+        self._layouts.clear()
+
+
+@dataclass(slots=True)
+class _RecordedNode:
+    bl_idname: str
+    name: str
+    label: str
+    group_name: Optional[str]
+    location: Tuple[float, float]
+    width: float
+
+
+@dataclass(slots=True)
+class _RecordedTree:
+    nodes: Tuple[_RecordedNode, ...]
+    # (from node, from socket identifier, to node, to socket identifier)
+    links: Tuple[Tuple[str, str, str, str], ...]
+
+
+class NodeTemplates(metaclass=SingletonMeta):
+    """Static parts of shader graphs, built once per key and copied into later materials.
+
+    Only node types, names, groups, locations, widths and the links between the recorded nodes are copied,
+    textures, node settings and input values are bound by the shader afterwards.
+    """
+
+    def __init__(self):
+        self._trees: Dict[Hashable, _RecordedTree] = {}
+
+    def build(self, key: Hashable, node_tree: bpy.types.NodeTree, build: Callable[[], None]):
+        """Copy the tree recorded under key into node_tree, or run build and record the nodes it added."""
+        recorded = self._trees.get(key, None)
+        if recorded is not None and self._copy(recorded, node_tree):
+            return
+        existing = set(node_tree.nodes.keys())
+        build()
+        nodes = [node for node in node_tree.nodes if node.name not in existing]
+        names = {node.name for node in nodes}
+        self._trees[key] = _RecordedTree(
+            tuple(_RecordedNode(node.bl_idname, node.name, node.label,
+                                node.node_tree.name if getattr(node, 'node_tree', None) else None,
+                                tuple(node.location), node.width) for node in nodes),
+            tuple((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier)
+                  for link in node_tree.links if link.from_node.name in names and link.to_node.name in names))
+        logger.debug(f'New node template {key}, {len(self._trees)} known')
+
+    @staticmethod
+    def _copy(recorded: _RecordedTree, node_tree: bpy.types.NodeTree) -> bool:
+        node_groups = bpy.data.node_groups
+        # Groups can disappear with undo or file reload, let the shader build (and append) them again
+        if any(node.group_name is not None and node.group_name not in node_groups for node in recorded.nodes):
+            return False
+        nodes = node_tree.nodes
+        for recorded_node in recorded.nodes:
+            node = nodes.new(recorded_node.bl_idname)
+            node.name = recorded_node.name
+            node.label = recorded_node.label
+            if recorded_node.group_name is not None:
+                node.node_tree = node_groups[recorded_node.group_name]
+            node.location = recorded_node.location
+            node.width = recorded_node.width
+        links = node_tree.links
+        for from_node, from_socket, to_node, to_socket in recorded.links:
+            links.new(_find_socket(nodes[from_node].outputs, from_socket),
+                      _find_socket(nodes[to_node].inputs, to_socket))
+        return True
+
+    def clear(self):
+        self._trees.clear()
@@ -1,18 +1,17 @@
 import traceback
 from pathlib import Path
-from typing import Dict, Type, Union
+from typing import IO, Union
 
 from ...library.goldsrc.mdl_v10.structs.texture import StudioTexture
+from ...library.shared.texture_service import TextureService
 from ...library.source1.vmt import VMT
 from ...library.source2 import CompiledMaterialResource
 from ...logger import SLoggingManager
-from .shader_base import ShaderBase
-from .shaders import (debug_material, goldsrc_shaders, source1_shaders,
-                      source2_shaders)
+from .shader_registry import (GOLDSRC_SHADERS, SOURCE1_SHADERS, SOURCE2_SHADERS,
+                              ShaderRegistry)
 from .shaders.goldsrc_shader_base import GoldSrcShaderBase
 from .shaders.source1_shader_base import Source1ShaderBase
 from .shaders.source2_shader_base import Source2ShaderBase
-from .shaders.source2_shaders.dummy import DummyShader
 
 log_manager = SLoggingManager()
 logger = log_manager.get_logger('MaterialLoader')
@@ -27,21 +26,21 @@ class MaterialLoaderBase:
 
 
 class Source1MaterialLoader(MaterialLoaderBase):
-    _handlers: Dict[str, Type[Source1ShaderBase]] = dict()
-    sub: Type[ShaderBase]
-    for sub in Source1ShaderBase.all_subclasses():
-        logger.info(f'Registered Source1 material handler for {sub.__name__} shader')
-        _handlers[sub.SHADER] = sub
+    _handlers: ShaderRegistry[Source1ShaderBase] = ShaderRegistry(SOURCE1_SHADERS)
 
-    def __init__(self, file_object, material_name):
+    def __init__(self, file_object: Union[VMT, IO], material_name):
         super().__init__(material_name)
         self.material_name: str = material_name[-63:]
-        self.vmt: VMT = VMT(file_object, self.material_name)
+        if isinstance(file_object, VMT):
+            self.vmt: VMT = file_object
+        else:
+            self.vmt: VMT = VMT(file_object, self.material_name)
 
     def create_material(self):
         handler: Source1ShaderBase = self._handlers.get(self.vmt.shader, Source1ShaderBase)(self.vmt)
 
         handler.create_nodes(self.material_name)
+        TextureService.active().release(handler)
 
         handler.align_nodes()
         if self.vmt.shader not in self._handlers:
@@ -50,11 +49,7 @@ class Source1MaterialLoader(MaterialLoaderBase):
 
 
 class GoldSrcMaterialLoader(MaterialLoaderBase):
-    _handlers: Dict[str, Type[GoldSrcShaderBase]] = dict()
-    sub: Type[ShaderBase]
-    for sub in GoldSrcShaderBase.all_subclasses():
-        logger.info(f'Registered GoldSrc material handler for {sub.__name__} shader')
-        _handlers[sub.SHADER] = sub
+    _handlers: ShaderRegistry[GoldSrcShaderBase] = ShaderRegistry(GOLDSRC_SHADERS)
 
     def __init__(self, goldsrc_material: StudioTexture, material_name):
         super().__init__(material_name)
@@ -73,11 +68,7 @@ class GoldSrcMaterialLoader(MaterialLoaderBase):
 
 
 class Source2MaterialLoader(MaterialLoaderBase):
-    _handlers: Dict[str, Type[Source2ShaderBase]] = dict()
-    sub: Type[ShaderBase]
-    for sub in Source2ShaderBase.all_subclasses():
-        logger.info(f'Registered Source2 material handler for {sub.__name__} shader')
-        _handlers[sub.SHADER] = sub
+    _handlers: ShaderRegistry[Source2ShaderBase] = ShaderRegistry(SOURCE2_SHADERS)
 
     def __init__(self, material_resource: CompiledMaterialResource, material_name, tinted: bool = False):
         super().__init__(material_name)
@@ -90,7 +81,8 @@ class Source2MaterialLoader(MaterialLoaderBase):
         if not data:
             return
         shader = data['m_shaderName']
-        handler: Source2ShaderBase = self._handlers.get(shader, DummyShader)(self.material_resource, self.tinted)
+        handler_class = self._handlers.get(shader, None) or self._handlers['DUMMY']
+        handler: Source2ShaderBase = handler_class(self.material_resource, self.tinted)
 
         if shader not in self._handlers:
             logger.error(f'Shader "{shader}" not currently supported by SourceIO')
@@ -100,4 +92,5 @@ class Source2MaterialLoader(MaterialLoaderBase):
             logger.error(f'Failed to load material, due to {ex} error')
             traceback.print_exc()
             logger.debug(f'Failed material: {self.material_name}')
+        TextureService.active().release(handler)
         handler.align_nodes()
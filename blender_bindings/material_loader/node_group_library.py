@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+import bpy
+
+from ...library.utils.singleton import SingletonMeta
+from ...logger import SLoggingManager
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('MaterialLoader::NodeGroups')
+
+ASSETS_PATH = Path(__file__).parent.parent / 'assets'
+SOURCE1_NODE_GROUPS = 'sycreation-s-default.blend'
+SOURCE2_NODE_GROUPS = 'source2_materials.blend'
+
+
+class NodeGroupLibrary(metaclass=SingletonMeta):
+    """Node groups shipped in the add-on assets, appended on first use.
+
+    An asset file is appended the first time a shader asks for one of its groups that is missing,
+    instead of being checked for by every shader constructor. All missing groups of the asset are
+    appended together, because the groups share sub-groups that would get duplicated by appending
+    them one at a time. Nothing is remembered about the current file, so groups that disappeared
+    (undo, file reload) are simply appended again.
+    """
+
+    def __init__(self):
+        self._asset_groups: Dict[str, Set[str]] = {}
+
+    def _groups_in(self, asset_name: str) -> Set[str]:
+        """Names of the node groups in an asset file, read once per session."""
+        groups = self._asset_groups.get(asset_name, None)
+        if groups is None:
+            with bpy.data.libraries.load(str(ASSETS_PATH / asset_name)) as (data_from, _):
+                groups = self._asset_groups[asset_name] = set(data_from.node_groups)
+        return groups
+
+    def get(self, group_name: str, asset_names: Iterable[str]) -> Optional[bpy.types.NodeTree]:
+        """Node group by name, appended from the first asset file providing it when missing."""
+        node_group = bpy.data.node_groups.get(group_name, None)
+        if node_group is not None:
+            return node_group
+        for asset_name in asset_names:
+            asset_groups = self._groups_in(asset_name)
+            if group_name not in asset_groups:
+                continue
+            missing = [name for name in asset_groups if name not in bpy.data.node_groups]
+            logger.debug(f'Appending {len(missing)} node groups from {asset_name} for {group_name!r}')
+            with bpy.data.libraries.load(str(ASSETS_PATH / asset_name)) as (_, data_to):
+                data_to.node_groups = missing
+            for appended in data_to.node_groups:
+                if appended is not None:
+                    appended.use_fake_user = True
+            return bpy.data.node_groups.get(group_name, None)
+        return None
@@ -1,13 +1,14 @@
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Hashable, Optional, Tuple
 
 import bpy
 import numpy as np
 
+from ...library.shared.pixel_pipeline import PixelPipeline
 from ...logger import SLoggingManager
-from ..utils.utils import append_blend
-from .node_arranger import nodes_iterate
+from .layout_templates import LayoutTemplates, NodeTemplates
+from .node_group_library import NodeGroupLibrary
 
 
 class Nodes:
@@ -115,26 +116,14 @@ logger = log_manager.get_logger('MaterialLoader')
 
 class ShaderBase:
     SHADER: str = "Unknown"
+    # Asset files node groups are looked up in, in order
+    NODE_GROUP_ASSETS: Tuple[str, ...] = ()
     use_bvlg_status = True
 
     @classmethod
     def use_bvlg(cls, status):
         cls.use_bvlg_status = status
 
-    @staticmethod
-    def load_bvlg_nodes():
-        if "VertexLitGeneric" not in bpy.data.node_groups:
-            current_path = Path(__file__).parent.parent
-            asset_path = current_path / 'assets' / "sycreation-s-default.blend"
-            append_blend(str(asset_path), "node_groups")
-
-    @staticmethod
-    def load_source2_nodes():
-        if "csgo_complex.vfx" not in bpy.data.node_groups:
-            current_path = Path(__file__).parent.parent
-            asset_path = current_path / 'assets' / "source2_materials.blend"
-            append_blend(str(asset_path), "node_groups")
-
     @staticmethod
     def ensure_length(array: list, length, filler):
         if len(array) < length:
@@ -168,7 +157,7 @@ class ShaderBase:
                 image.pixels[:] = image_data
             return image
 
-    def load_texture(self, texture_name, texture_path) -> Optional[bpy.types.Image]:
+    def load_texture(self, texture_name, texture_path, pipeline: PixelPipeline = ()) -> Optional[bpy.types.Image]:
         pass
 
     @staticmethod
@@ -183,17 +172,10 @@ class ShaderBase:
             image.colorspace_settings.name = 'Non-Color'
         return image
 
-    @staticmethod
-    def split_to_channels(image):
-        if bpy.app.version > (2, 83, 0):
-            buffer = np.zeros(image.size[0] * image.size[1] * 4, np.float32)
-            image.pixels.foreach_get(buffer)
-        else:
-            buffer = np.array(image.pixels[:])
-        return buffer[0::4], buffer[1::4], buffer[2::4], buffer[3::4],
-
-    def load_texture_or_default(self, file: str, default_color: tuple = (1.0, 1.0, 1.0, 1.0)):
-        texture = self.load_texture(Path(file).stem, Path(file).parent)
+    def load_texture_or_default(self, file: str, default_color: tuple = (1.0, 1.0, 1.0, 1.0),
+                                pipeline: PixelPipeline = ()):
+        """Load a texture, pipeline conversions (normal map green flip, channel extraction...) are done at decode."""
+        texture = self.load_texture(Path(file).stem, Path(file).parent, pipeline=pipeline)
         return texture or self.get_missing_texture(f'missing_{Path(file).stem}', default_color)
 
     @staticmethod
@@ -220,7 +202,7 @@ class ShaderBase:
 
     def create_node_group(self, group_name, location=None, *, name=None):
         group_node = self.create_node(Nodes.ShaderNodeGroup, name or group_name)
-        group_node.node_tree = bpy.data.node_groups.get(group_name)
+        group_node.node_tree = NodeGroupLibrary().get(group_name, self.NODE_GROUP_ASSETS)
         group_node.width = group_node.bl_width_max
         if location is not None:
             group_node.location = location
@@ -245,6 +227,14 @@ class ShaderBase:
             self.connect_nodes(UV.outputs[0], texture_node.inputs[0])
         return texture_node
 
+    def build_from_template(self, key: Hashable, build: Callable[[], None]):
+        """Build the static part of the graph once per key, later materials get a copy of the recorded nodes.
+
+        build must only create nodes and links that are the same for every material using key,
+        the created nodes are looked up by name afterwards.
+        """
+        NodeTemplates().build(key, self.bpy_material.node_tree, build)
+
     def get_node(self, name):
         return self.bpy_material.node_tree.nodes.get(name, None)
 
@@ -266,9 +256,12 @@ class ShaderBase:
 
         if self.bpy_material is None:
             self.logger.error('Failed to get or create material')
+            self.do_arrange = False
             return 'UNKNOWN'
 
         if self.bpy_material.get('source_loaded'):
+            # Already built and arranged by an earlier import
+            self.do_arrange = False
             return 'LOADED'
 
         self.bpy_material.use_nodes = True
@@ -282,7 +275,7 @@ class ShaderBase:
     def align_nodes(self):
         if not self.do_arrange:
             return
-        nodes_iterate(self.bpy_material.node_tree)
+        LayoutTemplates().arrange(self.bpy_material.node_tree)
         self.bpy_material.node_tree.nodes.update()
 
     def handle_transform(self, transform: Tuple, socket: bpy.types.NodeSocket, loc=None, *, uv_node=None,
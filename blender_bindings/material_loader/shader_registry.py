@@ -0,0 +1,99 @@
+from importlib import import_module
+from typing import Dict, Generic, Mapping, Optional, Tuple, Type, TypeVar
+
+from ...logger import SLoggingManager
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('MaterialLoader')
+
+# Shader name -> (module in the shaders package, handler class)
+SOURCE1_SHADERS: Mapping[str, Tuple[str, str]] = {
+    'cable': ('source1_shaders.cable', 'Cable'),
+    'splinerope': ('source1_shaders.cable', 'SplineRope'),
+    'decalmodulate': ('source1_shaders.decalmodulate', 'DecalModulate'),
+    'eyerefract': ('source1_shaders.eyerefract', 'EyeRefract'),
+    'heroes_armor': ('source1_shaders.heroes_armor', 'HeroesArmor'),
+    'heroes_faceskin': ('source1_shaders.heroes_faceskin', 'HeroesFaceskin'),
+    'lightmappedgeneric': ('source1_shaders.lightmap_generic', 'LightmapGeneric'),
+    'lightmappedreflective': ('source1_shaders.lightmap_generic', 'ReflectiveLightmapGeneric'),
+    'sdk_lightmappedgeneric': ('source1_shaders.lightmap_generic', 'SDKLightmapGeneric'),
+    'lightmapped_4wayblend': ('source1_shaders.lightmapped_4wayblend', 'Lightmapped4WayBlend'),
+    'refract': ('source1_shaders.refract', 'Refract'),
+    'unlitgeneric': ('source1_shaders.unlit_generic', 'UnlitGeneric'),
+    'sdk_unlitgeneric': ('source1_shaders.unlit_generic', 'SDKUnlitGeneric'),
+    'unlittwotexture': ('source1_shaders.unlittwotexture', 'UnlitGeneric'),
+    'vertexlitgeneric': ('source1_shaders.vertexlit_generic', 'VertexLitGeneric'),
+    'sdk_vertexlitgeneric': ('source1_shaders.vertexlit_generic', 'SDKVertexLitGeneric'),
+    'water': ('source1_shaders.water', 'Water'),
+    'worldvertextransition': ('source1_shaders.worldvertextransition', 'WorldVertexTransition'),
+}
+
+GOLDSRC_SHADERS: Mapping[str, Tuple[str, str]] = {
+    'goldsrc_shader': ('goldsrc_shaders.goldsrc_shader', 'GoldSrcShader'),
+    'goldsrc_shader_mode1': ('goldsrc_shaders.goldsrc_shader_mode1', 'GoldSrcShaderMode1'),
+    'goldsrc_shader_mode2': ('goldsrc_shaders.goldsrc_shader_mode2', 'GoldSrcShaderMode2'),
+    'goldsrc_shader_mode5': ('goldsrc_shaders.goldsrc_shader_mode5', 'GoldSrcShaderMode5'),
+}
+
+# Unsupported: csgo_weapon.vfx, csgo_unlitgeneric.vfx
+SOURCE2_SHADERS: Mapping[str, Tuple[str, str]] = {
+    'blend.vfx': ('source2_shaders.blend', 'Blend'),
+    'complex.vfx': ('source2_shaders.complex', 'Complex'),
+    'csgo_black_unlit.vfx': ('source2_shaders.csgo_black_unlit', 'CSGOBlackUnlit'),
+    'csgo_complex.vfx': ('source2_shaders.csgo_complex', 'CSGOComplex'),
+    'csgo_effects.vfx': ('source2_shaders.csgo_effects', 'CSGOEffects'),
+    'csgo_environment_blend.vfx': ('source2_shaders.csgo_environment_blend', 'CSGOEnvironmentBlend'),
+    'csgo_foliage.vfx': ('source2_shaders.csgo_foliage', 'CSGOFoliage'),
+    'csgo_glass.vfx': ('source2_shaders.csgo_glass', 'CSGOGlass'),
+    'csgo_lightmappedgeneric.vfx': ('source2_shaders.csgo_lightmappedgeneric', 'CSGOLightmappedGeneric'),
+    'csgo_static_overlay.vfx': ('source2_shaders.csgo_static_overlay', 'CSGOStaticOverlay'),
+    'csgo_vertexlitgeneric.vfx': ('source2_shaders.csgo_vertexlitgeneric', 'CSGOVertexLitGeneric'),
+    'DUMMY': ('source2_shaders.dummy', 'DummyShader'),
+    'eyeball.vfx': ('source2_shaders.eyeball', 'Eyeball'),
+    'generic.vfx': ('source2_shaders.generic', 'Generic'),
+    'hero.vfx': ('source2_shaders.hero', 'VrComplex'),
+    'simple.vfx': ('source2_shaders.simple', 'Simple'),
+    'sky.vfx': ('source2_shaders.sky', 'Skybox'),
+    'static_overlay.vfx': ('source2_shaders.static_overlay', 'StaticOverlay'),
+    'vr_bloody_simple.vfx': ('source2_shaders.vr_bloody_simple', 'VRBloodySimple'),
+    'vr_complex.vfx': ('source2_shaders.vr_complex', 'VrComplex'),
+    'vr_eyeball.vfx': ('source2_shaders.vr_eyeball', 'VrEyeball'),
+    'vr_standard.vfx': ('source2_shaders.vr_generic', 'VRGeneric'),
+    'vr_glass.vfx': ('source2_shaders.vr_glass', 'VrSimple'),
+    'vr_simple.vfx': ('source2_shaders.vr_simple', 'VrSimple'),
+    'vr_simple_2way_blend.vfx': ('source2_shaders.vr_simple_2way_blend', 'VRSimple2WayBlend'),
+    'steampal_2way_blend_mask.vfx': ('source2_shaders.vr_simple_2way_blend', 'SteamPalSimple2WayBlend'),
+    'vr_skin.vfx': ('source2_shaders.vr_skin', 'VrSkin'),
+    'vr_xen_foliage.vfx': ('debug_material', 'DebugMaterial'),
+}
+
+T = TypeVar('T')
+
+
+class ShaderRegistry(Generic[T]):
+    """Shader handlers by shader name, a handler module is imported when its shader is first requested."""
+    PACKAGE = __package__ + '.shaders'
+
+    def __init__(self, manifest: Mapping[str, Tuple[str, str]]):
+        self._manifest = manifest
+        self._handlers: Dict[str, Type[T]] = {}
+
+    def __contains__(self, shader_name: str) -> bool:
+        return shader_name in self._manifest
+
+    def get(self, shader_name: str, default: Optional[Type[T]] = None) -> Optional[Type[T]]:
+        handler = self._handlers.get(shader_name, None)
+        if handler is not None:
+            return handler
+        if shader_name not in self._manifest:
+            return default
+        module_name, class_name = self._manifest[shader_name]
+        handler = self._handlers[shader_name] = getattr(import_module(f'.{module_name}', self.PACKAGE), class_name)
+        logger.debug(f'Loaded material handler {class_name} for {shader_name} shader')
+        return handler
+
+    def __getitem__(self, shader_name: str) -> Type[T]:
+        handler = self.get(shader_name)
+        if handler is None:
+            raise KeyError(shader_name)
+        return handler
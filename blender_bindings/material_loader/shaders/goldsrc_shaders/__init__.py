@@ -1 +0,0 @@
-from . import goldsrc_shader
\ No newline at end of file
@@ -1,4 +0,0 @@
-from . import (cable, decalmodulate, eyerefract, heroes_armor, heroes_faceskin,
-               lightmap_generic, lightmapped_4wayblend, refract, unlit_generic,
-               unlittwotexture, vertexlit_generic, water,
-               worldvertextransition)
@@ -20,9 +20,8 @@ class LightmapGeneric(Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vmt.get_string('$bumpmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.6, 0.0, 0.6, 1.0))
-            if self.ssbump:
-                image = self.convert_ssbump(image)
+            pipeline = self.SSBUMP_PIPELINE if self.ssbump else ()
+            image = self.load_texture_or_default(texture_path, (0.6, 0.0, 0.6, 1.0), pipeline)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             return image
@@ -48,6 +47,21 @@ class LightmapGeneric(Source1ShaderBase):
     def translucent(self):
         return self._vmt.get_int('$translucent', 0) == 1
 
+    def _create_base_nodes(self, use_basetexture: bool, use_alpha: bool, use_bumpmap: bool):
+        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
+        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled, self.SHADER)
+        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
+        if use_basetexture:
+            basetexture_node = self.create_and_connect_texture_node(None, shader.inputs['Base Color'],
+                                                                    name='$basetexture')
+            if use_alpha:
+                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Alpha'])
+        if use_bumpmap:
+            bumpmap_node = self.create_node(Nodes.ShaderNodeTexImage, '$bumpmap')
+            normalmap_node = self.create_node(Nodes.ShaderNodeNormalMap)
+            self.connect_nodes(bumpmap_node.outputs['Color'], normalmap_node.inputs['Color'])
+            self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
@@ -55,37 +69,30 @@ class LightmapGeneric(Source1ShaderBase):
         if self.isskybox:
             self.bpy_material.shadow_method = 'NONE'
             self.bpy_material.use_backface_culling = True
-        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled, self.SHADER)
-        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
 
         basetexture = self.basetexture
+        bumpmap = self.bumpmap
+        use_basetexture = bool(basetexture)
+        use_alpha = use_basetexture and (self.alphatest or self.translucent)
+        use_bumpmap = bool(bumpmap) and not self.ssbump
+        self.build_from_template((self.SHADER, use_basetexture, use_alpha, use_bumpmap),
+                                 lambda: self._create_base_nodes(use_basetexture, use_alpha, use_bumpmap))
+        shader = self.get_node(self.SHADER)
 
         if basetexture:
-            basetexture_node = self.create_and_connect_texture_node(basetexture,
-                                                                    shader.inputs['Base Color'],
-                                                                    name='$basetexture')
-
+            basetexture_node = self.get_node('$basetexture')
+            basetexture_node.image = basetexture
             if self.alphatest:
                 self.bpy_material.blend_method = 'HASHED'
                 self.bpy_material.shadow_method = 'HASHED'
-                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Alpha'])
             if self.translucent:
                 self.bpy_material.blend_method = 'BLEND'
                 self.bpy_material.shadow_method = 'HASHED'
                 self.bpy_material.use_backface_culling = True
                 self.bpy_material.show_transparent_back = False
-                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Alpha'])
-
-        bumpmap = self.bumpmap
-        if bumpmap and not self.ssbump:
-            bumpmap_node = self.create_node(Nodes.ShaderNodeTexImage, '$bumpmap')
-            bumpmap_node.image = bumpmap
-
-            normalmap_node = self.create_node(Nodes.ShaderNodeNormalMap)
 
-            self.connect_nodes(bumpmap_node.outputs['Color'], normalmap_node.inputs['Color'])
-            self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
+        if use_bumpmap:
+            self.get_node('$bumpmap').image = bumpmap
 
         if not self.phong:
             shader.inputs['Specular'].default_value = 0
@@ -13,8 +13,7 @@ class Refract(Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vmt.get_string('$normalmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
-            image = self.convert_normalmap(image)
+            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0), self.NORMALMAP_PIPELINE)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             return image
@@ -12,8 +12,7 @@ class VertexLitGeneric(DetailSupportMixin, Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vmt.get_string('$bumpmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
-            image = self.convert_normalmap(image)
+            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0), self.NORMALMAP_PIPELINE)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             return image
@@ -191,6 +190,18 @@ class VertexLitGeneric(DetailSupportMixin, Source1ShaderBase):
             color_value = [color_value[0], color_value[0], color_value[0]]
         return self.ensure_length(color_value, 4, 1.0)
 
+    def _create_bvlg_base_nodes(self, use_alphatest: bool):
+        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
+        material_output.location = [250, 0]
+        parentnode = material_output
+        if use_alphatest:
+            alphatest_node = self.create_node_group("$alphatest", [250, 0])
+            parentnode = alphatest_node
+            material_output.location = [450, 0]
+            self.connect_nodes(alphatest_node.outputs['BSDF'], material_output.inputs['Surface'])
+        group_node = self.create_node_group("VertexLitGeneric", [-200, 0])
+        self.connect_nodes(group_node.outputs['BSDF'], parentnode.inputs[0])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
@@ -208,10 +219,6 @@ class VertexLitGeneric(DetailSupportMixin, Source1ShaderBase):
                     else:
                         self._vmt[result_var] = self._vmt[src2_var]
 
-        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        material_output.location = [250, 0]
-        parentnode = material_output
-
         if self.alphatest or self.translucent:
             if self.translucent:
                 self.bpy_material.blend_method = 'BLEND'
@@ -221,16 +228,14 @@ class VertexLitGeneric(DetailSupportMixin, Source1ShaderBase):
         uv = None
         if self.use_bvlg_status:
             self.do_arrange = False
-            if self.alphatest or self.translucent:
-                alphatest_node = self.create_node_group("$alphatest", [250, 0])
-                parentnode = alphatest_node
-                material_output.location = [450, 0]
+            use_alphatest = self.alphatest or self.translucent
+            self.build_from_template(('VertexLitGeneric', use_alphatest),
+                                     lambda: self._create_bvlg_base_nodes(use_alphatest))
+            group_node = self.get_node('VertexLitGeneric')
+            if use_alphatest:
+                alphatest_node = self.get_node('$alphatest')
                 alphatest_node.inputs['$alphatestreference [value]'].default_value = self.alphatestreference
                 alphatest_node.inputs['$allowalphatocoverage [boolean]'].default_value = self.allowalphatocoverage
-                self.connect_nodes(alphatest_node.outputs['BSDF'], material_output.inputs['Surface'])
-
-            group_node = self.create_node_group("VertexLitGeneric", [-200, 0])
-            self.connect_nodes(group_node.outputs['BSDF'], parentnode.inputs[0])
             if self.basetexture:
                 basetexture_node = self.create_and_connect_texture_node(self.basetexture,
                                                                         group_node.inputs['$basetexture [texture]'],
@@ -329,6 +334,8 @@ class VertexLitGeneric(DetailSupportMixin, Source1ShaderBase):
                     self.connect_nodes(basetexture_node.outputs['Alpha'],
                                        group_node.inputs['$selfillummask [texture alpha]'])
         else:
+            material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
+            material_output.location = [250, 0]
             shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled, self.SHADER)
             self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
 
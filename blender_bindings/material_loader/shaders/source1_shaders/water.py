@@ -14,8 +14,7 @@ class Water(Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vmt.get_string('$normalmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
-            image = self.convert_normalmap(image)
+            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0), self.NORMALMAP_PIPELINE)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             return image
@@ -105,9 +104,7 @@ class Water(Source1ShaderBase):
         # if self.abovewater:
         #    self.create_probe()
         if self.use_bvlg_status:
-            group_node = self.create_node(Nodes.ShaderNodeGroup, self.SHADER)
-            group_node.node_tree = bpy.data.node_groups.get("Water")
-            group_node.width = group_node.bl_width_max
+            group_node = self.create_node_group("Water", name=self.SHADER)
             self.connect_nodes(group_node.outputs['BSDF'], material_output.inputs['Surface'])
             bumpmap = self.bumpmap
             if bumpmap:
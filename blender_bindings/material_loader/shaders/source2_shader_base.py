@@ -1,23 +1,30 @@
 from pathlib import Path
 from typing import Union, Optional, Tuple
 import bpy
-import numpy as np
 
 from ...utils.texture_utils import check_texture_cache
 from ....library.shared.content_providers.content_manager import ContentManager
+from ....library.shared.pixel_pipeline import (ExtractChannel, FillChannel,
+                                               PixelPipeline, converted_path)
 from ....library.source2.resource_types import (CompiledMaterialResource,
                                                 CompiledTextureResource)
 from ....logger import SLoggingManager
-from ...source2.vtex_loader import import_texture
+from ...source2.vtex_loader import import_texture, import_texture_outputs
+from ..node_group_library import SOURCE2_NODE_GROUPS
 from ..shader_base import ShaderBase, Nodes
 
 logger = SLoggingManager().get_logger("Source2::Shader")
 
 
 class Source2ShaderBase(ShaderBase):
+    NODE_GROUP_ASSETS = (SOURCE2_NODE_GROUPS,)
+    NORMAL_PIPELINE: PixelPipeline = (FillChannel(3, 1.0),)
+    NORMAL_ROUGHNESS_PIPELINE: PixelPipeline = (ExtractChannel(3),)
+    # Roughness stored inverted in the blue channel of self illumination masks
+    MASK_ROUGHNESS_PIPELINE: PixelPipeline = (ExtractChannel(2, invert=True),)
+
     def __init__(self, source2_material: CompiledMaterialResource, tinted: bool = False):
         super().__init__()
-        self.load_source2_nodes()
         self._material_resource = source2_material
         self.tinted = tinted
 
@@ -43,8 +50,14 @@ class Source2ShaderBase(ShaderBase):
         return texture_node
 
     def load_texture_or_default(self, name_or_id: Union[str, int], default_color: tuple = (1.0, 1.0, 1.0, 1.0),
-                                invert_y: bool = False):
+                                invert_y: bool = False, pipeline: PixelPipeline = ()):
         print(f'Loading texture {name_or_id}')
+        resource, texture_path = self._get_texture_resource(name_or_id)
+        return self.load_texture(resource, texture_path, invert_y, pipeline) or self.get_missing_texture(
+            f'missing_{texture_path}',
+            default_color)
+
+    def _get_texture_resource(self, name_or_id: Union[str, int]) -> Tuple[Optional[CompiledTextureResource], Path]:
         resource = self._material_resource.get_child_resource(name_or_id, ContentManager(), CompiledTextureResource)
         texture_name: str
         if isinstance(name_or_id, int):
@@ -53,36 +66,36 @@ class Source2ShaderBase(ShaderBase):
             texture_name = name_or_id
         else:
             raise Exception(f"Invalid name or id: {name_or_id}")
+        return resource, Path(texture_name)
 
-        return self.load_texture(resource, Path(texture_name), invert_y) or self.get_missing_texture(
-            f'missing_{texture_name}',
-            default_color)
-
-    def split_normal(self, image: bpy.types.Image):
-        roughness_name = self.new_texture_name_with_suffix(image.name, 'roughness', 'tga')
-        if image.get('normalmap_converted', None):
-            return image, bpy.data.images.get(roughness_name, None)
-
-        buffer = np.zeros(image.size[0] * image.size[1] * 4, np.float32)
-        image.pixels.foreach_get(buffer)
+    def load_split_normal(self, name_or_id: Union[str, int], default_color: tuple = (0.5, 0.5, 1.0, 1.0)):
+        """Normal map with opaque alpha and the roughness packed into its alpha as its own texture.
 
-        mask = buffer[3::4]
-        roughness_rgb = np.dstack((mask, mask, mask, np.ones_like(mask)))
-
-        roughness_texture = self.make_texture(roughness_name, image.size, roughness_rgb, True)
-        buffer[3::4] = 1.0
-
-        image.pixels.foreach_set(buffer.ravel())
-
-        image.pack()
-        image['normalmap_converted'] = True
-        return image, roughness_texture
+        Both images come from a single decode of the texture.
+        """
+        resource, texture_path = self._get_texture_resource(name_or_id)
+        outputs = {converted_path(texture_path, pipeline): pipeline
+                   for pipeline in (self.NORMAL_PIPELINE, self.NORMAL_ROUGHNESS_PIPELINE)}
+        images = {path: check_texture_cache(path) for path in outputs}
+        missing = {path: pipeline for path, pipeline in outputs.items() if images[path] is None}
+        if missing and resource is not None:
+            images.update(import_texture_outputs(resource, texture_path, missing, True, self))
+        normal, roughness = images.values()
+        if normal is None:
+            normal = self.get_missing_texture(f'missing_{texture_path}', default_color)
+        for image in (normal, roughness):
+            if image is not None:
+                image.colorspace_settings.is_data = True
+                image.colorspace_settings.name = 'Non-Color'
+        return normal, roughness
 
-    def load_texture(self, texture_resource: Optional[CompiledTextureResource], texture_path, invert_y: bool = False):
+    def load_texture(self, texture_resource: Optional[CompiledTextureResource], texture_path, invert_y: bool = False,
+                     pipeline: PixelPipeline = ()):
         if texture_resource is not None:
-            texture = check_texture_cache(texture_path)
+            image_path = converted_path(texture_path, pipeline)
+            texture = check_texture_cache(image_path)
             if texture is not None:
                 return texture
-            texture = import_texture(texture_resource, texture_path, True, invert_y)
+            texture = import_texture(texture_resource, image_path, True, invert_y, pipeline, self, texture_path)
             return texture
         return None
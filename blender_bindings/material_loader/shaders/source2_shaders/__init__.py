@@ -1,9 +0,0 @@
-from . import (blend, complex, dummy, eyeball, generic, hero, simple, sky,
-               static_overlay, vr_bloody_simple, vr_complex, vr_eyeball,
-               vr_generic, vr_glass, vr_simple, vr_simple_2way_blend, vr_skin,
-               csgo_complex, csgo_glass, csgo_static_overlay, csgo_black_unlit,
-               csgo_lightmappedgeneric, csgo_effects, csgo_foliage, csgo_vertexlitgeneric,
-               csgo_environment_blend
-               )
-
-#Unsupported csgo_weapon, csgo_unlitgeneric
@@ -119,11 +119,9 @@ class VrComplex(Source2ShaderBase):
         self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
 
         if self.specular and self.self_illum_mask_texture:
-            r, g, b, a = self.split_to_channels(self.self_illum_mask_texture)
-            b = 1 - b
-            roughness_texture = self.make_texture(
-                self.new_texture_name_with_suffix(self.self_illum_mask_texture.name, 'roughness', 'tga'),
-                self_illum_mask_texture.size, np.dstack((b, b, b, np.ones_like(b))))
+            roughness_texture = self.load_texture_or_default(
+                self._material_resource.get_texture_property('g_tSelfIllumMask', None), (1.0, 1.0, 1.0, 1.0),
+                pipeline=self.MASK_ROUGHNESS_PIPELINE)
             roughness_node = self.create_node(Nodes.ShaderNodeTexImage, 'roughness')
             roughness_node.image = roughness_texture
             self.connect_nodes(roughness_node.outputs['Color'], shader.inputs['Roughness'])
@@ -56,10 +56,7 @@ class VrEyeball(Source2ShaderBase):
     def normal_texture(self):
         texture_path = self._material_resource.get_texture_property('g_tNormal', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
-            image.colorspace_settings.is_data = True
-            image.colorspace_settings.name = 'Non-Color'
-            image, roughness = self.split_normal(image)
+            image, roughness = self.load_split_normal(texture_path, (0.5, 0.5, 1.0, 1.0))
             return image, roughness
         return None
 
@@ -31,6 +31,9 @@ class GoldSrcBspSettings(BSPSettings):
 
 class Source1BSPSettings(GoldSrcBspSettings, Source1SharedSettings):
     import_cubemaps: BoolProperty(name="Import cubemaps", default=False, subtype='UNSIGNED')
+    import_lightmaps: BoolProperty(name="Import lightmap atlas", default=False, subtype='UNSIGNED')
+    visible_from_cursor: BoolProperty(name="Only import what is visible from 3D cursor", default=False,
+                                      subtype='UNSIGNED')
 
 
 class MDLSettings(SharedSettings, Source1SharedSettings):
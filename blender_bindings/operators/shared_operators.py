@@ -13,8 +13,9 @@ import bpy
 from ..source1.mdl.v44.import_mdl import import_static_animations
 from ..utils.resource_utils import deserialize_mounted_content, serialize_mounted_content
 from ...library.shared.content_providers.content_manager import ContentManager
+from ...library.shared.texture_service import TextureService
 from ...library.source2 import CompiledModelResource
-from ...library.utils.path_utilities import find_vtx_cm
+from ...library.source1.mdl.model_bundle import ModelBundle
 from ..source1.mdl import FileImport
 from ..source1.mdl import put_into_collections as s1_put_into_collections
 from ..source1.mdl.model_loader import import_model_from_files
@@ -62,6 +63,7 @@ class SourceIO_OT_LoadEntity(Operator):
 
     use_bvlg: BoolProperty(default=True)
 
+    @TextureService.scoped
     def execute(self, context):
         content_manager = ContentManager()
         deserialize_mounted_content(content_manager)
@@ -195,17 +197,15 @@ class SourceIO_OT_LoadEntity(Operator):
                             obj["entity_data"]["imported"] = True
                             continue
 
-                    mdl_file = content_manager.find_file(prop_path)
-                    vvd_file = content_manager.find_file(prop_path.with_suffix('.vvd'))
-                    vvc_file = content_manager.find_file(prop_path.with_suffix('.vvc'))
-                    phy_file = content_manager.find_file(prop_path.with_suffix('.phy'))
-                    vtx_file = find_vtx_cm(prop_path, content_manager)
-                    if mdl_file is None or vvd_file is None or vtx_file is None:
+                    bundle = ModelBundle.from_content_manager(prop_path, content_manager)
+                    if bundle is None or not bundle.is_complete():
                         self.report({"WARNING"}, f"Failed to find mdl/vvd/vtx file for {obj.name}({prop_path}) prop")
                         continue
-                    file_list = FileImport(mdl_file, vvd_file, vtx_file,
-                                           vvc_file if vvc_file else None,
-                                           phy_file if phy_file else None)
+                    if not bundle.validate():
+                        self.report({"WARNING"}, f"Mdl file for {obj.name}({prop_path}) prop is missing or empty")
+                        continue
+                    file_list = FileImport(bundle.mdl_file, bundle.vvd_file, bundle.vtx_file,
+                                           bundle.vvc_file, bundle.phy_file)
                     if not file_list.is_valid():
                         self.report({"WARNING"},
                                     f"Mdl file for {obj.name}({prop_path}) prop is invalid. Too small file or missing file")
@@ -334,6 +334,7 @@ class SOURCEIO_OT_ChangeSkin(Operator):
 
     skin_name: bpy.props.StringProperty(name="skin_name", default="default")
 
+    @TextureService.scoped
     def execute(self, context):
         obj = context.active_object
         if obj.get('model_type', False):
@@ -9,6 +9,7 @@ from ..source1.mdl import put_into_collections
 from ..source1.mdl.v49.import_mdl import import_animations
 from ..utils.resource_utils import serialize_mounted_content, deserialize_mounted_content
 from ...library.shared.content_providers.content_manager import ContentManager
+from ...library.shared.texture_service import TextureService
 from ..source1.vtf import import_texture, load_skybox_texture
 # from ..source1.vtf.export_vtf import export_texture
 
@@ -34,6 +35,7 @@ class SOURCEIO_OT_MDLImport(bpy.types.Operator, MDLSettings):
     files: CollectionProperty(name='File paths', type=bpy.types.OperatorFileListElement)
     filter_glob: StringProperty(default="*.mdl", options={'HIDDEN'})
 
+    @TextureService.scoped
     def execute(self, context):
         from ..source1.mdl.v49.import_mdl import import_materials
 
@@ -118,6 +120,7 @@ class SOURCEIO_OT_BSPImport(bpy.types.Operator, Source1BSPSettings):
     discover_resources: BoolProperty(name="Mount discovered content", default=True)
     filter_glob: StringProperty(default="*.bsp", options={'HIDDEN'})
 
+    @TextureService.scoped
     def execute(self, context):
         content_manager = ContentManager()
         if self.discover_resources:
@@ -130,15 +133,16 @@ class SOURCEIO_OT_BSPImport(bpy.types.Operator, Source1BSPSettings):
         if self.discover_resources:
             serialize_mounted_content(content_manager)
 
-        bsp_map.load_disp()
-        bsp_map.load_entities()
-        bsp_map.load_static_props()
-        if self.import_cubemaps:
-            bsp_map.load_cubemap()
-        # if self.import_decal:
-        #     bsp_map.load_overlays()
-        if self.import_textures:
-            bsp_map.load_materials(self.use_bvlg)
+        with bsp_map.map_file:
+            bsp_map.load_disp()
+            bsp_map.load_entities()
+            bsp_map.load_static_props()
+            if self.import_cubemaps:
+                bsp_map.load_cubemap()
+            # if self.import_decal:
+            #     bsp_map.load_overlays()
+            if self.import_textures:
+                bsp_map.load_materials(self.use_bvlg)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -259,6 +263,7 @@ class SOURCEIO_OT_VMTImport(bpy.types.Operator):
     override: BoolProperty(default=False, name='Override existing?')
     use_bvlg: BoolProperty(name="Use BlenderVertexLitGeneric shader", default=True, subtype='UNSIGNED')
 
+    @TextureService.scoped
     def execute(self, context):
         content_manager = ContentManager()
         if self.discover_resources:
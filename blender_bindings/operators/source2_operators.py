@@ -6,6 +6,7 @@ from bpy.props import (BoolProperty, CollectionProperty, FloatProperty,
 
 from ..utils.resource_utils import serialize_mounted_content, deserialize_mounted_content
 from ...library.shared.content_providers.content_manager import ContentManager
+from ...library.shared.texture_service import TextureService
 from ...library.shared.content_providers.vpk_provider import VPKContentProvider
 from ...library.source2 import (CompiledMaterialResource,
                                 CompiledModelResource, CompiledTextureResource)
@@ -39,6 +40,7 @@ class SOURCEIO_OT_VMDLImport(bpy.types.Operator):
 
     filter_glob: StringProperty(default="*.vmdl_c", options={'HIDDEN'})
 
+    @TextureService.scoped
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -84,6 +86,7 @@ class SOURCEIO_OT_VMAPImport(bpy.types.Operator):
     # invert_uv: BoolProperty(name="invert UV?", default=True)
     scale: FloatProperty(name="World scale", default=SOURCE2_HAMMER_UNIT_TO_METERS, precision=6)
 
+    @TextureService.scoped
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -126,6 +129,7 @@ class SOURCEIO_OT_VPK_VMAPImport(bpy.types.Operator):
     # invert_uv: BoolProperty(name="invert UV?", default=True)
     scale: FloatProperty(name="World scale", default=SOURCE2_HAMMER_UNIT_TO_METERS, precision=6)
 
+    @TextureService.scoped
     def execute(self, context):
         vpk_path = Path(self.filepath)
         assert vpk_path.is_file(), 'Not a file'
@@ -170,6 +174,7 @@ class SOURCEIO_OT_VMATImport(bpy.types.Operator):
     split_alpha: BoolProperty(name="Extract alpha texture", default=True)
     filter_glob: StringProperty(default="*.vmat_c", options={'HIDDEN'})
 
+    @TextureService.scoped
     def execute(self, context):
 
         if Path(self.filepath).is_file():
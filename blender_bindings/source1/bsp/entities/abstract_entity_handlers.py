@@ -2,7 +2,7 @@ import math
 import re
 from pathlib import Path
 from pprint import pformat
-from typing import List
+from typing import List, Optional
 
 import bpy
 import numpy as np
@@ -16,7 +16,9 @@ from .....library.source1.bsp.datatypes.face import Face
 from .....library.source1.bsp.datatypes.model import Model
 from .....library.source1.bsp.datatypes.texture_data import TextureData
 from .....library.source1.bsp.datatypes.texture_info import TextureInfo
-from .....library.source1.vmt import VMT
+from .....library.source1.bsp.lightmap_atlas import (LightmapAtlas,
+                                                     build_lightmap_atlas)
+from .....library.source1.vmt.vmt_cache import VMTCache
 from .....library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from .....logger import SLoggingManager
 from ....utils.utils import add_material, get_or_create_collection
@@ -27,16 +29,20 @@ strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
 log_manager = SLoggingManager()
 
 
-def gather_vertex_ids(model: Model, faces: List[Face], surf_edges: np.ndarray, edges: np.ndarray):
+def gather_vertex_ids(model: Model, faces: List[Face], surf_edges: np.ndarray, edges: np.ndarray,
+                      face_mask: Optional[np.ndarray] = None):
     vertex_offset = 0
     material_ids = []
     vertex_count = 0
     for map_face in faces[model.first_face:model.first_face + model.face_count]:
         vertex_count += map_face.edge_count
     vertex_ids = np.zeros(vertex_count, dtype=np.uint16)
-    for map_face in faces[model.first_face:model.first_face + model.face_count]:
+    for face_id, map_face in enumerate(faces[model.first_face:model.first_face + model.face_count],
+                                       model.first_face):
         if map_face.disp_info_id != -1:
             continue
+        if face_mask is not None and not face_mask[face_id]:
+            continue
         first_edge = map_face.first_edge
         edge_count = map_face.edge_count
         material_ids.append(map_face.tex_info_id)
@@ -49,7 +55,7 @@ def gather_vertex_ids(model: Model, faces: List[Face], surf_edges: np.ndarray, e
         vertex_ids[vertex_offset:vertex_offset + edge_count] = face_vertex_ids
         vertex_offset += edge_count
 
-    return vertex_ids, material_ids
+    return vertex_ids[:vertex_offset], material_ids
 
 
 def _srgb2lin(s: float) -> float:
@@ -74,10 +80,18 @@ class AbstractEntityHandler:
         self._entites = self._bsp.get_lump('LUMP_ENTITIES').entities
         self._handled_paths = []
         self._entity_by_name_cache = {}
+        self._lightmap_atlas = None
+        # Lightmap UVs point into a packed atlas of the map lighting when set
+        self.use_lightmap_atlas = False
+        # Set for partial imports, faces and entities outside of it are skipped
+        self.face_mask: Optional[np.ndarray] = None
+        self.entity_mask: Optional[np.ndarray] = None
 
     def load_entities(self, settings: BSPSettings):
         entity_lump = self._bsp.get_lump('LUMP_ENTITIES')
-        for entity_data in entity_lump.entities:
+        for entity_id, entity_data in enumerate(entity_lump.entities):
+            if self.entity_mask is not None and not self.entity_mask[entity_id]:
+                continue
             entity_class: str = entity_data['classname']
             if entity_class.startswith("info_") and not settings.load_info:
                 continue
@@ -130,6 +144,18 @@ class AbstractEntityHandler:
         strings: List[str] = self._bsp.get_lump('LUMP_TEXDATA_STRING_TABLE').strings
         return strings[string_id] or "NO_NAME"
 
+    @property
+    def lightmap_atlas(self) -> Optional[LightmapAtlas]:
+        if self._lightmap_atlas is None:
+            self._lightmap_atlas = build_lightmap_atlas(self._bsp) or False
+            if self._lightmap_atlas:
+                atlas = self._lightmap_atlas
+                image = bpy.data.images.new(f'{self._bsp.filepath.stem}_lightmap', atlas.width, atlas.height,
+                                            alpha=False, float_buffer=True)
+                image.pixels.foreach_set(atlas.to_rgba().ravel())
+                image.pack()
+        return self._lightmap_atlas or None
+
     def _load_brush_model(self, model_id, model_name):
         model = self._bsp.get_lump("LUMP_MODELS").models[model_id]
         mesh_obj = bpy.data.objects.new(model_name, bpy.data.meshes.new(f"{model_name}_MESH"))
@@ -144,7 +170,7 @@ class AbstractEntityHandler:
         bsp_textures_info: List[TextureInfo] = self._bsp.get_lump('LUMP_TEXINFO').texture_info
         bsp_textures_data: List[TextureData] = self._bsp.get_lump('LUMP_TEXDATA').texture_data
 
-        vertex_ids, material_ids = gather_vertex_ids(model, bsp_faces, bsp_surf_edges, bsp_edges)
+        vertex_ids, material_ids = gather_vertex_ids(model, bsp_faces, bsp_surf_edges, bsp_edges, self.face_mask)
         unique_vertex_ids = np.unique(vertex_ids)
 
         tmp2 = np.searchsorted(unique_vertex_ids, vertex_ids)
@@ -160,10 +186,14 @@ class AbstractEntityHandler:
 
         uvs_per_face = []
         luvs_per_face = []
+        lightmap_atlas = self.lightmap_atlas if self.use_lightmap_atlas else None
 
-        for map_face in bsp_faces[model.first_face:model.first_face + model.face_count]:
+        for face_id, map_face in enumerate(bsp_faces[model.first_face:model.first_face + model.face_count],
+                                           model.first_face):
             if map_face.disp_info_id != -1:
                 continue
+            if self.face_mask is not None and not self.face_mask[face_id]:
+                continue
             uvs = {}
             luvs = {}
             face = []
@@ -186,11 +216,13 @@ class AbstractEntityHandler:
             u = (np.dot(uv_vertices, tv1[:3]) + tv1[3]) / (texture_data.width or 512)
             v = 1 - ((np.dot(uv_vertices, tv2[:3]) + tv2[3]) / (texture_data.height or 512))
 
-            lu = (np.dot(uv_vertices, lv1[:3]) + lv1[3]) / (texture_data.width or 512)
-            lv = 1 - ((np.dot(uv_vertices, lv2[:3]) + lv2[3]) / (texture_data.height or 512))
-
             v_uvs = np.dstack([u, v]).reshape((-1, 2))
-            l_uvs = np.dstack([lu, lv]).reshape((-1, 2))
+            if lightmap_atlas is not None:
+                l_uvs = lightmap_atlas.face_uvs(np.full(len(uv_vertices), face_id), uv_vertices)
+            else:
+                lu = (np.dot(uv_vertices, lv1[:3]) + lv1[3]) / (texture_data.width or 512)
+                lv = 1 - ((np.dot(uv_vertices, lv2[:3]) + lv2[3]) / (texture_data.height or 512))
+                l_uvs = np.dstack([lu, lv]).reshape((-1, 2))
 
             for vertex_id, uv, luv in zip(face_vertex_ids, v_uvs, l_uvs):
                 new_vertex_id = remapped[vertex_id]
@@ -291,10 +323,9 @@ class AbstractEntityHandler:
         if icon_path is not None:
             icon = bpy.data.images.get(Path(icon_path).stem, None)
             if icon is None:
-                icon_material_file = ContentManager().find_material(icon_path, silent=True)
-                if not icon_material_file:
+                vmt = VMTCache().find_material(icon_path, silent=True)
+                if vmt is None:
                     return
-                vmt = VMT(icon_material_file, icon_path)
                 texture = ContentManager().find_texture(vmt.get_string('$basetexture', None), silent=True)
                 if not texture:
                     return
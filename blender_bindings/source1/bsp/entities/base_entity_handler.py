@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import math
 import re
 import traceback
@@ -8,8 +10,7 @@ import bpy
 import numpy as np
 from mathutils import Vector
 
-from .....library.shared.content_providers.content_manager import \
-    ContentManager
+from .....library.source1.vmt.vmt_cache import VMTCache
 from .....library.utils.math_utilities import ensure_length, lerp_vec
 from .....logger import SLoggingManager
 from ....material_loader.material_loader import Source1MaterialLoader
@@ -683,11 +684,10 @@ class BaseEntityHandler(AbstractEntityHandler):
 
         material_name = start_entity.RopeMaterial
         add_material(material_name, curve_object)
-        content_manager = ContentManager()
-        material_file = content_manager.find_material(material_name)
-        if material_file:
+        vmt = VMTCache().find_material(material_name)
+        if vmt is not None:
             material_name = strip_patch_coordinates.sub("", material_name)
-            mat = Source1MaterialLoader(material_file, material_name)
+            mat = Source1MaterialLoader(vmt, material_name)
             mat.create_material()
         return curve_object
 
@@ -738,10 +738,10 @@ class BaseEntityHandler(AbstractEntityHandler):
 
     def handle_infodecal(self, entity: infodecal, entity_raw: dict):
         material_name = Path(entity.texture).name
-        material_file = ContentManager().find_material(entity.texture)
-        if material_file:
+        vmt = VMTCache().find_material(entity.texture)
+        if vmt is not None:
             material_name = strip_patch_coordinates.sub("", material_name)
-            mat = Source1MaterialLoader(material_file, material_name)
+            mat = Source1MaterialLoader(vmt, material_name)
             mat.create_material()
 
             tex_name = mat.vmt.get('$basetexture', None)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import math
 
 import bpy
@@ -6,16 +8,8 @@ from mathutils import Euler
 from .....library.source1.bsp.bsp_file import BSPFile
 from .....library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from .base_entity_handler import BaseEntityHandler
-from .tf_entity_classes import dispenser_touch_trigger
 from .tf_entity_classes import entity_class_handle as tf2_entity_handlers
-from .tf_entity_classes import (func_nobuild, func_regenerate,
-                                func_respawnroom, func_respawnroomvisualizer,
-                                info_observer_point, info_player_teamspawn,
-                                item_ammopack_full, item_ammopack_medium,
-                                item_ammopack_small, item_healthkit_full,
-                                item_healthkit_medium, item_healthkit_small,
-                                parse_float_vector, team_control_point,
-                                trigger_capture_area)
+from .tf_entity_classes import parse_float_vector
 
 
 class TF2EntityHandler(BaseEntityHandler):
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from collections import defaultdict
 from itertools import chain
 from pprint import pformat
@@ -15,12 +17,7 @@ from .....library.source1.bsp.lumps.vertex_lump import *
 from .....library.source1.bsp.lumps.vertex_normal_lump import *
 from ....utils.utils import add_material
 from ..entities.base_entity_handler import BaseEntityHandler
-from ..entities.r1_entity_classes import (Base, entity_class_handle,
-                                          func_window_hint,
-                                          trigger_capture_point,
-                                          trigger_indoor_area,
-                                          trigger_out_of_bounds,
-                                          trigger_soundscape, worldspawn)
+from ..entities.r1_entity_classes import Base, entity_class_handle
 
 
 class TitanfallEntityHandler(BaseEntityHandler):
@@ -1,5 +1,6 @@
 import json
 import re
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict, Optional, Type
 
@@ -33,9 +34,12 @@ from ....library.source1.bsp.lumps.surf_edge_lump import SurfEdgeLump
 from ....library.source1.bsp.lumps.texture_lump import (TextureDataLump,
                                                         TextureInfoLump)
 from ....library.source1.bsp.lumps.vertex_lump import VertexLump
+from ....library.source1.bsp.prop_instances import build_prop_instance_table
+from ....library.source1.bsp.visibility import PotentiallyVisibleSet
+from ....library.source1.vmt.vmt_cache import VMTCache
 from ....library.utils.math_utilities import (
     SOURCE1_HAMMER_UNIT_TO_METERS, UnitPlane,
-    convert_rotation_source1_to_blender)
+    convert_rotation_source1_to_blender, ensure_length, parse_hammer_vector)
 from ....logger import SLoggingManager
 from ...material_loader.material_loader import Source1MaterialLoader
 from ...material_loader.shaders.source1_shader_base import Source1ShaderBase
@@ -71,6 +75,10 @@ class BSP:
         self.entry_cache = {}
         self.cm = content_manager
 
+        self.map_file.prefetch_lumps(['LUMP_PLANES', 'LUMP_VERTICES', 'LUMP_EDGES', 'LUMP_SURFEDGES', 'LUMP_FACES',
+                                      'LUMP_TEXINFO', 'LUMP_TEXDATA', 'LUMP_TEXDATA_STRING_TABLE', 'LUMP_MODELS',
+                                      'LUMP_DISPINFO', 'LUMP_DISP_VERTS', 'LUMP_ENTITIES'])
+
         self.model_lump: Optional[ModelLump] = self.map_file.get_lump('LUMP_MODELS')
         self.vertex_lump: Optional[VertexLump] = self.map_file.get_lump('LUMP_VERTICES')
         self.edge_lump: Optional[EdgeLump] = self.map_file.get_lump('LUMP_EDGES')
@@ -79,6 +87,17 @@ class BSP:
         self.texture_info_lump: Optional[TextureInfoLump] = self.map_file.get_lump('LUMP_TEXINFO')
         self.texture_data_lump: Optional[TextureDataLump] = self.map_file.get_lump('LUMP_TEXDATA')
 
+        self.visible_clusters: Optional[np.ndarray] = None
+        self.pvs: Optional[PotentiallyVisibleSet] = None
+        if getattr(settings, 'visible_from_cursor', False):
+            self.pvs = PotentiallyVisibleSet.from_bsp(self.map_file)
+            if self.pvs is None:
+                self.logger.warn('Map has no visibility data, importing everything')
+            else:
+                cursor = np.array(bpy.context.scene.cursor.location) / self.settings.scale
+                self.visible_clusters = self.pvs.visible_from(cursor)
+                self.logger.info(f'{self.visible_clusters.sum()}/{self.pvs.cluster_count} clusters are visible')
+
         self.logger.debug('Adding map pack file to content manager')
         self.cm.register_content_provider(Path(self.filepath).name,self.map_file.get_lump('LUMP_PAK'))
 
@@ -115,6 +134,10 @@ class BSP:
 
         entity_handler = handler_class(self.map_file, self.main_collection,
                                        self.settings.scale, self.settings.light_scale)
+        entity_handler.use_lightmap_atlas = getattr(self.settings, 'import_lightmaps', False)
+        if self.visible_clusters is not None:
+            entity_handler.face_mask = self._visible_faces()
+            entity_handler.entity_mask = self._visible_entities()
 
         entity_lump: Optional[EntityLump] = self.map_file.get_lump('LUMP_ENTITIES')
         if entity_lump:
@@ -122,6 +145,31 @@ class BSP:
             json.dump(entity_lump.entities, entities_json, indent=1)
         entity_handler.load_entities(self.settings)
 
+    def _visible_faces(self) -> np.ndarray:
+        # Leaf faces only list worldspawn faces, brush entities are culled through the entity mask instead
+        world = self.model_lump.models[0]
+        face_count = len(self.face_lump.faces)
+        visible = np.zeros(face_count, bool)
+        leaf_visible = self.pvs.visible_faces(self.visible_clusters)[:face_count]
+        visible[:len(leaf_visible)] = leaf_visible
+        face_mask = np.ones(face_count, bool)
+        world_faces = slice(world.first_face, world.first_face + world.face_count)
+        face_mask[world_faces] = visible[world_faces]
+        return face_mask
+
+    def _visible_entities(self) -> np.ndarray:
+        entities = self.map_file.get_lump('LUMP_ENTITIES').entities
+        # Brush entities and entities without origin are always kept
+        positioned = np.array([('origin' in entity and not entity.get('model', '').startswith('*'))
+                               for entity in entities], bool)
+        # Malformed origins with missing components are padded with zeros
+        origins = np.array([ensure_length(parse_hammer_vector(entity['origin']).tolist(), 3, 0.0)
+                            if has_origin else (0, 0, 0)
+                            for entity, has_origin in zip(entities, positioned)], np.float64).reshape(-1, 3)
+        visible = np.ones(len(entities), bool)
+        visible[positioned] = self.pvs.visible_points(self.visible_clusters, origins[positioned])
+        return visible
+
     def load_cubemap(self):
         cubemap_lump: Optional[CubemapLump] = self.map_file.get_lump('LUMP_CUBEMAPS')
         if not cubemap_lump:
@@ -137,29 +185,35 @@ class BSP:
             parent_collection.objects.link(obj)
 
     def load_static_props(self):
-        gamelump: Optional[GameLump] = self.map_file.get_lump('LUMP_GAME_LUMP')
-        if gamelump and self.settings.load_static_props:
-            static_prop_lump: StaticPropLump = gamelump.game_lumps.get('sprp', None)
-            if static_prop_lump:
-                parent_collection = get_or_create_collection('static_props', self.main_collection)
-                for n, prop in enumerate(static_prop_lump.static_props):
-                    model_name = static_prop_lump.model_names[prop.prop_type]
-                    location = np.multiply(prop.origin, self.settings.scale)
-                    rotation = convert_rotation_source1_to_blender(prop.rotation)
-                    self.create_empty(f'static_prop_{n}', location, rotation, prop.scaling, parent_collection,
-                                      custom_data={'parent_path': str(self.filepath.parent),
-                                                   'prop_path': model_name,
-                                                   'scale': self.settings.scale,
-                                                   'type': 'static_props',
-                                                   'skin': str(prop.skin - 1 if prop.skin != 0 else 0),
-                                                   'entity': {
-                                                       'type': 'static_prop',
-                                                       'origin': '{} {} {}'.format(*prop.origin),
-                                                       'angles': '{} {} {}'.format(*prop.rotation),
-                                                       'scale': '{} {} {}'.format(*prop.scaling),
-                                                       'skin': str(prop.skin - 1 if prop.skin != 0 else 0),
-                                                   }
-                                                   })
+        if not self.settings.load_static_props:
+            return
+        # prop_* entities are placed by the entity handlers
+        instance_table = build_prop_instance_table(self.map_file, entities=False)
+        if not instance_table:
+            return
+        parent_collection = get_or_create_collection('static_props', self.main_collection)
+        parent_path = str(self.filepath.parent)
+        scale = self.settings.scale
+        for group in instance_table:
+            if self.visible_clusters is not None:
+                visible = self.pvs.visible_points(self.visible_clusters, group.transforms[:, :3, 3])
+                group = replace(group, **{name: getattr(group, name)[visible] for name in
+                                          ('transforms', 'skins', 'scales', 'fade_min_dist', 'fade_max_dist',
+                                           'source_ids')})
+            transforms = group.transforms.copy()
+            transforms[:, :3, :] *= scale
+            skins = np.where(group.skins != 0, group.skins - 1, 0).tolist()
+            for prop_id, matrix, skin in zip(group.source_ids.tolist(), transforms, skins):
+                placeholder = bpy.data.objects.new(f'static_prop_{prop_id}', None)
+                placeholder.matrix_world = Matrix(matrix.tolist())
+                placeholder.empty_display_size = 16
+                placeholder['entity_data'] = {'parent_path': parent_path,
+                                              'prop_path': group.model_path,
+                                              'scale': scale,
+                                              'type': 'static_props',
+                                              'skin': str(skin),
+                                              'entity': {'type': 'static_prop', 'skin': str(skin)}}
+                parent_collection.objects.link(placeholder)
 
     def load_materials(self, use_bvlg):
         Source1ShaderBase.use_bvlg(use_bvlg)
@@ -177,11 +231,11 @@ class BSP:
                         f'Skipping loading of {strip_patch_coordinates.sub("", material_name)} as it already loaded')
                     continue
             self.logger.info(f"Loading {material_name} material")
-            material_file = self.cm.find_material(material_name)
+            vmt = VMTCache().find_material(material_name)
 
-            if material_file:
+            if vmt is not None:
                 material_name = strip_patch_coordinates.sub("", material_name)
-                mat = Source1MaterialLoader(material_file, material_name)
+                mat = Source1MaterialLoader(vmt, material_name)
                 mat.create_material()
             else:
                 self.logger.error(f'Failed to find {material_name} material')
@@ -203,7 +257,15 @@ class BSP:
         parent_collection = get_or_create_collection('displacements', self.main_collection)
         info_count = len(disp_info_lump.infos)
         multiblend_offset = 0
+        visible = None
+        if self.visible_clusters is not None:
+            start_positions = np.array([disp_info.start_position for disp_info in disp_info_lump.infos], np.float64)
+            visible = self.pvs.visible_points(self.visible_clusters, start_positions)
         for n, disp_info in enumerate(disp_info_lump.infos):
+            if visible is not None and not visible[n]:
+                if disp_multiblend and disp_info.has_multiblend:
+                    multiblend_offset += ((1 << disp_info.power) + 1) ** 2
+                continue
             self.logger.info(f'Processing {n + 1}/{info_count} displacement face')
             final_vertex_colors = {}
             src_face = disp_info.get_source_face(self.map_file)
@@ -515,9 +577,17 @@ class BSP:
         if not physics_lump or not physics_lump.solid_blocks:
             return
         parent_collection = get_or_create_collection('physics', self.main_collection)
-        solid_blocks = physics_lump.solid_blocks
-        for sb_id, solid_block in solid_blocks.items():
-            for s_id, solid in enumerate(solid_block.solids):
-                mesh_obj = bpy.data.objects.new(f"physics_{sb_id}_{s_id}",
-                                                bpy.data.meshes.new(f"physics_{sb_id}_{s_id}_MESH"))
-                mesh_data = mesh_obj.data
+        # One mesh per solid block (brush model), hull vertices are in IVP meters
+        world_scale = self.settings.scale / 0.0254
+        for sb_id in physics_lump.solid_blocks:
+            hulls = physics_lump.collision_hulls(sb_id)
+            if len(hulls) == 0:
+                continue
+            used_vertices, faces = np.unique(hulls.faces, return_inverse=True)
+            vertices = hulls.vertices[used_vertices] * world_scale
+            # IVP Y axis points down
+            vertices[:, 2] *= -1
+            mesh_obj = bpy.data.objects.new(f"physics_{sb_id}", bpy.data.meshes.new(f"physics_{sb_id}_MESH"))
+            mesh_obj.data.from_pydata(vertices.tolist(), [], faces.reshape((-1, 3)))
+            mesh_obj.data.update()
+            parent_collection.objects.link(mesh_obj)
@@ -10,7 +10,7 @@ from ....library.source1.dmx.sfm.camera import Camera
 from ....library.source1.dmx.sfm.film_clip import FilmClip
 from ....library.source1.dmx.sfm_utils import *
 from ....library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
-from ....library.utils.path_utilities import find_vtx_cm
+from ....library.source1.mdl.model_bundle import ModelBundle
 from ...shared.model_container import Source1ModelContainer
 from ...source1.mdl.v49.import_mdl import import_model
 from ..mdl import FileImport, put_into_collections
@@ -23,11 +23,9 @@ def _convert_quat(quat):
 
 def import_gamemodel(mdl_path, scale=SOURCE1_HAMMER_UNIT_TO_METERS):
     mdl_path = Path(mdl_path)
-    mld_file = ContentManager().find_file(mdl_path)
-    if mld_file:
-        vvd_file = ContentManager().find_file(mdl_path.with_suffix('.vvd'))
-        vtx_file = find_vtx_cm(mdl_path, ContentManager())
-        file_list = FileImport(mld_file, vvd_file, vtx_file, None, None)
+    bundle = ModelBundle.from_content_manager(mdl_path, ContentManager())
+    if bundle:
+        file_list = FileImport(bundle.mdl_file, bundle.vvd_file, bundle.vtx_file, None, None)
         model_container = import_model(file_list, scale, False, True, True)
         # import_materials(model_container.mdl)
         put_into_collections(model_container, mdl_path.stem, bodygroup_grouping=True)
@@ -2,8 +2,8 @@ from pathlib import Path
 from typing import Union
 
 from ....library.shared.content_providers.content_manager import ContentManager
-from ....library.utils import FileBuffer
-from ....library.utils.path_utilities import find_vtx, find_vtx_cm
+from ....library.source1.mdl.model_bundle import ModelBundle
+from ....library.utils.path_utilities import corrected_path
 from ....logger import SLoggingManager
 from ...shared.model_container import Source1ModelContainer
 from ...source1.mdl.v36.import_mdl import import_model as import_model_v36
@@ -28,25 +28,19 @@ def import_model_from_full_path(mdl_path: Path,
                                 ) -> Source1ModelContainer:
     content_manager = ContentManager()
     if mdl_path.is_absolute():
-        mdl_file = FileBuffer(mdl_path)
-        vtx_file = FileBuffer(find_vtx(mdl_path))
-        vvd_file = FileBuffer(mdl_path.with_suffix('.vvd'))
-        vvc_file = mdl_path.with_suffix('.vvc') if mdl_path.with_suffix('.vvc').exists() else None
-        phy_file = (FileBuffer(mdl_path.with_suffix('.phy'))
-                    if load_physics and mdl_path.with_suffix('.phy').exists() else None)
+        bundle = ModelBundle.from_path(corrected_path(mdl_path))
         content_root = content_manager.get_content_provider_from_path(mdl_path)
         name = mdl_path.relative_to(content_root.root)
-
     else:
         name = mdl_path
-        vvd_file = content_manager.find_file(mdl_path, extension='.vvd')
-        vvc_file = content_manager.find_file(mdl_path, extension='.vcc')
-        file = content_manager.find_file(mdl_path, extension='.phy')
-        phy_file = file if load_physics and file else None
-        vtx_file = find_vtx_cm(mdl_path, content_manager)
-        mdl_file = content_manager.find_file(mdl_path)
+        bundle = ModelBundle.from_content_manager(mdl_path, content_manager)
+    if bundle is None:
+        raise FileNotFoundError(f'Failed to find {mdl_path} model')
+    if not bundle.validate():
+        raise FileNotFoundError(f'Model file {mdl_path} is missing or empty')
 
-    file_list = FileImport(mdl_file, vvd_file, vtx_file, vvc_file, phy_file)
+    file_list = FileImport(bundle.mdl_file, bundle.vvd_file, bundle.vtx_file, bundle.vvc_file,
+                           bundle.phy_file if load_physics else None)
 
     return import_model_from_files(str(name), file_list, scale,
                                    create_drives,
@@ -12,13 +12,14 @@ from .....library.source1.mdl.v44.vertex_animation_cache import \
     VertexAnimationCache
 from .....library.source1.mdl.v49.flex_expressions import *
 from .....library.source1.mdl.v49.mdl_file import MdlV49
+from .....library.source1.vmt.vmt_cache import VMTCache
 from .....library.source1.vtx import open_vtx
 from .....library.source1.vvd import Vvd
 from .....logger import SLoggingManager
 from ....material_loader.material_loader import Source1MaterialLoader
 from ....material_loader.shaders.source1_shader_base import Source1ShaderBase
 from ....shared.model_container import Source1ModelContainer
-from ....utils.utils import add_material
+from ....utils.utils import add_material, add_weights_by_bone
 from .. import FileImport
 from ..common import get_slice, merge_meshes
 from ..v44.import_mdl import create_armature
@@ -150,13 +151,7 @@ def import_model(file_list: FileImport,
                     uv_data.data.foreach_set('uv', extra_uv[vertex_indices].flatten())
 
             if not static_prop:
-                weight_groups = {bone.name: mesh_obj.vertex_groups.new(name=bone.name) for bone in mdl.bones}
-
-                for n, (bone_indices, bone_weights) in enumerate(zip(vertices['bone_id'], vertices['weight'])):
-                    for bone_index, weight in zip(bone_indices, bone_weights):
-                        if weight > 0:
-                            bone_name = mdl.bones[bone_index].name
-                            weight_groups[bone_name].add([n], weight, 'REPLACE')
+                add_weights_by_bone(mesh_obj, [bone.name for bone in mdl.bones], Vvd.weights_by_bone(vertices))
 
             if not static_prop:
                 flexes = []
@@ -417,7 +412,7 @@ def create_attachments(mdl: MdlV49, armature: bpy.types.Object, scale):
 
 
 def import_materials(mdl: MdlV49, unique_material_names=False, use_bvlg=False):
-    content_manager = ContentManager()
+    vmt_cache = VMTCache()
     for material in mdl.materials:
 
         if unique_material_names:
@@ -435,20 +430,20 @@ def import_materials(mdl: MdlV49, unique_material_names=False, use_bvlg=False):
             if bpy.data.materials[mat_name].get('source1_loaded', False):
                 logger.info(f'Skipping loading of {mat_name} as it already loaded')
                 continue
-        material_path = None
+        vmt = None
         for mat_path in mdl.materials_paths:
-            material_path = content_manager.find_material(Path(mat_path) / material.name)
-            if material_path:
+            vmt = vmt_cache.find_material(Path(mat_path) / material.name)
+            if vmt is not None:
                 break
-        if material_path:
+        if vmt is not None:
             Source1ShaderBase.use_bvlg(use_bvlg)
             if material_eyeball is not None:
                 pass
                 # TODO: Syborg64 replace this with actual shader class
                 # new_material = EyeShader(material_path, mat_name, material_eyeball)
-                new_material = Source1MaterialLoader(material_path, mat_name)
+                new_material = Source1MaterialLoader(vmt, mat_name)
             else:
-                new_material = Source1MaterialLoader(material_path, mat_name)
+                new_material = Source1MaterialLoader(vmt, mat_name)
             new_material.create_material()
 
 
@@ -13,7 +13,7 @@ from .....library.source1.vvc import Vvc
 from .....library.source1.vvd import Vvd
 from .....logger import SLoggingManager
 from ....shared.model_container import Source1ModelContainer
-from ....utils.utils import add_material
+from ....utils.utils import add_material, add_weights_by_bone
 from .. import FileImport
 from ..common import get_slice, merge_meshes
 from ..v49.import_mdl import (collect_full_material_names, create_armature,
@@ -141,13 +141,7 @@ def import_model(file_list: FileImport,
                 vc.data.foreach_set('color', colors[vertex_indices].flatten())
 
             if not static_prop:
-                weight_groups = {bone.name: mesh_obj.vertex_groups.new(name=bone.name) for bone in mdl.bones}
-
-                for n, (bone_indices, bone_weights) in enumerate(zip(vertices['bone_id'], vertices['weight'])):
-                    for bone_index, weight in zip(bone_indices, bone_weights):
-                        if weight > 0:
-                            bone_name = mdl.bones[bone_index].name
-                            weight_groups[bone_name].add([n], weight, 'REPLACE')
+                add_weights_by_bone(mesh_obj, [bone.name for bone in mdl.bones], Vvd.weights_by_bone(vertices))
 
             if not static_prop:
                 flexes = []
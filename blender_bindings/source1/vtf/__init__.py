@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 import bpy
 import numpy as np
@@ -9,14 +10,27 @@ from ....logger import SLoggingManager
 log_manager = SLoggingManager()
 logger = log_manager.get_logger('Source1::VTF')
 
+from ....library.shared.pixel_pipeline import PixelPipeline
+from ....library.shared.texture_service import TextureService
 from ....library.source1.vtf import load_texture
 from ....library.source1.vtf.cubemap_to_envmap import (
     SkyboxException, convert_skybox_to_equiangular)
 
 
-def import_texture(texture_path: Path, file_object, update=False):
-    logger.info(f'Loading "{texture_path.name}" texture')
+def _decode_texture(file_object):
     rgba_data, image_height, image_width = load_texture(file_object)
+    return rgba_data, (image_width, image_height)
+
+
+def import_texture(texture_path: Path, file_object, update=False, pipeline: PixelPipeline = (),
+                   owner: object = None, source_path: Optional[Path] = None):
+    """Create an image from a VTF, source_path is the unconverted texture path the decode is shared under."""
+    logger.info(f'Loading "{texture_path.name}" texture')
+    key = 'source1', (source_path or texture_path).as_posix().lower()
+    rgba_data, (image_width, image_height) = TextureService.active().get_pixels(
+        owner, key, lambda: _decode_texture(file_object), tuple(pipeline))
+    if rgba_data is None:
+        return None
 
     return create_and_cache_texture(texture_path, (image_width, image_height), rgba_data, False, False)
 
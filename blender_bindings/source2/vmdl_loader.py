@@ -26,7 +26,7 @@ from ...library.source2.resource_types import CompiledMeshResource
 from ...library.utils.math_utilities import SOURCE2_HAMMER_UNIT_TO_METERS
 from ..material_loader.material_loader import Source2MaterialLoader
 from ..shared.model_container import Source2ModelContainer
-from ..utils.utils import (add_material, find_layer_collection,
+from ..utils.utils import (add_material, add_weights_by_bone, find_layer_collection,
                            get_new_unique_collection)
 from .vmat_loader import load_material
 from .vphy_loader import load_physics
@@ -219,29 +219,13 @@ def _add_vertex_groups(model_resource: CompiledModelResource,
                        mesh_id: int,
                        used_vertices: np.ndarray,
                        mesh_obj: bpy.types.Object):
-    has_weights = vertex_buffer.has_attribute('BLENDWEIGHT')
-    has_indicies = vertex_buffer.has_attribute('BLENDINDICES')
-
-    if not has_weights and not has_indicies:
+    if not vertex_buffer.has_attribute('BLENDWEIGHT') and not vertex_buffer.has_attribute('BLENDINDICES'):
         return
     model_data_block, = model_resource.get_data_block(block_name='DATA')
     bones = model_data_block['m_modelSkeleton']['m_boneName']
-    weight_groups = {bone: mesh_obj.vertex_groups.new(name=bone) for bone in bones}
     remap_table = np.asarray(model_data_block['m_remappingTable'][model_data_block['m_remappingTableStarts'][mesh_id]:],
                              np.uint32)
-    if has_weights and has_indicies:
-        weights_array = used_vertices["BLENDWEIGHT"] / 255
-        indices_array = used_vertices["BLENDINDICES"].astype(np.uint32)
-    else:
-        indices_array = used_vertices["BLENDINDICES"].astype(np.uint32)
-        weights_array = np.ones_like(indices_array, dtype=np.float32)
-    remapped_indices = remap_table[indices_array]
-    for n, bone_indices in enumerate(remapped_indices):
-        weights = weights_array[n]
-        for bone_index, weight in zip(bone_indices, weights):
-            if weight > 0:
-                bone_name = bones[bone_index]
-                weight_groups[bone_name].add([n], weight, 'REPLACE')
+    add_weights_by_bone(mesh_obj, bones, vertex_buffer.get_weights_by_bone(used_vertices, remap_table))
 
 
 def convert_to_float32(uv_array: np.ndarray):
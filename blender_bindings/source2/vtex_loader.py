@@ -1,8 +1,11 @@
 from pathlib import Path
+from typing import Dict, Mapping, Optional
 
 import bpy
 
 from ..utils.texture_utils import create_and_cache_texture
+from ...library.shared.pixel_pipeline import FlipGreen, PixelPipeline
+from ...library.shared.texture_service import TextureService
 from ...library.source2.data_types.blocks.texture_data import VTexFormat
 from ...library.source2.resource_types import CompiledTextureResource
 from ...logger import SLoggingManager
@@ -10,20 +13,52 @@ from ...logger import SLoggingManager
 logger = SLoggingManager().get_logger("Source2::Texture")
 
 
-def import_texture(resource: CompiledTextureResource, texture_path: Path, flip: bool, invert_y: bool = False):
+def _is_hdr(resource: CompiledTextureResource) -> bool:
+    return resource.get_texture_format() in (VTexFormat.RGBA16161616F, VTexFormat.BC6H)
+
+
+def _texture_key(source_path: Path, flip: bool):
+    return 'source2', source_path.as_posix().lower(), flip
+
+
+def import_texture(resource: CompiledTextureResource, texture_path: Path, flip: bool, invert_y: bool = False,
+                   pipeline: PixelPipeline = (), owner: object = None, source_path: Optional[Path] = None):
+    """Create an image from a texture, source_path is the unconverted texture path the decode is shared under."""
     logger.info(f'Loading {texture_path} texture')
     if texture_path.stem + '.tga' in bpy.data.images:
         logger.info('Using already loaded texture')
         return bpy.data.images[f'{texture_path.stem}.tga']
-    pixel_data, (width, height) = resource.get_texture_data(0, flip)
+    is_hdr = _is_hdr(resource)
+    if invert_y and not is_hdr:
+        pipeline = (FlipGreen(),) + tuple(pipeline)
+    pixel_data, (width, height) = TextureService.active().get_pixels(
+        owner, _texture_key(source_path or texture_path, flip),
+        lambda: resource.get_texture_pixels(0, flip), tuple(pipeline))
 
     if pixel_data.shape[0] == 0:
         return None
-    
-    pixel_format = resource.get_texture_format()
-    image = create_and_cache_texture(texture_path, (width, height), pixel_data,
-                                     pixel_format in (VTexFormat.RGBA16161616F, VTexFormat.BC6H), invert_y)
+
+    image = create_and_cache_texture(texture_path, (width, height), pixel_data, is_hdr)
 
     image.alpha_mode = 'CHANNEL_PACKED'
-    del pixel_data
     return image
+
+
+def import_texture_outputs(resource: CompiledTextureResource, source_path: Path, outputs: Mapping[Path, PixelPipeline],
+                           flip: bool, owner: object = None) -> Dict[Path, Optional[bpy.types.Image]]:
+    """Decode a texture once and create one image per output path from its own pipeline."""
+    logger.info(f'Loading {", ".join(path.as_posix() for path in outputs)} textures')
+    texture_service = TextureService.active()
+    key = _texture_key(source_path, flip)
+    is_hdr = _is_hdr(resource)
+    images = {}
+    for path, pipeline in outputs.items():
+        output_data, (width, height) = texture_service.get_pixels(
+            owner, key, lambda: resource.get_texture_pixels(0, flip), pipeline)
+        if output_data.shape[0] == 0:
+            images[path] = None
+            continue
+        image = create_and_cache_texture(path, (width, height), output_data, is_hdr)
+        image.alpha_mode = 'CHANNEL_PACKED'
+        images[path] = image
+    return images
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Dict, List, Union, Tuple
 
 import bpy
+import numpy as np
 from mathutils import Euler
 
 from .....library.shared.content_providers.content_manager import \
@@ -56,11 +57,6 @@ def get_scale(entity_raw: dict):
     return parse_float_vector(entity_raw.get('scales', '0 0 0'))
 
 
-class Base:
-    def __init__(self, entity_data):
-        self._entity_data = entity_data
-
-
 class AbstractEntityHandler:
     entity_lookup_table = {}
 
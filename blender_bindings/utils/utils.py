@@ -1,6 +1,8 @@
 import random
+from typing import Dict, List, Tuple
 
 import bpy
+import numpy as np
 
 
 def find_layer_collection(layer_collection, name):
@@ -60,3 +62,16 @@ def new_collection(name: str, parent: bpy.types.Collection):
         parent.children.link(collection)
     collection.name = name
     return collection
+
+
+def add_weights_by_bone(mesh_obj: bpy.types.Object, bone_names: List[str],
+                        weights_by_bone: Dict[int, Tuple[np.ndarray, np.ndarray]]):
+    weight_groups = {name: mesh_obj.vertex_groups.new(name=name) for name in bone_names}
+    for bone_index, (vertex_ids, weights) in weights_by_bone.items():
+        weight_group = weight_groups[bone_names[bone_index]]
+        # One add() call per distinct weight value instead of one per vertex
+        unique_weights, inverse = np.unique(weights, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        for weight, ids in zip(unique_weights, np.split(vertex_ids[order], splits)):
+            weight_group.add(ids.tolist(), float(weight), 'REPLACE')
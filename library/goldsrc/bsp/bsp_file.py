@@ -29,15 +29,12 @@ class BspFile:
 
     def get_lump(self, lump_type: LumpType) -> Optional[Lump]:
         if lump_type not in self.lumps:
-            for lump_handler in Lump.__subclasses__():
-                if not hasattr(lump_handler, 'LUMP_TYPE'):
-                    raise TypeError(f'Lump handler has no attribute \'LUMP_TYPE\': {lump_handler.__name__}')
+            lump_handler = Lump.handlers.get(lump_type, None)
+            if lump_handler is not None:
+                lump_info = self.lumps_info[lump_type.value]
+                lump_data = lump_handler(lump_info)
+                lump_data.parse(self.buffer.slice(lump_info.offset, lump_info.length), self)
 
-                if getattr(lump_handler, 'LUMP_TYPE') == lump_type:
-                    lump_info = self.lumps_info[lump_type.value]
-                    lump_data = lump_handler(lump_info)
-                    lump_data.parse(self.buffer.slice(lump_info.offset, lump_info.length), self)
+                self.lumps[lump_type] = lump_data
 
-                    self.lumps[lump_type] = lump_data
-
-        return self.lumps[lump_type]
+        return self.lumps.get(lump_type, None)
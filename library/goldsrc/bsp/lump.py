@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Type
 
 from ...utils import Buffer
 
@@ -39,6 +39,14 @@ class LumpInfo:
 
 class Lump:
     LUMP_TYPE: LumpType = None
+    # LumpType -> handler, filled as lump handler classes are defined
+    handlers: Dict[LumpType, Type['Lump']] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, 'LUMP_TYPE') or cls.LUMP_TYPE is None:
+            raise TypeError(f'Lump handler has no attribute \'LUMP_TYPE\': {cls.__name__}')
+        Lump.handlers[cls.LUMP_TYPE] = cls
 
     def __init__(self, info: LumpInfo):
         self.info = info
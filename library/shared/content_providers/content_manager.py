@@ -1,7 +1,7 @@
 from collections import Counter, OrderedDict
 from hashlib import md5
 from pathlib import Path
-from typing import Dict, List, Optional, TypeVar, Union
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from ....library.utils.path_utilities import (backwalk_file_resolver,
                                               corrected_path, get_mod_path)
@@ -197,7 +197,14 @@ class ContentManager(metaclass=SingletonMeta):
 
     def find_file(self, filepath: Union[str, Path], additional_dir: str = None, extension: str = None, *,
                   silent=False) -> Optional[Buffer]:
+        found = self.find_file_with_provider(filepath, additional_dir, extension, silent=silent)
+        if found is not None:
+            return found[3]
+        return None
 
+    def find_file_with_provider(self, filepath: Union[str, Path], additional_dir: str = None, extension: str = None,
+                                *, silent=False) -> Optional[Tuple[str, AnyContentProvider, Path, Buffer]]:
+        """Same lookup as find_file, also returns the name and instance of the provider and the requested path."""
         new_filepath = Path(str(filepath).replace('\\', '/').replace('//', '/').strip('\\/'))
         if additional_dir is not None:
             new_filepath = Path(additional_dir, new_filepath)
@@ -210,9 +217,39 @@ class ContentManager(metaclass=SingletonMeta):
             if file is not None:
                 if not silent:
                     logger.debug(f'Found in {mod}!')
-                return file
+                return mod, submanager, new_filepath, file
         return None
 
+    def find_sibling_files(self, filepath: Union[str, Path], suffixes: Iterable[str], *,
+                           silent=False) -> Dict[str, Buffer]:
+        """Find filepath with the first suffix and collect the other suffixes, preferring the same provider.
+
+        Siblings the providing mod lacks are looked up in the remaining providers in priority order.
+        """
+        suffixes = list(suffixes)
+        new_filepath = Path(str(filepath).replace('\\', '/').replace('//', '/').strip('\\/'))
+        if not silent:
+            logger.info(f'Requesting {new_filepath.with_suffix(suffixes[0])} with siblings {suffixes[1:]}')
+        for mod, submanager in self.content_providers.items():
+            files = submanager.find_sibling_files(new_filepath, suffixes)
+            if suffixes[0] in files:
+                if not silent:
+                    logger.debug(f'Found in {mod}!')
+                break
+        else:
+            return {}
+        for suffix in suffixes:
+            if suffix in files:
+                continue
+            for other in self.content_providers.values():
+                if other is submanager:
+                    continue
+                file = other.find_file(new_filepath.with_suffix(suffix))
+                if file is not None:
+                    files[suffix] = file
+                    break
+        return files
+
     def find_path(self, filepath: Union[str, Path], additional_dir=None, extension=None, *, silent=False):
 
         new_filepath = Path(str(filepath).replace('\\', '/').replace('//', '/'))
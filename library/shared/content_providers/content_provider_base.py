@@ -1,6 +1,7 @@
+import os
 from collections import deque
 from pathlib import Path
-from typing import Deque, Dict, Iterator, Optional, Tuple, Type, Union
+from typing import Deque, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
 
 from ...utils import Buffer, FileBuffer
 from ...utils.path_utilities import corrected_path
@@ -25,6 +26,31 @@ class ContentProviderBase:
     def glob(self, pattern: str) -> Iterator[Tuple[Path, Buffer]]:
         raise NotImplementedError('Implement me!')
 
+    def find_sibling_files(self, filepath: Path, suffixes: Iterable[str]) -> Dict[str, Buffer]:
+        """Resolve filepath.with_suffix(suffix) for every suffix, returns only found files keyed by suffix.
+
+        Filesystem backed providers list the parent directory once instead of probing every sibling,
+        providers without real paths (archives, pak lumps) are probed file by file.
+        """
+        suffixes = list(suffixes)
+        real_path = self.find_path(filepath.with_suffix(suffixes[0]))
+        if real_path is None or not (real_path.is_absolute() and real_path.is_file()):
+            files = {}
+            for suffix in suffixes:
+                file = self.find_file(filepath.with_suffix(suffix))
+                if file is not None:
+                    files[suffix] = file
+            return files
+
+        directory_listing = {entry.name.lower(): entry.path for entry in os.scandir(real_path.parent)
+                             if entry.is_file()}
+        files = {}
+        for suffix in suffixes:
+            sibling_path = directory_listing.get(real_path.with_suffix(suffix).name.lower(), None)
+            if sibling_path is not None:
+                files[suffix] = FileBuffer(sibling_path)
+        return files
+
     @property
     def steam_id(self) -> SteamAppId:
         return SteamAppId.UNKNOWN
@@ -1,6 +1,6 @@
 import fnmatch
 from pathlib import Path
-from typing import Iterator, Optional, Tuple
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 from ...shared.vpk.vpk_file import open_vpk
 from ...utils import Buffer
@@ -27,6 +27,11 @@ class VPKContentProvider(ContentProviderBase):
         if file:
             return file
 
+    def find_sibling_files(self, filepath: Path, suffixes: Iterable[str]) -> Dict[str, Buffer]:
+        paths = {suffix: filepath.with_suffix(suffix).as_posix().lower() for suffix in suffixes}
+        files = self.vpk_archive.get_files_str([path for path in paths.values() if path in self.vpk_archive.entries])
+        return {suffix: files[path] for suffix, path in paths.items() if path in files}
+
     def find_path(self, filepath: Path) -> Optional[Path]:
         entry = filepath in self.vpk_archive
         if entry:
@@ -0,0 +1,179 @@
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, MutableMapping, Optional, Type, Union
+
+# Marks a class name removed from an EntityClassTable layer
+_REMOVED = object()
+
+
+class EntityView:
+    """Base of all schema generated entity classes, wraps the raw key values of one entity."""
+
+    def __init__(self, entity_data: dict):
+        self._raw_data = entity_data
+
+
+class SchemaProperty:
+    """Entity property decoded from the raw key values on first access.
+
+    The decoded value is stored in the instance dict under the same name,
+    which shadows this (non-data) descriptor for every following access.
+    """
+    __slots__ = ('name', 'key', 'decoder', 'default')
+
+    def __init__(self, name: str, key: str, decoder: Callable[[dict, str, object], object], default):
+        self.name = name
+        self.key = key
+        self.decoder = decoder
+        self.default = default
+
+    def __get__(self, instance: Optional[EntityView], owner=None):
+        if instance is None:
+            return self
+        value = self.decoder(instance._raw_data, self.key, self.default)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class EntitySchema:
+    """Entity classes of one game, described by a json property schema.
+
+    The schema is only read when a class is first requested and every class is built once,
+    with properties decoded by the given decoders (property kind -> decoder).
+
+    Schema layout::
+
+        {"classes": {name: {"bases": [...], "attributes": {...}, "properties": [[name, key, kind, default], ...]}},
+         "imported": [names of classes taken from the parent schema],
+         "lookup": {entity class name: schema class name}}
+
+    "lookup" is optional and defaults to every class of the schema.
+    """
+
+    def __init__(self, path: Path, root: Type[EntityView], decoders: Dict[str, Callable],
+                 parent: Optional['EntitySchema'] = None):
+        self.path = path
+        self.root = root
+        self.decoders = decoders
+        self.parent = parent
+        self._schema: Optional[dict] = None
+        self._classes: Dict[str, type] = {}
+
+    @property
+    def schema(self) -> dict:
+        if self._schema is None:
+            with self.path.open('r') as file:
+                self._schema = json.load(file)
+        return self._schema
+
+    @property
+    def lookup(self) -> Dict[str, str]:
+        lookup = self.schema.get('lookup', None)
+        if lookup is None:
+            lookup = self.schema['lookup'] = {name: name for name in self.schema['classes']}
+        return lookup
+
+    def get_class(self, name: str) -> Optional[type]:
+        """Schema class by its name, None for classes the schema does not define."""
+        cls = self._classes.get(name, None)
+        if cls is not None:
+            return cls
+        if name == self.root.__name__:
+            return self.root
+        entry = self.schema['classes'].get(name, None)
+        if entry is None:
+            if self.parent is not None and name in self.schema.get('imported', ()):
+                return self.parent.get_class(name)
+            return None
+        bases = tuple(self.get_class(base_name) for base_name in entry.get('bases', ())) or (self.root,)
+        namespace = dict(entry.get('attributes', {}))
+        namespace['__module__'] = self.root.__module__
+        for prop_name, key, kind, default in entry.get('properties', ()):
+            namespace[prop_name] = SchemaProperty(prop_name, key, self.decoders[kind], default)
+        cls = self._classes[name] = type(name, bases, namespace)
+        return cls
+
+    def get_entity_class(self, class_name: str) -> Optional[type]:
+        """Class used for entities of the given classname, None if the schema does not list it."""
+        schema_name = self.lookup.get(class_name, None)
+        if schema_name is None:
+            return None
+        return self.get_class(schema_name)
+
+
+class EntityClassTable(MutableMapping):
+    """Entity classname to class mapping made of schema and dict layers.
+
+    Later layers take priority. Schemas are loaded by the first lookup that reaches them,
+    so chaining tables of several games costs nothing until entities are handled.
+    """
+
+    def __init__(self, *layers: Union[EntitySchema, dict]):
+        self._layers: List[Union[EntitySchema, dict]] = list(layers)
+
+    def __getitem__(self, class_name: str) -> type:
+        for layer in reversed(self._layers):
+            if isinstance(layer, EntitySchema):
+                cls = layer.get_entity_class(class_name)
+                if cls is not None:
+                    return cls
+            elif class_name in layer:
+                cls = layer[class_name]
+                if cls is _REMOVED:
+                    break
+                return cls
+        raise KeyError(class_name)
+
+    def __contains__(self, class_name) -> bool:
+        try:
+            self[class_name]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, class_name: str, cls: type):
+        if not self._layers or not isinstance(self._layers[-1], dict):
+            self._layers.append({})
+        self._layers[-1][class_name] = cls
+
+    def __delitem__(self, class_name: str):
+        if class_name not in self:
+            raise KeyError(class_name)
+        self[class_name] = _REMOVED
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for layer in reversed(self._layers):
+            names = layer.lookup if isinstance(layer, EntitySchema) else layer
+            for class_name in names:
+                if class_name in seen:
+                    continue
+                seen.add(class_name)
+                if class_name in self:
+                    yield class_name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self) -> 'EntityClassTable':
+        return EntityClassTable(*(dict(layer) if isinstance(layer, dict) else layer for layer in self._layers))
+
+    def update(self, other=(), **kwargs):
+        if isinstance(other, EntityClassTable):
+            self._layers.extend(other.copy()._layers)
+        else:
+            super().update(other)
+        for class_name, cls in kwargs.items():
+            self[class_name] = cls
+
+
+def schema_module_getattr(schema: EntitySchema, module_name: str) -> Callable[[str], type]:
+    """Module level __getattr__ resolving schema classes, keeps `from module import class_name` working."""
+
+    def __getattr__(name: str):
+        cls = None if name.startswith('_') else schema.get_class(name)
+        if cls is None:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        return cls
+
+    return __getattr__
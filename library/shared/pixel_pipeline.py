@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Tuple, TypeVar, Union
+
+import numpy as np
+
+CHANNEL_NAMES = ('red', 'green', 'blue', 'alpha')
+
+
+def _rgba_view(pixels: np.ndarray) -> np.ndarray:
+    return pixels.reshape(-1, 4)
+
+
+def _unit(pixels: np.ndarray) -> float:
+    """Value of 1.0 in the pixel dtype, 255 for uint8 data."""
+    return 255 if pixels.dtype == np.uint8 else 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class FlipGreen:
+    """Convert between DirectX and OpenGL normal maps."""
+    name = 'flip_green'
+
+    def __call__(self, pixels: np.ndarray) -> np.ndarray:
+        rgba = _rgba_view(pixels)
+        if pixels.dtype == np.uint8:
+            np.invert(rgba[:, 1], out=rgba[:, 1])
+        else:
+            np.subtract(1, rgba[:, 1], out=rgba[:, 1])
+        return pixels
+
+
+@dataclass(frozen=True, slots=True)
+class SSBumpToNormal:
+    """Approximate a tangent space normal map from self shadowed bump map data."""
+    name = 'ssbump'
+
+    SCALE = (0.5, 0.5, 0.2)
+    OFFSET = (0.33, 0.33, 0.8)
+
+    def __call__(self, pixels: np.ndarray) -> np.ndarray:
+        rgba = _rgba_view(pixels)
+        if pixels.dtype == np.uint8:
+            values = np.arange(256, dtype=np.float32) / 255
+            for channel, (scale, offset) in enumerate(zip(self.SCALE, self.OFFSET)):
+                lut = np.clip(np.rint((values * scale + offset) * 255), 0, 255).astype(np.uint8)
+                rgba[:, channel] = lut[rgba[:, channel]]
+        else:
+            for channel, (scale, offset) in enumerate(zip(self.SCALE, self.OFFSET)):
+                rgba[:, channel] *= scale
+                rgba[:, channel] += offset
+        return pixels
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractChannel:
+    """Grayscale image with opaque alpha made of one channel."""
+    channel: int
+    invert: bool = False
+
+    @property
+    def name(self):
+        return f'{"inv_" if self.invert else ""}{CHANNEL_NAMES[self.channel]}'
+
+    def __call__(self, pixels: np.ndarray) -> np.ndarray:
+        unit = _unit(pixels)
+        values = _rgba_view(pixels)[:, self.channel]
+        if self.invert:
+            values = unit - values
+        output = np.empty_like(pixels)
+        rgba = _rgba_view(output)
+        rgba[:, :3] = values[:, None]
+        rgba[:, 3] = unit
+        return output
+
+
+@dataclass(frozen=True, slots=True)
+class FillChannel:
+    """Overwrite one channel with a constant, value is in 0-1 range."""
+    channel: int
+    value: float = 1.0
+
+    @property
+    def name(self):
+        return f'fill_{CHANNEL_NAMES[self.channel]}'
+
+    def __call__(self, pixels: np.ndarray) -> np.ndarray:
+        _rgba_view(pixels)[:, self.channel] = self.value * _unit(pixels)
+        return pixels
+
+
+@dataclass(frozen=True, slots=True)
+class PremultiplyAlpha:
+    name = 'premultiplied'
+
+    def __call__(self, pixels: np.ndarray) -> np.ndarray:
+        rgba = _rgba_view(pixels)
+        if pixels.dtype == np.uint8:
+            alpha = rgba[:, 3:].astype(np.uint16)
+            rgba[:, :3] = (rgba[:, :3] * alpha + 127) // 255
+        else:
+            rgba[:, :3] *= rgba[:, 3:]
+        return pixels
+
+
+PixelOp = Union[FlipGreen, SSBumpToNormal, ExtractChannel, FillChannel, PremultiplyAlpha]
+PixelPipeline = Tuple[PixelOp, ...]
+
+
+def apply_pipeline(pixels: np.ndarray, pipeline: PixelPipeline) -> np.ndarray:
+    """Run pipeline steps on decoded RGBA pixels (uint8 or float), pixels may be modified in place."""
+    if not pipeline:
+        return pixels
+    if not pixels.flags.writeable or not pixels.flags.c_contiguous:
+        pixels = np.ascontiguousarray(pixels).copy()
+    for step in pipeline:
+        pixels = step(pixels)
+    return pixels
+
+
+def to_float_pixels(pixels: np.ndarray) -> np.ndarray:
+    """Pixels in 0-1 float range, float data is returned as is."""
+    if pixels.dtype == np.uint8:
+        return pixels.astype(np.float32) / 255
+    return pixels
+
+
+K = TypeVar('K')
+
+
+def split_pixels(pixels: np.ndarray, pipelines: Mapping[K, PixelPipeline]) -> Dict[K, np.ndarray]:
+    """Run several pipelines on the same decoded pixels, every pipeline gets its own copy."""
+    return {name: apply_pipeline(pixels.copy(), pipeline) for name, pipeline in pipelines.items()}
+
+
+def pipeline_suffix(pipeline: PixelPipeline) -> str:
+    """Name part that tells converted textures apart from the original."""
+    return '_'.join(step.name for step in pipeline)
+
+
+def converted_path(texture_path: Path, pipeline: PixelPipeline) -> Path:
+    """Path converted pixels are cached under, unchanged for an empty pipeline."""
+    if not pipeline:
+        return texture_path
+    return texture_path.with_name(f'{texture_path.stem}_{pipeline_suffix(pipeline)}{texture_path.suffix}')
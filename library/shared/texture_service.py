@@ -0,0 +1,104 @@
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from ...logger import SLoggingManager
+from .pixel_pipeline import PixelPipeline, apply_pipeline, to_float_pixels
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('TextureService')
+
+DecodedPixels = Tuple[np.ndarray, Tuple[int, int]]
+
+
+@dataclass(slots=True)
+class _SourceTexture:
+    pixels: np.ndarray
+    size: Tuple[int, int]
+    views: Dict[PixelPipeline, np.ndarray] = field(default_factory=dict)
+    # Owners are held by id, keeping them alive so ids can not be reused while referenced
+    owners: Dict[int, object] = field(default_factory=dict)
+
+
+class TextureService:
+    """Decoded textures and their derived views, shared by every material of one import.
+
+    Each texture is decoded once and every (texture, pipeline) view is computed once while the texture is in use.
+    Textures are requested under an owner (usually a shader handler) and a texture with its views is evicted
+    as soon as its last owner releases it. Images created from the views are cached by Blender, so a later
+    material only decodes again when it needs a view that was not turned into an image yet.
+    """
+    _active: Optional['TextureService'] = None
+
+    def __init__(self):
+        self._textures: Dict[Hashable, _SourceTexture] = {}
+
+    @classmethod
+    def active(cls) -> 'TextureService':
+        """Service of the running import, outside of imports every call gets a fresh one."""
+        return cls._active or TextureService()
+
+    @classmethod
+    @contextmanager
+    def session(cls):
+        """Make a service active for the duration of an import, nested sessions share the outer one."""
+        if cls._active is not None:
+            yield cls._active
+            return
+        service = cls._active = TextureService()
+        try:
+            yield service
+        finally:
+            cls._active = None
+            service.clear()
+
+    @classmethod
+    def scoped(cls, func: Callable) -> Callable:
+        """Decorator running func inside a texture session."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with cls.session():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def get_pixels(self, owner: object, key: Hashable, decode: Callable[[], DecodedPixels],
+                   pipeline: PixelPipeline = ()) -> DecodedPixels:
+        """Float RGBA pixels of a texture after pipeline, decode is only called on first use of key.
+
+        decode returns uint8 or float pixels, pipelines run on those before the float conversion.
+        The returned array is shared, callers must not modify it.
+        """
+        texture = self._textures.get(key, None)
+        if texture is None:
+            pixels, size = decode()
+            if not isinstance(pixels, np.ndarray):
+                return pixels, size
+            texture = self._textures[key] = _SourceTexture(pixels, size)
+        texture.owners[id(owner)] = owner
+        view = texture.views.get(pipeline, None)
+        if view is None:
+            pixels = texture.pixels.copy() if pipeline else texture.pixels
+            view = texture.views[pipeline] = to_float_pixels(apply_pipeline(pixels, pipeline))
+        return view, texture.size
+
+    def release(self, owner: object):
+        """Drop the references of owner and evict the textures nobody else references."""
+        owner_id = id(owner)
+        unused = []
+        for key, texture in self._textures.items():
+            if texture.owners.pop(owner_id, None) is not None and not texture.owners:
+                unused.append(key)
+        for key in unused:
+            del self._textures[key]
+        if unused:
+            logger.debug(f'Evicted {len(unused)} textures, {len(self._textures)} still referenced')
+
+    def clear(self):
+        if self._textures:
+            logger.debug(f'Evicting {len(self._textures)} textures')
+        self._textures.clear()
@@ -1,6 +1,6 @@
 from functools import lru_cache
 from pathlib import Path, PosixPath, PurePath, WindowsPath
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 from ...utils import Buffer, FileBuffer, MemoryBuffer
 from ...utils.pylib import LZHAM
@@ -67,7 +67,7 @@ class VPKFile:
         normalized_path = full_path.as_posix().lower()
         return self.get_file_str(normalized_path)
 
-    def get_file_str(self, normalized_path: str) -> Union[Buffer, None]:
+    def _get_full_entry(self, normalized_path: str) -> Optional[Entry]:
         entry = self.entries.get(normalized_path, None)
         if entry is None:
             return None
@@ -75,6 +75,12 @@ class VPKFile:
             self.buffer.seek(entry.full_entry_offset)
             entry = Entry(entry.file_name, entry.full_entry_offset).read(self.buffer)
             self.entries[normalized_path] = entry
+        return entry
+
+    def get_file_str(self, normalized_path: str) -> Union[Buffer, None]:
+        entry = self._get_full_entry(normalized_path)
+        if entry is None:
+            return None
 
         if entry.archive_id == 0x7FFF:
             data = bytearray(entry.preload_data)
@@ -90,6 +96,31 @@ class VPKFile:
                 reader = MemoryBuffer(entry.preload_data + target_archive.read(entry.size))
                 return reader
 
+    def get_files_str(self, normalized_paths: List[str]) -> Dict[str, Buffer]:
+        """Read several entries at once, opening every referenced archive only one time."""
+        by_archive: Dict[int, List[Entry]] = {}
+        for normalized_path in normalized_paths:
+            entry = self._get_full_entry(normalized_path)
+            if entry is not None:
+                by_archive.setdefault(entry.archive_id, []).append(entry)
+
+        files = {}
+        for archive_id, entries in by_archive.items():
+            entries.sort(key=lambda e: e.offset)
+            if archive_id == 0x7FFF:
+                base_offset = self.header.tree_size + self.tree_offset
+                with self.buffer.save_current_offset():
+                    for entry in entries:
+                        self.buffer.seek(entry.offset + base_offset)
+                        files[entry.file_name] = MemoryBuffer(entry.preload_data + self.buffer.read(entry.size))
+            else:
+                target_archive_path = self.filepath.parent / f'{self.filepath.stem[:-3]}{archive_id:03d}.vpk'
+                with open(target_archive_path, 'rb') as target_archive:
+                    for entry in entries:
+                        target_archive.seek(entry.offset)
+                        files[entry.file_name] = MemoryBuffer(entry.preload_data + target_archive.read(entry.size))
+        return files
+
     def find_file(self, full_path: Path):
         full_path = full_path.as_posix().lower()
         return self.entries.get(full_path, None)
@@ -159,6 +190,9 @@ class TitanfallVPKFile(VPKFile):
                     entry = self.entries[full_path] = TitanfallEntry(full_path, buffer.tell())
                     entry.read(buffer)
 
+    def get_files_str(self, normalized_paths: List[str]) -> Dict[str, Buffer]:
+        return {path: self.read_file(self.entries[path]) for path in normalized_paths if path in self.entries}
+
     def read_file(self, file_entry: TitanfallEntry) -> Buffer:
         if not file_entry.loaded:
             file_entry.read(self.buffer)
@@ -1,46 +1,54 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from ....logger import SLoggingManager
 from ...shared.content_providers.content_manager import ContentManager
-from ...utils.file_utils import FileBuffer
+from ...utils.file_utils import FileBuffer, MappedFileBuffer
 from .lump import *
 
 log_manager = SLoggingManager()
 
 
-def open_bsp(filepath):
+def open_bsp(filepath, lump_cache_budget: Optional[int] = None):
     from struct import unpack
     assert Path(filepath).exists()
     with open(filepath, 'rb') as f:
         magic, version = unpack('4sI', f.read(8))
 
     if magic == b'VBSP':
-        return BSPFile.from_filename(filepath)
+        return BSPFile.from_filename(filepath, lump_cache_budget)
     elif magic == b'rBSP':
-        return RespawnBSPFile.from_filename(filepath)
+        return RespawnBSPFile.from_filename(filepath, lump_cache_budget)
 
 
 CM = ContentManager()
 
 
 class BSPFile:
-    def __init__(self, filepath: Path, buffer: Buffer):
+    def __init__(self, filepath: Path, buffer: Buffer, lump_cache_budget: Optional[int] = None):
         self.filepath = Path(filepath)
         self.buffer = buffer
         self.logger = log_manager.get_logger(self.filepath.stem)
         self.version = 0
         self.is_l4d2 = False
         self.lumps_info: List[LumpInfo] = []
-        self.lumps: Dict[str, Lump] = {}
+        # Parsed lumps in least to most recently used order
+        self.lumps: OrderedDict[str, Lump] = OrderedDict()
+        self._lump_sizes: Dict[str, int] = {}
+        # Maximum amount of decompressed lump bytes kept parsed, None means no limit
+        self.lump_cache_budget = lump_cache_budget
+        # Decompressed lump data produced by prefetch_lumps, consumed on first parse
+        self._prefetched_buffers: Dict[int, Buffer] = {}
         self.revision = 0
         self.content_manager = CM
         self.steam_app_id = CM.get_content_provider_from_path(filepath).steam_id
 
     @classmethod
-    def from_filename(cls, filepath: Path):
-        buffer = FileBuffer(filepath)
-        self = cls(filepath, buffer)
+    def from_filename(cls, filepath: Path, lump_cache_budget: Optional[int] = None):
+        buffer = MappedFileBuffer(filepath)
+        self = cls(filepath, buffer, lump_cache_budget)
         magic = buffer.read_fourcc()
         assert magic == "VBSP", "Invalid BSP header"
         version = buffer.read_int32()
@@ -56,44 +64,105 @@ class BSPFile:
         self.revision = buffer.read_int32()
         return self
 
+    def close(self):
+        """Release the mapped file, lumps that are not parsed yet can not be read afterwards."""
+        self._prefetched_buffers.clear()
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, 'buffer'):
+            self.close()
+
+    @property
+    def lump_cache_size(self):
+        return sum(self._lump_sizes.values())
+
+    def release_lump(self, lump_name) -> bool:
+        """Drop parsed lump from the cache, next get_lump call will parse it again."""
+        self._lump_sizes.pop(lump_name, None)
+        return self.lumps.pop(lump_name, None) is not None
+
+    def _cache_lump(self, lump_name, lump: Lump, size: int):
+        self.lumps[lump_name] = lump
+        self._lump_sizes[lump_name] = size
+        if self.lump_cache_budget is None:
+            return
+        total_size = self.lump_cache_size
+        for cached_name in list(self.lumps.keys()):
+            if total_size <= self.lump_cache_budget or cached_name == lump_name:
+                break
+            total_size -= self._lump_sizes.get(cached_name, 0)
+            self.logger.debug(f'Evicting {cached_name} lump from cache')
+            self.release_lump(cached_name)
+
+    def _resolve_lump_class(self, lump_name) -> Optional[Tuple[Type[Lump], LumpTag]]:
+        return LUMP_REGISTRY.resolve(lump_name, self.version, self.steam_app_id, self.lumps_info)
+
     def get_lump(self, lump_name):
         if lump_name in self.lumps:
+            self.lumps.move_to_end(lump_name)
             return self.lumps[lump_name]
         else:
-            matches: List[Tuple[Type[Lump], LumpTag]] = []
-            for sub in Lump.all_subclasses():
-                sub: Type[Lump]
-                for dep in sub.tags:
-                    if dep.lump_name == lump_name:
-                        if dep.bsp_version is not None and dep.bsp_version > self.version:
-                            continue
-                        if dep.steam_id is not None and dep.steam_id != self.steam_app_id:
-                            continue
-                        if dep.lump_version is not None and dep.lump_version != self.lumps_info[dep.lump_id].version:
-                            continue
-                        matches.append((sub, dep))
-            best_matches = []
-            for match_sub, match_dep in matches:
-                lump = self.lumps_info[match_dep.lump_id]
-                rank = 0
-                if match_dep.bsp_version is not None and match_dep.bsp_version == self.version:
-                    rank += 2
-                elif match_dep.bsp_version is not None and match_dep.bsp_version > self.version:
-                    rank += 1
-                if match_dep.steam_id is not None and match_dep.steam_id == self.steam_app_id:
-                    rank += 1
-                if match_dep.lump_version is not None and match_dep.lump_version == lump.version:
-                    rank += 1
-                best_matches.append((rank, match_sub, match_dep))
-            if not best_matches:
+            resolved = self._resolve_lump_class(lump_name)
+            if resolved is None:
                 return
-            best_matches = list(sorted(best_matches, key=lambda a: a[0]))
-            _, sub, dep = best_matches[-1]
+            sub, dep = resolved
 
             parsed_lump = self.parse_lump(sub, dep.lump_id, dep.lump_name)
-            self.lumps[lump_name] = parsed_lump
+            lump_info = self.lumps_info[dep.lump_id]
+            self._cache_lump(lump_name, parsed_lump, lump_info.decompressed_size or lump_info.size)
             return parsed_lump
 
+    def prefetch_lumps(self, lump_names: Iterable[str], max_workers: Optional[int] = None):
+        """Decompress the given lumps concurrently and parse them into the lump cache.
+
+        lzma releases the GIL while decompressing, so compressed lumps scale with the thread pool,
+        parsing afterwards stays serial.
+        """
+        lump_names = [name for name in lump_names if name not in self.lumps]
+        to_decompress: Dict[int, LumpInfo] = {}
+        for lump_name in lump_names:
+            resolved = self._resolve_lump_class(lump_name)
+            if resolved is None:
+                continue
+            lump_id = resolved[1].lump_id
+            lump_info = self.lumps_info[lump_id]
+            if (lump_info is None or not lump_info.compressed or lump_id in self._prefetched_buffers
+                    or self._external_lump_path(lump_id) is not None):
+                continue
+            to_decompress[lump_id] = lump_info
+
+        if to_decompress:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {lump_id: executor.submit(self._decompress_lump, lump_info)
+                           for lump_id, lump_info in to_decompress.items()}
+                for lump_id, future in futures.items():
+                    self._prefetched_buffers[lump_id] = future.result()
+
+        for lump_name in lump_names:
+            self.get_lump(lump_name)
+
+    def _decompress_lump(self, lump_info: LumpInfo) -> Buffer:
+        buffer = Lump.decompress_lump(self.buffer.slice(lump_info.offset, lump_info.size))
+        assert buffer.size() == lump_info.decompressed_size
+        return buffer
+
+    def _external_lump_path(self, lump_id: int) -> Optional[Path]:
+        base_path = self.filepath.parent
+        lump_path = base_path / f'{self.filepath.name}.{lump_id:04x}.bsp_lump'
+        if lump_path.exists():
+            return lump_path
+        lump_path = base_path / f'{self.filepath.stem}_l_{lump_id}.lmp'
+        if lump_path.exists():
+            return lump_path
+        return None
+
     def _get_lump_buffer(self, lump_id: int, lump_info: LumpInfo) -> Buffer:
         base_path = self.filepath.parent
         lump_path = base_path / f'{self.filepath.name}.{lump_id:04x}.bsp_lump'
@@ -103,10 +172,10 @@ class BSPFile:
 
         if not lump_info.compressed:
             return self.buffer.slice(lump_info.offset, lump_info.size)
+        elif lump_id in self._prefetched_buffers:
+            return self._prefetched_buffers.pop(lump_id)
         else:
-            buffer = Lump.decompress_lump(self.buffer.slice(lump_info.offset, lump_info.size))
-            assert buffer.size() == lump_info.decompressed_size
-            return buffer
+            return self._decompress_lump(lump_info)
 
     def parse_lump(self, lump_class: Type[Lump], lump_id, lump_name):
         base_path = self.filepath.parent
@@ -117,28 +186,24 @@ class BSPFile:
             self.lumps_info[lump_id] = lump_info
             buffer.seek(lump_info.offset)
 
-            parsed_lump = lump_class(lump_info).parse(buffer, self)
-            self.lumps[lump_id] = parsed_lump
-            return parsed_lump
+            return lump_class(lump_info).parse(buffer, self)
 
         if self.lumps_info[lump_id].size != 0:
             lump_info = self.lumps_info[lump_id]
             buffer = self._get_lump_buffer(lump_id, lump_info)
 
-            parsed_lump = lump_class(lump_info).parse(buffer, self)
-            self.lumps[lump_id] = parsed_lump
-            return parsed_lump
+            return lump_class(lump_info).parse(buffer, self)
 
 
 class RespawnBSPFile(BSPFile):
 
-    def __init__(self, filepath: Path, buffer: Buffer):
-        super().__init__(filepath, buffer)
+    def __init__(self, filepath: Path, buffer: Buffer, lump_cache_budget: Optional[int] = None):
+        super().__init__(filepath, buffer, lump_cache_budget)
 
     @classmethod
-    def from_filename(cls, filepath: Path):
-        buffer = FileBuffer(filepath)
-        self = cls(filepath, buffer)
+    def from_filename(cls, filepath: Path, lump_cache_budget: Optional[int] = None):
+        buffer = MappedFileBuffer(filepath)
+        self = cls(filepath, buffer, lump_cache_budget)
         magic = buffer.read_fourcc()
         assert magic == "rBSP", "Invalid BSP header"
         self.version = buffer.read_uint32()
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .bsp_file import BSPFile
+from .lumps.leaf_lump import LeafLump
+from .lumps.node_lump import NodeLump
+from .lumps.plane_lump import PlaneLump
+
+
+@dataclass(slots=True)
+class BSPTree:
+    """Node/leaf/plane lumps as flat arrays for batched point classification."""
+    plane_normals: np.ndarray
+    plane_dists: np.ndarray
+    node_planes: np.ndarray
+    node_children: np.ndarray
+    leaf_clusters: np.ndarray
+    leaf_areas: np.ndarray
+    leaf_contents: np.ndarray
+
+    @classmethod
+    def from_bsp(cls, bsp: BSPFile) -> Optional['BSPTree']:
+        plane_lump: Optional[PlaneLump] = bsp.get_lump('LUMP_PLANES')
+        node_lump: Optional[NodeLump] = bsp.get_lump('LUMP_NODES')
+        leaf_lump: Optional[LeafLump] = bsp.get_lump('LUMP_LEAFS')
+        if plane_lump is None or node_lump is None or leaf_lump is None or len(node_lump.node_data) == 0:
+            return None
+        return cls(plane_lump.normals.astype(np.float64), plane_lump.dists.astype(np.float64),
+                   node_lump.plane_indices.astype(np.int64), node_lump.children.astype(np.int64),
+                   leaf_lump.clusters.astype(np.int64), leaf_lump.areas.astype(np.int64),
+                   leaf_lump.contents.astype(np.int64))
+
+    def find_leafs(self, points: np.ndarray, head_node: int = 0) -> np.ndarray:
+        """Leaf id of every point, all points descend the tree together one level per step."""
+        points = np.asarray(points, np.float64).reshape(-1, 3)
+        nodes = np.full(len(points), head_node, np.int64)
+        active = np.arange(len(points))
+        while len(active):
+            current = nodes[active]
+            planes = self.node_planes[current]
+            distances = np.einsum('ij,ij->i', points[active], self.plane_normals[planes]) - self.plane_dists[planes]
+            nodes[active] = self.node_children[current, (distances < 0).astype(np.int64)]
+            active = active[nodes[active] >= 0]
+        # Children below zero encode leafs as -1 - leaf_id
+        return -1 - nodes
+
+    def find_clusters(self, points: np.ndarray, head_node: int = 0) -> np.ndarray:
+        """Visibility cluster of every point, -1 for points in solid or outside of the world."""
+        return self.leaf_clusters[self.find_leafs(points, head_node)]
+
+    def find_areas(self, points: np.ndarray, head_node: int = 0) -> np.ndarray:
+        return self.leaf_areas[self.find_leafs(points, head_node)]
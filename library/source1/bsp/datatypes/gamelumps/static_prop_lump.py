@@ -1,5 +1,7 @@
 from enum import IntFlag
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
 
 from ......logger import SLoggingManager
 from .....shared.app_id import SteamAppId
@@ -26,6 +28,90 @@ class StaticPropFlag(IntFlag):
     NO_PER_TEXEL_LIGHTING = 0x100
 
 
+_V4_FIELDS = [('origin', np.float32, (3,)),
+              ('rotation', np.float32, (3,)),
+              ('prop_type', np.uint16),
+              ('first_leaf', np.uint16),
+              ('leaf_count', np.uint16),
+              ('solid', np.uint8),
+              ('flags', np.uint8),
+              ('skin', np.int32),
+              ('fade_min_dist', np.float32),
+              ('fade_max_dist', np.float32),
+              ('lighting_origin', np.float32, (3,))]
+_V5_FIELDS = _V4_FIELDS + [('forced_fade_scale', np.float32)]
+_V6_FIELDS = _V5_FIELDS + [('min_dx_level', np.uint16), ('max_dx_level', np.uint16)]
+_V8_FIELDS = _V5_FIELDS + [('min_cpu_level', np.uint8), ('max_cpu_level', np.uint8),
+                           ('min_gpu_level', np.uint8), ('max_gpu_level', np.uint8),
+                           ('diffuse_modulation', np.uint8, (4,))]
+_V9_FIELDS = _V8_FIELDS + [('disable_x360', np.uint32)]
+# v10 replaces the byte sized flags with a 32bit field after the dx levels
+_V10_FIELDS = ([('flags_byte', *f[1:]) if f[0] == 'flags' else f for f in _V6_FIELDS] +
+               [('flags', np.uint32), ('lightmap_resolution', np.uint16, (2,))])
+_V10_CSGO_FIELDS = _V9_FIELDS + [('_pad0', np.uint32)]
+_V11_LITE_FIELDS = _V10_FIELDS + [('diffuse_modulation', np.uint8, (4,))]
+
+STATIC_PROP_LAYOUTS = {
+    'v4': np.dtype(_V4_FIELDS),
+    'v5': np.dtype(_V5_FIELDS),
+    'v6': np.dtype(_V6_FIELDS),
+    'v6_vin': np.dtype(_V5_FIELDS),
+    'v6_dm': np.dtype(_V6_FIELDS + [('_pad0', np.uint8, (72,))]),
+    'v7_l4d': np.dtype(_V6_FIELDS + [('diffuse_modulation', np.uint8, (4,))]),
+    'v7_vin': np.dtype(_V6_FIELDS),
+    'v8': np.dtype(_V8_FIELDS),
+    'v9': np.dtype(_V9_FIELDS),
+    'v10': np.dtype(_V10_FIELDS),
+    'v10_csgo': np.dtype(_V10_CSGO_FIELDS),
+    'v11_lite': np.dtype(_V11_LITE_FIELDS),
+    'v11': np.dtype(_V11_LITE_FIELDS + [('flags_ex', np.int32)]),
+    'v11_csgo': np.dtype(_V10_CSGO_FIELDS + [('uniform_scale', np.float32)]),
+    'v12': np.dtype([('origin', np.float32, (3,)),
+                     ('rotation', np.float32, (3,)),
+                     ('prop_type', np.int16),
+                     ('_pad0', np.uint8, (6,)),
+                     ('skin', np.int32),
+                     ('_pad1', np.uint8, (48,))]),
+}
+
+
+def select_static_prop_layout(version: int, bsp_version: Tuple[int, int], size: int, app_id: int) -> Optional[str]:
+    if bsp_version == (20, 4):
+        return 'v6_dm'
+
+    if app_id == SteamAppId.LEFT_4_DEAD and version == 7 and size == 68:
+        # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
+        return 'v7_l4d'
+
+    if app_id == SteamAppId.TEAM_FORTRESS_2 and version == 7 and size == 72:
+        # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
+        return 'v10'
+
+    if app_id == SteamAppId.COUNTER_STRIKE_GO and version in (10, 11):
+        # Some Counter-Strike: GO use v10 which is not compatible with Source 2013, now use v11
+        return 'v10_csgo' if version == 10 else 'v11_csgo'
+
+    if app_id == SteamAppId.BLACK_MESA and version in (10, 11):
+        # Black Mesa uses different structures
+        if version == 10 and size == 72:
+            return 'v10'
+        elif version == 11:
+            if size == 76:
+                return 'v11_lite'
+            elif size == 80:
+                return 'v11'
+
+    if version == 6 and app_id == SteamAppId.VINDICTUS:
+        return 'v6_vin'
+    if version == 7:
+        if app_id == SteamAppId.VINDICTUS:
+            return 'v7_vin'
+        return None
+    if version in (4, 5, 6, 8, 9, 10, 11, 12):
+        return f'v{version}'
+    return None
+
+
 class StaticProp:
 
     def __init__(self):
@@ -63,177 +149,17 @@ class StaticProp:
         # Vindictus specific
         self.scaling = [1.0, 1.0, 1.0]
 
-    def parse(self, reader: Buffer, version: int, bsp_version: Tuple[int, int], size: int, app_id: int):
-        if bsp_version == (20, 4):
-            self._parse_v6(reader)
-            reader.skip(72)
-            return
-
-        if app_id == SteamAppId.LEFT_4_DEAD and version == 7 and size == 68:
-            # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
-            self._parse_v7_l4d(reader)
-            return
-
-        if app_id == SteamAppId.TEAM_FORTRESS_2 and version == 7 and size == 72:
-            # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
-            self._parse_v10(reader)
-            return
-
-        if app_id == SteamAppId.COUNTER_STRIKE_GO and version in (10, 11):
-            # Some Counter-Strike: GO use v10 which is not compatible with Source 2013, now use v11
-            if version == 10:
-                self._parse_v10_csgo(reader)
-            else:
-                self._parse_v11_csgo(reader)
-            return
-
-        if app_id == SteamAppId.BLACK_MESA and version in (10, 11):
-            # Black Mesa uses different structures
-            if version == 10 and size == 72:
-                self._parse_v10(reader)
-                return
-            elif version == 11:
-                if size == 76:
-                    self._parse_v11_lite(reader)
-                    return
-                elif size == 80:
-                    self._parse_v11(reader)
-                    return
-
-        if version == 4:
-            self._parse_v4(reader)
-            return
-
-        if version == 5:
-            self._parse_v5(reader)
-            return
-
-        if version == 6:
-            if app_id == SteamAppId.VINDICTUS:
-                self._parse_v6_vin(reader)
-                return
-            else:
-                self._parse_v6(reader)
-                return
-
-        if version == 7:
-            if app_id == SteamAppId.VINDICTUS:
-                self._parse_v7_vin(reader)
-                return
-
-            if app_id == SteamAppId.LEFT_4_DEAD and size == 68:
-                # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
-                self._parse_v7_l4d(reader)
-                return
-
-            if app_id == SteamAppId.TEAM_FORTRESS_2 and size == 72:
-                # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
-                self._parse_v10(reader)
-                return
-
-        if version == 8:
-            self._parse_v8(reader)
-            return
-
-        if version == 9:
-            self._parse_v9(reader)
-            return
-
-        if version == 10:
-            if app_id == SteamAppId.COUNTER_STRIKE_GO:
-                self._parse_v10_csgo(reader)
-                return
-
-            self._parse_v10(reader)
-            return
-
-        if version == 11:
-            if app_id == SteamAppId.COUNTER_STRIKE_GO:
-                self._parse_v11_csgo(reader)
-                return
-
-            if app_id == SteamAppId.BLACK_MESA:
-                if size == 76:
-                    self._parse_v11_lite(reader)
-                    return
-                elif size == 80:
-                    self._parse_v11(reader)
-                    return
-
-            self._parse_v11(reader)
-            return
-
-        if version == 12:
-            self._parse_v12(reader)
-            return
-
-        logger.error(f'Cannot find handler for static prop of version {version} (size: {size}, app_id: {app_id})')
-        reader.skip(size)
-
-    def _parse_v4(self, reader: Buffer):
-        self.origin = reader.read_fmt('3f')
-        self.rotation = reader.read_fmt('3f')
-        self.prop_type, self.first_leaf, self.leaf_count = reader.read_fmt('3H')
-        self.solid, self.flags = reader.read_fmt('2B')
-        self.skin = reader.read_int32()
-        self.fade_min_dist, self.fade_max_dist = reader.read_fmt('2f')
-        self.lighting_origin = reader.read_fmt('3f')
-
-    def _parse_v5(self, reader: Buffer):
-        self._parse_v4(reader)
-        self.forced_fade_scale = reader.read_float()
-
-    def _parse_v6_vin(self, reader: Buffer):
-        self._parse_v5(reader)
-
-    def _parse_v6(self, reader: Buffer):
-        self._parse_v5(reader)
-        self.min_dx_level, self.max_dx_level = reader.read_fmt('2H')
-
-    def _parse_v7_l4d(self, reader: Buffer):
-        self._parse_v6(reader)
-        self.diffuse_modulation = reader.read_fmt('4B')
-
-    def _parse_v7_vin(self, reader: Buffer):
-        self._parse_v6(reader)
-
-    def _parse_v8(self, reader: Buffer):
-        self._parse_v5(reader)
-        self.min_cpu_level, self.max_cpu_level, self.min_gpu_level, self.max_gpu_level = reader.read_fmt('4B')
-        self.diffuse_modulation = reader.read_fmt('4B')
-
-    def _parse_v9(self, reader: Buffer):
-        self._parse_v8(reader)
-        self.disable_x360 = reader.read_fmt('I')
-
-    def _parse_v10(self, reader: Buffer):
-        self._parse_v6(reader)
-        self.flags = StaticPropFlag(reader.read_uint32())
-        self.lightmap_resolution = reader.read_fmt('2H')
-
-    def _parse_v10_csgo(self, reader: Buffer):
-        self._parse_v9(reader)
-        reader.skip(4)
-
-    def _parse_v11_lite(self, reader: Buffer):
-        self._parse_v10(reader)
-        self.diffuse_modulation = reader.read_fmt('4B')
-
-    def _parse_v11(self, reader: Buffer):
-        self._parse_v11_lite(reader)
-        self.flags_ex = reader.read_int32()
-
-    def _parse_v11_csgo(self, reader: Buffer):
-        self._parse_v10_csgo(reader)
-        self.uniform_scale = reader.read_float()
-
-    def _parse_v12(self, reader: Buffer):
-        self.origin = reader.read_fmt('3f')
-        self.rotation = reader.read_fmt('3f')
-        self.prop_type = reader.read_int16()
-        reader.skip(4 + 2)
-        self.skin = reader.read_int32()
-        reader.skip(12 * 4)
+    @classmethod
+    def from_record(cls, record: np.void, scaling: np.ndarray):
+        self = cls()
+        for name in record.dtype.names:
+            if name.startswith('_') or name == 'flags_byte':
+                continue
+            value = record[name]
+            setattr(self, name, tuple(value.tolist()) if isinstance(value, np.ndarray) else value.item())
+        self.flags = StaticPropFlag(self.flags)
+        self.scaling = list(scaling.tolist())
+        return self
 
 
 class StaticPropLump:
@@ -241,15 +167,40 @@ class StaticPropLump:
         from ..game_lump_header import GameLumpHeader
         self._glump_info: GameLumpHeader = glump_info
         self.model_names: List[str] = []
-        self.leafs: List[int] = []
-        self.static_props: List[StaticProp] = []
+        self.leafs: np.ndarray = np.zeros(0, np.uint16)
+        self.props: np.ndarray = np.zeros(0, STATIC_PROP_LAYOUTS['v4'])
+        self.scales: np.ndarray = np.ones((0, 3), np.float32)
+        self._static_props: Optional[List[StaticProp]] = None
+
+    @property
+    def origins(self) -> np.ndarray:
+        return self.props['origin']
+
+    @property
+    def angles(self) -> np.ndarray:
+        return self.props['rotation']
+
+    @property
+    def model_indices(self) -> np.ndarray:
+        return self.props['prop_type']
+
+    @property
+    def skins(self) -> np.ndarray:
+        return self.props['skin']
+
+    @property
+    def static_props(self) -> List[StaticProp]:
+        """Per prop objects, built on first access from the columnar data."""
+        if self._static_props is None:
+            self._static_props = [StaticProp.from_record(record, scale) for record, scale in
+                                  zip(self.props, self.scales)]
+        return self._static_props
 
     def parse(self, reader: Buffer, bsp: 'BSPFile'):
         content_manager = ContentManager()
         for _ in range(reader.read_int32()):
             self.model_names.append(reader.read_ascii_string(128))
-        for _ in range(reader.read_int32()):
-            self.leafs.append(reader.read_uint16())
+        self.leafs = np.frombuffer(reader.read(reader.read_int32() * 2), np.uint16)
         if self._glump_info.version == 12:
             unk1 = reader.read_int32()
             unk2 = reader.read_int32()
@@ -263,10 +214,15 @@ class StaticPropLump:
         if prop_count == 0:
             return
         prop_size = reader.remaining() // prop_count
-        for i in range(prop_count):
-            prop = StaticProp()
-            prop.parse(reader, self._glump_info.version, bsp.version, prop_size, content_manager.steam_id)
-            self.static_props.append(prop)
-        if prop_scaling:
-            for prop_id, scale in prop_scaling.items():
-                self.static_props[prop_id].scaling[:] = scale
+        version = self._glump_info.version
+        layout = select_static_prop_layout(version, bsp.version, prop_size, content_manager.steam_id)
+        if layout is None or STATIC_PROP_LAYOUTS[layout].itemsize > prop_size:
+            logger.error(f'Cannot find handler for static prop of version {version} '
+                         f'(size: {prop_size}, app_id: {content_manager.steam_id})')
+            self.props = np.zeros(prop_count, STATIC_PROP_LAYOUTS['v4'])
+        else:
+            dtype = STATIC_PROP_LAYOUTS[layout]
+            self.props = np.frombuffer(reader.read(dtype.itemsize * prop_count), dtype)
+        self.scales = np.ones((prop_count, 3), np.float32)
+        for prop_id, scale in prop_scaling.items():
+            self.scales[prop_id] = scale
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .bsp_file import BSPFile
+from .datatypes.texture_info import SurfaceInfo
+from .lumps.lightmap_lump import tex_light_to_linear
+
+# Empty luxels between packed faces, keeps bilinear filtering from bleeding into neighbours
+LIGHTMAP_PADDING = 1
+
+
+def shelf_pack(sizes: np.ndarray, padding: int = LIGHTMAP_PADDING) -> Tuple[np.ndarray, int, int]:
+    """Pack (N, 2) rectangles of (width, height) into shelves.
+
+    Returns (N, 2) top-left positions and the power of two atlas width and height.
+    """
+    if len(sizes) == 0:
+        return np.zeros((0, 2), np.int32), 0, 0
+    padded = sizes.astype(np.int64) + padding
+    area = int(np.sum(padded[:, 0] * padded[:, 1]))
+    atlas_width = 1 << max(int(np.ceil(np.log2(max(np.sqrt(area), padded[:, 0].max())))), 0)
+
+    # Tallest first keeps shelves dense
+    order = np.lexsort((-padded[:, 0], -padded[:, 1]))
+    positions = np.zeros((len(sizes), 2), np.int32)
+    x = y = shelf_height = 0
+    for index, (width, height) in zip(order.tolist(), padded[order].tolist()):
+        if x + width > atlas_width:
+            y += shelf_height
+            x = shelf_height = 0
+        positions[index] = x, y
+        x += width
+        shelf_height = max(shelf_height, height)
+    atlas_height = 1 << max(int(np.ceil(np.log2(y + shelf_height))), 0)
+    return positions, atlas_width, atlas_height
+
+
+@dataclass(slots=True)
+class LightmapAtlas:
+    """Style 0 lightmaps of all lit faces packed into one linear RGB image.
+
+    Rows of pixels go top to bottom, face_positions/face_sizes are in luxels and -1 for unlit faces.
+    """
+    pixels: np.ndarray
+    face_positions: np.ndarray
+    face_sizes: np.ndarray
+    lightmap_vectors: np.ndarray
+    lightmap_mins: np.ndarray
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    def has_lightmap(self, face_id: int) -> bool:
+        return self.face_positions[face_id, 0] >= 0
+
+    def face_uvs(self, face_ids: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+        """Atlas UVs for loop vertices, face_ids holds the face of each loop. V axis points up like in Blender."""
+        face_ids = np.asarray(face_ids, np.int64)
+        vectors = self.lightmap_vectors[face_ids]
+        luxels = (np.einsum('nij,nj->ni', vectors[:, :, :3], vertices) + vectors[:, :, 3]
+                  - self.lightmap_mins[face_ids])
+        uvs = (self.face_positions[face_ids] + luxels + 0.5) / (self.width, self.height)
+        uvs[:, 1] = 1 - uvs[:, 1]
+        uvs[self.face_positions[face_ids, 0] < 0] = 0
+        return uvs.astype(np.float32)
+
+    def to_rgba(self, dtype=np.float32, flip: bool = True) -> np.ndarray:
+        """RGBA copy of the atlas, flipped to bottom-up row order by default."""
+        rgba = np.ones((self.height, self.width, 4), dtype)
+        rgba[:, :, :3] = self.pixels
+        return rgba[::-1] if flip else rgba
+
+
+def build_lightmap_atlas(bsp: BSPFile, hdr: bool = True, dtype=np.float32) -> Optional[LightmapAtlas]:
+    lightmap_data = None
+    lump_names = ('LUMP_LIGHTING_HDR', 'LUMP_LIGHTING') if hdr else ('LUMP_LIGHTING',)
+    for lump_name in lump_names:
+        lump = bsp.get_lump(lump_name)
+        if lump is not None and len(lump.lightmap_data):
+            lightmap_data = lump.lightmap_data
+            break
+    faces = bsp.get_lump('LUMP_FACES')
+    texture_info_lump = bsp.get_lump('LUMP_TEXINFO')
+    if lightmap_data is None or faces is None or texture_info_lump is None:
+        return None
+    faces = faces.faces
+    texture_info: List = texture_info_lump.texture_info
+
+    face_count = len(faces)
+    light_offsets = np.fromiter((face.light_offset for face in faces), np.int64, face_count)
+    # Styles are read as signed bytes, unused style 255 shows up as -1
+    first_style = np.fromiter((face.styles[0] for face in faces), np.int64, face_count) & 0xFF
+    tex_info_ids = np.fromiter((face.tex_info_id for face in faces), np.int64, face_count)
+    mins = np.array([face.lightmap_texture_mins_in_luxels for face in faces], np.float64).reshape(-1, 2)
+    sizes = np.array([face.lightmap_texture_size_in_luxels for face in faces], np.int64).reshape(-1, 2) + 1
+    lightmap_vectors = np.array([info.lightmap_vectors for info in texture_info], np.float64).reshape(-1, 2, 4)
+    no_light_flags = np.array([bool(info.flags & (SurfaceInfo.SURF_NOLIGHT | SurfaceInfo.SURF_SKY |
+                                                  SurfaceInfo.SURF_NODRAW)) for info in texture_info], bool)
+    if len(lightmap_vectors) == 0:
+        return None
+
+    sample_counts = sizes[:, 0] * sizes[:, 1]
+    first_samples = light_offsets // 4
+    lit = ((light_offsets >= 0) & (first_style != 255) & ~no_light_flags[tex_info_ids] &
+           (first_samples + sample_counts <= len(lightmap_data)))
+    lit_ids = np.flatnonzero(lit)
+
+    positions, atlas_width, atlas_height = shelf_pack(sizes[lit_ids])
+    face_positions = np.full((face_count, 2), -1, np.int32)
+    face_positions[lit_ids] = positions
+    face_sizes = np.full((face_count, 2), -1, np.int32)
+    face_sizes[lit_ids] = sizes[lit_ids]
+
+    pixels = np.zeros((atlas_height, atlas_width, 3), dtype)
+    if len(lit_ids):
+        # One gather for every luxel of every lit face, local index inside its face drives the scatter
+        counts = sample_counts[lit_ids]
+        total = int(counts.sum())
+        starts = np.cumsum(counts) - counts
+        local = np.arange(total) - np.repeat(starts, counts)
+        samples = lightmap_data[np.repeat(first_samples[lit_ids], counts) + local]
+
+        widths = np.repeat(sizes[lit_ids, 0], counts)
+        dst_x = np.repeat(positions[:, 0], counts) + local % widths
+        dst_y = np.repeat(positions[:, 1], counts) + local // widths
+
+        exponents = samples['e'].reshape(-1, 1).astype(np.float32)
+        rgb = np.stack([samples['r'], samples['g'], samples['b']], axis=1).reshape(-1, 3).astype(np.float32)
+        pixels[dst_y, dst_x] = tex_light_to_linear(rgb, exponents)
+
+    return LightmapAtlas(pixels, face_positions, face_sizes, lightmap_vectors[tex_info_ids], mins)
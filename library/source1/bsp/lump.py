@@ -1,6 +1,7 @@
 import lzma
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional, Type, Union, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Type, Union, Tuple
 
 from ...shared.app_id import SteamAppId
 from ...utils.file_utils import Buffer, FileBuffer, MemoryBuffer
@@ -30,12 +31,76 @@ def lump_tag(lump_id, lump_name,
             bsp_version_ = (bsp_version,)
         else:
             bsp_version_ = bsp_version
-        klass.tags.append(LumpTag(lump_id, lump_name, lump_version, bsp_version_, steam_id))
+        tag = LumpTag(lump_id, lump_name, lump_version, bsp_version_, steam_id)
+        klass.tags.append(tag)
+        LUMP_REGISTRY.register(klass, tag)
         return klass
 
     return loader
 
 
+class LumpRegistry:
+    """Lump handlers indexed by lump name, filled by lump_tag as lump modules get imported.
+
+    Resolved handlers are memoized per (lump name, bsp version, steam app id, lump versions) so every map
+    after the first one with the same layout resolves a lump in a single dict lookup.
+    """
+
+    def __init__(self):
+        self._tags: Dict[str, List[Tuple[Type['Lump'], LumpTag]]] = defaultdict(list)
+        self._resolved: Dict[tuple, Optional[Tuple[Type['Lump'], LumpTag]]] = {}
+
+    def register(self, klass: Type['Lump'], tag: LumpTag):
+        self._tags[tag.lump_name].append((klass, tag))
+        self._resolved.clear()
+
+    def resolve(self, lump_name: str, bsp_version: Tuple[int, int], steam_app_id: SteamAppId,
+                lumps_info: Sequence[Optional['LumpInfo']]) -> Optional[Tuple[Type['Lump'], LumpTag]]:
+        candidates = self._tags.get(lump_name, None)
+        if not candidates:
+            return None
+
+        def _lump_version(lump_id: int):
+            if lump_id < len(lumps_info) and lumps_info[lump_id] is not None:
+                return lumps_info[lump_id].version
+            return None
+
+        lump_versions = tuple(_lump_version(tag.lump_id) for _, tag in candidates)
+        key = (lump_name, bsp_version, steam_app_id, lump_versions)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        best_matches = []
+        for (sub, tag), lump_version in zip(candidates, lump_versions):
+            if tag.bsp_version is not None and tag.bsp_version > bsp_version:
+                continue
+            if tag.steam_id is not None and tag.steam_id != steam_app_id:
+                continue
+            if tag.lump_version is not None and tag.lump_version != lump_version:
+                continue
+            rank = 0
+            if tag.bsp_version is not None and tag.bsp_version == bsp_version:
+                rank += 2
+            elif tag.bsp_version is not None and tag.bsp_version > bsp_version:
+                rank += 1
+            if tag.steam_id is not None and tag.steam_id == steam_app_id:
+                rank += 1
+            if tag.lump_version is not None and tag.lump_version == lump_version:
+                rank += 1
+            best_matches.append((rank, sub, tag))
+
+        result = None
+        if best_matches:
+            best_matches = list(sorted(best_matches, key=lambda a: a[0]))
+            _, sub, tag = best_matches[-1]
+            result = sub, tag
+        self._resolved[key] = result
+        return result
+
+
+LUMP_REGISTRY = LumpRegistry()
+
+
 @dataclass(slots=True)
 class LumpInfo:
     id: int
@@ -97,7 +162,12 @@ class Lump:
         compressed_size = buffer.read_uint32()
         filter_properties = lzma._decode_filter_properties(lzma.FILTER_LZMA1, buffer.read(5))
 
-        compressed_buffer = buffer.read(compressed_size)
+        if isinstance(buffer, MemoryBuffer):
+            # Decompress straight from the (possibly memory mapped) view without an intermediate copy
+            compressed_buffer = buffer.data[buffer.tell():buffer.tell() + compressed_size]
+            buffer.skip(compressed_size)
+        else:
+            compressed_buffer = buffer.read(compressed_size)
         chunks: List[bytes] = []
 
         while True:
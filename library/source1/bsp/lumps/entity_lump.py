@@ -1,5 +1,9 @@
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-import charset_normalizer
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
 
 from .....logger import SLoggingManager
 from ....utils import Buffer
@@ -10,23 +14,124 @@ from ..bsp_file import BSPFile
 
 log_manager = SLoggingManager()
 
+# { "key" "value" } grammar of the entity lump, comments are skipped
+_ENTITY_TOKEN_RE = re.compile(r'"([^"]*)"|([{}])|//[^\n]*|([^\s{}"]+)')
+
+
+def decode_entity_text(data: bytes) -> str:
+    for encoding in ('utf-8', 'cp1252'):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    import charset_normalizer
+    charset = charset_normalizer.from_bytes(data)
+    log_manager.get_logger("Entity Lump").info(f"Detected {charset.best().encoding!r} encoding in entity lump")
+    return data.decode(charset.best().encoding, "ignore")
+
+
+@dataclass(slots=True)
+class EntityTable:
+    """Columnar storage of entity key/values.
+
+    Pairs of entity N are keys[pair_offsets[N]:pair_offsets[N + 1]] and the matching values,
+    class_ids[N] indexes classnames (-1 when entity has no classname).
+    """
+    classnames: List[str] = field(default_factory=list)
+    class_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, np.int32))
+    pair_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, np.uint32))
+    keys: List[str] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional['EntityTable']:
+        """Tokenize entity text, returns None when text does not follow the plain entity grammar."""
+        classname_ids: Dict[str, int] = {}
+        class_ids = []
+        pair_offsets = [0]
+        keys = []
+        values = []
+
+        in_entity = False
+        pending_key = None
+        class_id = -1
+        for match in _ENTITY_TOKEN_RE.finditer(text):
+            group = match.lastindex
+            if group is None:  # comment
+                continue
+            if group == 2:
+                if match.group(2) == '{':
+                    if in_entity:
+                        return None
+                    in_entity = True
+                    class_id = -1
+                else:
+                    if not in_entity or pending_key is not None:
+                        return None
+                    in_entity = False
+                    class_ids.append(class_id)
+                    pair_offsets.append(len(keys))
+                continue
+            if not in_entity:
+                return None
+            token = match.group(group).strip()
+            if pending_key is None:
+                pending_key = token.lower()
+            else:
+                keys.append(pending_key)
+                values.append(token)
+                if pending_key == 'classname':
+                    class_id = classname_ids.setdefault(token, len(classname_ids))
+                pending_key = None
+        if in_entity:
+            return None
+        return cls(list(classname_ids.keys()), np.asarray(class_ids, np.int32),
+                   np.asarray(pair_offsets, np.uint32), keys, values)
+
+    def __len__(self):
+        return len(self.class_ids)
+
+    def classname(self, entity_id: int) -> Optional[str]:
+        class_id = self.class_ids[entity_id]
+        return self.classnames[class_id] if class_id >= 0 else None
+
+    def entities_of_class(self, classname: str) -> np.ndarray:
+        if classname not in self.classnames:
+            return np.zeros(0, np.int64)
+        return np.flatnonzero(self.class_ids == self.classnames.index(classname))
+
+    def entity(self, entity_id: int) -> Dict[str, str]:
+        start, end = self.pair_offsets[entity_id], self.pair_offsets[entity_id + 1]
+        return dict(zip(self.keys[start:end], self.values[start:end]))
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for entity_id in range(len(self)):
+            yield self.entity(entity_id)
+
 
 @lump_tag(0, 'LUMP_ENTITIES')
 class EntityLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.entities = []
+        self.table: Optional[EntityTable] = None
+        self._entities: Optional[List[Dict[str, str]]] = None
         self._logger = log_manager.get_logger("Entity Lump")
 
+    @property
+    def entities(self) -> List[Dict[str, str]]:
+        if self._entities is None:
+            self._entities = list(self.table) if self.table is not None else []
+        return self._entities
+
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        buffer = buffer.read(-1).strip(b"\x00")
-        chaset = charset_normalizer.from_bytes(buffer)
-        self._logger.info(f"Detected {chaset.best().encoding!r} encoding in entity lump")
-        buffer = buffer.decode(chaset.best().encoding, "ignore")
-        parser = ValveKeyValueParser(buffer_and_name=(buffer, 'EntityLump'), self_recover=True, array_of_blocks=True)
-        parser.parse()
-        for ent in parser.tree:
-            self.entities.append(ent.to_dict())
+        text = decode_entity_text(buffer.read(-1).strip(b"\x00"))
+        self.table = EntityTable.from_text(text)
+        if self.table is None:
+            self._logger.warn("Entity lump does not follow plain entity grammar, using recovering KeyValue parser")
+            parser = ValveKeyValueParser(buffer_and_name=(text, 'EntityLump'), self_recover=True,
+                                         array_of_blocks=True)
+            parser.parse()
+            self._entities = [ent.to_dict() for ent in parser.tree]
         return self
 
 
@@ -1,5 +1,7 @@
-from typing import List
+import weakref
+from typing import Dict, Iterator, List, Mapping, Optional, Type
 
+from .....logger import SLoggingManager
 from ....utils import Buffer
 from .. import Lump, LumpInfo, lump_tag
 from ..bsp_file import BSPFile
@@ -9,50 +11,93 @@ from ..datatypes.gamelumps.detail_prop_lump import DetailPropLump
 from ..datatypes.gamelumps.static_prop_lump import StaticPropLump
 from . import SteamAppId
 
+log_manager = SLoggingManager()
+
+GAME_LUMP_HANDLERS = {
+    'sprp': StaticPropLump,
+    'dprp': DetailPropLump,
+}
+
+
+class GameLumpDirectory(Mapping):
+    """Index of game lumps, each one is decompressed and parsed on first access."""
+
+    def __init__(self, game_lump: 'GameLump'):
+        self._game_lump = game_lump
+        self._parsed: Dict[str, object] = {}
+
+    def __getitem__(self, lump_id: str):
+        if lump_id in self._parsed:
+            return self._parsed[lump_id]
+        handler = GAME_LUMP_HANDLERS.get(lump_id, None)
+        header = self._game_lump.get_header(lump_id)
+        if handler is None or header is None:
+            raise KeyError(lump_id)
+        game_lump = handler(header)
+        game_lump.parse(self._game_lump.get_buffer(lump_id), self._game_lump.bsp)
+        self._parsed[lump_id] = game_lump
+        return game_lump
+
+    def __iter__(self) -> Iterator[str]:
+        return (header.id for header in self._game_lump.game_lumps_info if header.id in GAME_LUMP_HANDLERS)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, lump_id):
+        return lump_id in GAME_LUMP_HANDLERS and self._game_lump.get_header(lump_id) is not None
+
 
 @lump_tag(35, 'LUMP_GAME_LUMP')
 class GameLump(Lump):
+    header_class: Type[GameLumpHeader] = GameLumpHeader
+
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
         self.lump_count = 0
         self.game_lumps_info: List[GameLumpHeader] = []
-        self.game_lumps = {}
+        self.game_lumps = GameLumpDirectory(self)
+        self._buffer: Optional[Buffer] = None
+        self._bsp_ref = None
+        self._logger = log_manager.get_logger("Game Lump")
+
+    @property
+    def bsp(self) -> 'BSPFile':
+        return self._bsp_ref()
 
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
+        self._buffer = buffer
+        self._bsp_ref = weakref.ref(bsp)
         self.lump_count = buffer.read_uint32()
         for _ in range(self.lump_count):
-            lump = GameLumpHeader(self).parse(buffer, bsp)
+            lump = self.header_class(self).parse(buffer, bsp)
             if not lump.id:
                 continue
+            self._logger.debug(f'GLump "{lump.id}" offset: {lump.offset - self._info.offset} size: {lump.size}')
             self.game_lumps_info.append(lump)
-        for lump in self.game_lumps_info:
-            relative_offset = lump.offset - self._info.offset
-            print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
-
-                pass  # TODO
-            if lump.id == 'sprp':
-                game_lump = StaticPropLump(lump)
-                game_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = game_lump
-            elif lump.id == 'dprp':
-                detail_lump = DetailPropLump(lump)
-                detail_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = detail_lump
-
         return self
 
+    def get_header(self, lump_id: str) -> Optional[GameLumpHeader]:
+        for header in self.game_lumps_info:
+            if header.id == lump_id:
+                return header
+        return None
+
+    def get_buffer(self, lump_id: str) -> Optional[Buffer]:
+        """Raw (decompressed) data of a game lump, including ones without a parser."""
+        header = self.get_header(lump_id)
+        if header is None:
+            return None
+        relative_offset = header.offset - self._info.offset
+        if header.flags == 1:
+            curr_index = self.game_lumps_info.index(header)
+            if curr_index + 1 != len(self.game_lumps_info):
+                next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
+            else:
+                next_offset = self._info.size
+            return Lump.decompress_lump(self._buffer.slice(relative_offset, next_offset - relative_offset))
+        return self._buffer.slice(relative_offset, header.size)
+
 
 @lump_tag(35, 'LUMP_GAME_LUMP', bsp_version=(21, 0))
 class GameLump21(GameLump):
@@ -60,88 +105,10 @@ class GameLump21(GameLump):
 
 
 @lump_tag(35, 'LUMP_GAME_LUMP', bsp_version=(20, 4))
-class GameLump204(Lump):
-    def __init__(self, lump_info: LumpInfo):
-        super().__init__(lump_info)
-        self.lump_count = 0
-        self.game_lumps_info: List[GameLumpHeader] = []
-        self.game_lumps = {}
-
-    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        self.lump_count = buffer.read_uint32()
-        for _ in range(self.lump_count):
-            lump = DMGameLumpHeader(self).parse(buffer, bsp)
-            if not lump.id:
-                continue
-            self.game_lumps_info.append(lump)
-        for lump in self.game_lumps_info:
-            relative_offset = lump.offset - self._info.offset
-            print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
-
-                pass  # TODO
-            if lump.id == 'sprp':
-                game_lump = StaticPropLump(lump)
-                game_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = game_lump
-            elif lump.id == 'dprp':
-                detail_lump = DetailPropLump(lump)
-                detail_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = detail_lump
-
-        return self
+class GameLump204(GameLump):
+    header_class = DMGameLumpHeader
 
 
 @lump_tag(35, 'LUMP_GAME_LUMP', steam_id=SteamAppId.VINDICTUS)
-class VGameLump(Lump):
-    def __init__(self, lump_info: LumpInfo):
-        super().__init__(lump_info)
-        self.lump_count = 0
-        self.game_lumps_info: List[GameLumpHeader] = []
-        self.game_lumps = {}
-
-    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        self.lump_count = buffer.read_uint32()
-        for _ in range(self.lump_count):
-            lump = VindictusGameLumpHeader(self).parse(buffer, bsp)
-            if not lump.id:
-                continue
-            self.game_lumps_info.append(lump)
-        for lump in self.game_lumps_info:
-            relative_offset = lump.offset - self._info.offset
-            print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
-
-                pass  # TODO
-            if lump.id == 'sprp':
-                game_lump = StaticPropLump(lump)
-                game_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = game_lump
-            elif lump.id == 'dprp':
-                detail_lump = DetailPropLump(lump)
-                detail_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = detail_lump
-
-        return self
+class VGameLump(GameLump):
+    header_class = VindictusGameLumpHeader
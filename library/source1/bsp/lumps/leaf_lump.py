@@ -0,0 +1,63 @@
+import numpy as np
+
+from ....utils import Buffer
+from .. import Lump, LumpInfo, lump_tag
+from ..bsp_file import BSPFile
+
+_LEAF_FIELDS = [
+    ('contents', np.int32),
+    ('cluster', np.int16),
+    ('area_flags', np.int16),
+    ('min', np.int16, (3,)),
+    ('max', np.int16, (3,)),
+    ('first_leaf_face', np.uint16),
+    ('leaf_face_count', np.uint16),
+    ('first_leaf_brush', np.uint16),
+    ('leaf_brush_count', np.uint16),
+    ('water_data_id', np.int16),
+]
+
+# Version 0 leafs carry their ambient lighting cube inline
+leaf_v0_dtype = np.dtype(_LEAF_FIELDS + [('ambient_lighting', np.uint8, (24,)), ('_pad', np.int16)])
+leaf_v1_dtype = np.dtype(_LEAF_FIELDS + [('_pad', np.int16)])
+
+
+@lump_tag(10, 'LUMP_LEAFS')
+class LeafLump(Lump):
+
+    def __init__(self, lump_info: LumpInfo):
+        super().__init__(lump_info)
+        self.leaf_data: np.ndarray = np.zeros(0, leaf_v1_dtype)
+
+    @property
+    def clusters(self) -> np.ndarray:
+        return self.leaf_data['cluster']
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self.leaf_data['area_flags'] & 0x1FF
+
+    @property
+    def flags(self) -> np.ndarray:
+        return (self.leaf_data['area_flags'].view(np.uint16) >> 9) & 0x7F
+
+    @property
+    def contents(self) -> np.ndarray:
+        return self.leaf_data['contents']
+
+    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
+        dtype = leaf_v0_dtype if self.version == 0 else leaf_v1_dtype
+        self.leaf_data = np.frombuffer(buffer.read(), dtype)
+        return self
+
+
+@lump_tag(16, 'LUMP_LEAFFACES')
+class LeafFacesLump(Lump):
+
+    def __init__(self, lump_info: LumpInfo):
+        super().__init__(lump_info)
+        self.leaf_faces = np.array([], np.uint16)
+
+    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
+        self.leaf_faces = np.frombuffer(buffer.read(), np.uint16)
+        return self
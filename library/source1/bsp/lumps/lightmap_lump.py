@@ -50,4 +50,4 @@ class LightmapDataHDRLump(Lump):
 
 
 def tex_light_to_linear(c, exponent):
-    return c * np.pow(2.0, exponent) * (1.0 / 255.0)
+    return c * np.power(2.0, exponent) * (1.0 / 255.0)
@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Optional, Type
+
+import numpy as np
 
 from ....utils import Buffer
 from .. import Lump, LumpInfo, lump_tag
@@ -6,30 +8,63 @@ from ..bsp_file import BSPFile
 from ..datatypes.node import Node, VNode
 from . import SteamAppId
 
+node_dtype = np.dtype([
+    ('plane_index', np.int32),
+    ('children', np.int32, (2,)),
+    ('min', np.int16, (3,)),
+    ('max', np.int16, (3,)),
+    ('first_face', np.uint16),
+    ('face_count', np.uint16),
+    ('area', np.int16),
+    ('_pad', np.int16),
+])
+
+vnode_dtype = np.dtype([
+    ('plane_index', np.int32),
+    ('children', np.int32, (2,)),
+    ('min', np.int32, (3,)),
+    ('max', np.int32, (3,)),
+    ('first_face', np.int32),
+    ('face_count', np.int32),
+    ('area', np.int32),
+])
+
 
 @lump_tag(5, 'LUMP_NODES')
 class NodeLump(Lump):
+    node_dtype = node_dtype
+    node_class: Type[Node] = Node
 
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.nodes: List[Node] = []
-
-    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        while buffer:
-            plane = Node.from_buffer(buffer, self.version, bsp)
-            self.nodes.append(plane)
-        return self
+        self.node_data: np.ndarray = np.zeros(0, self.node_dtype)
+        self._nodes: Optional[List[Node]] = None
 
+    @property
+    def plane_indices(self) -> np.ndarray:
+        return self.node_data['plane_index']
 
-@lump_tag(5, 'LUMP_NODES', steam_id=SteamAppId.VINDICTUS)
-class VNodeLump(Lump):
+    @property
+    def children(self) -> np.ndarray:
+        """(N, 2) child ids, negative values are leafs encoded as -1 - leaf_id."""
+        return self.node_data['children']
 
-    def __init__(self, lump_info: LumpInfo):
-        super().__init__(lump_info)
-        self.nodes: List[VNode] = []
+    @property
+    def nodes(self) -> List[Node]:
+        if self._nodes is None:
+            self._nodes = [self.node_class(plane_index, tuple(children.tolist()),
+                                           tuple(b_min.tolist()), tuple(b_max.tolist()),
+                                           first_face, face_count, area)
+                           for plane_index, children, b_min, b_max, first_face, face_count, area, *_ in
+                           self.node_data.tolist()]
+        return self._nodes
 
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        while buffer:
-            plane = VNode.from_buffer(buffer, self.version, bsp)
-            self.nodes.append(plane)
+        self.node_data = np.frombuffer(buffer.read(), self.node_dtype)
         return self
+
+
+@lump_tag(5, 'LUMP_NODES', steam_id=SteamAppId.VINDICTUS)
+class VNodeLump(NodeLump):
+    node_dtype = vnode_dtype
+    node_class = VNode
@@ -1,7 +1,8 @@
+import fnmatch
+import struct
 import zipfile
-from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Dict, Iterator, Optional, Tuple, Union
 
 from ....shared.content_providers.content_provider_base import \
     ContentProviderBase
@@ -9,12 +10,17 @@ from ....utils import Buffer, MemoryBuffer
 from .. import Lump, LumpInfo, lump_tag
 from ..bsp_file import BSPFile
 
+_LOCAL_HEADER_FMT = '<4s5H3I2H'
+_LOCAL_HEADER_SIZE = struct.calcsize(_LOCAL_HEADER_FMT)
+
 
 @lump_tag(40, 'LUMP_PAK')
 class PakLump(Lump, ContentProviderBase):
 
-    def glob(self, pattern: str):
-        raise NotImplementedError
+    def glob(self, pattern: str) -> Iterator[Tuple[str, Buffer]]:
+        for name in self._filename_cache.keys():
+            if fnmatch.fnmatch(name, pattern):
+                yield name, self._read_member(self._filename_cache[name])
 
     def find_path(self, filepath: Union[str, Path]):
         pass
@@ -23,17 +29,19 @@ class PakLump(Lump, ContentProviderBase):
         super().__init__(lump_info)
         self.filepath = None
         self.zip_file: Optional[zipfile.ZipFile] = None
-        self._filename_cache = {}
+        self._buffer: Optional[Buffer] = None
+        self._filename_cache: Dict[str, zipfile.ZipInfo] = {}
 
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
         self.filepath = bsp.filepath
         if self.zip_file is None:
-            zip_data = BytesIO(buffer.read())
-            self.zip_file = zipfile.ZipFile(zip_data)
-            self._filename_cache = {a.lower(): a for a in self.zip_file.NameToInfo}
+            # buffer is a view over the mapped BSP, only the central directory is read here
+            self._buffer = buffer
+            self.zip_file = zipfile.ZipFile(buffer)
+            self._filename_cache = {info.filename.lower(): info for info in self.zip_file.infolist()}
         return self
 
-    def find_file(self, filepath: Union[str, Path], additional_dir=None, extension=None):
+    def _get_info(self, filepath: Union[str, Path], additional_dir=None, extension=None) -> Optional[zipfile.ZipInfo]:
         filepath = Path(str(filepath).strip("\\/"))
 
         new_filepath = filepath
@@ -41,11 +49,28 @@ class PakLump(Lump, ContentProviderBase):
             new_filepath = Path(additional_dir, new_filepath)
         if extension:
             new_filepath = new_filepath.with_suffix(extension)
-        new_filepath = str(new_filepath.as_posix()).lower()
-        new_filepath = self._filename_cache.get(new_filepath, None)
+        return self._filename_cache.get(str(new_filepath.as_posix()).lower(), None)
+
+    def _read_member(self, info: zipfile.ZipInfo) -> Buffer:
+        if info.compress_type == zipfile.ZIP_STORED and isinstance(self._buffer, MemoryBuffer):
+            # Stored members are served as views, no copy and no decompression
+            header = struct.unpack_from(_LOCAL_HEADER_FMT, self._buffer.data, info.header_offset)
+            name_length, extra_length = header[-2:]
+            data_offset = info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+            return self._buffer.slice(data_offset, info.file_size)
+        return MemoryBuffer(self.zip_file.read(info))
+
+    def find_file(self, filepath: Union[str, Path], additional_dir=None, extension=None):
+        info = self._get_info(filepath, additional_dir, extension)
+        if info is not None:
+            return self._read_member(info)
+        return None
 
-        if new_filepath is not None:
-            return MemoryBuffer(self.zip_file.open(new_filepath, 'r').read())
+    def open_stream(self, filepath: Union[str, Path], additional_dir=None, extension=None) -> Optional[IO[bytes]]:
+        """Open member for streamed reading instead of decompressing it at once."""
+        info = self._get_info(filepath, additional_dir, extension)
+        if info is not None:
+            return self.zip_file.open(info, 'r')
         return None
 
     @property
@@ -1,21 +1,24 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ....utils import Buffer
-from ...phy.phy import SolidHeader
+from ...phy.phy import CollisionHulls, SolidHeader
 from .. import Lump, LumpInfo, lump_tag
 from ..bsp_file import BSPFile
 
 
 class SolidBlock:
     def __init__(self):
-        self.solids = []
+        self.solids: List[SolidHeader] = []
         self.kv = ''
 
     def parse(self, buffer: Buffer):
         data_size, script_size, solid_count = buffer.read_fmt("3I")
 
         for _ in range(solid_count):
-            solid = SolidHeader.from_buffer(buffer)
+            solid_start = buffer.tell()
+            # Ledge trees are walked on demand by collision_hulls
+            solid = SolidHeader.from_buffer(buffer, parse_tree=False)
+            buffer.seek(solid_start + solid.end())
             self.solids.append(solid)
         self.kv = buffer.read_ascii_string(script_size)
 
@@ -25,8 +28,15 @@ class PhysicsLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
         self.solid_blocks: Dict[int, SolidBlock] = {}
+        self._buffer: Optional[Buffer] = None
+
+    def collision_hulls(self, solid_block_id: int) -> CollisionHulls:
+        """All convex hulls of one solid block (one brush model) as shared vertex/face arrays."""
+        solids = self.solid_blocks[solid_block_id].solids
+        return CollisionHulls.from_buffer(self._buffer, [solid.collision_model.tree_offset for solid in solids])
 
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
+        self._buffer = buffer
         while buffer:
             solid_block_id = buffer.read_int32()
             if solid_block_id == -1:
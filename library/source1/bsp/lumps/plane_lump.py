@@ -1,20 +1,42 @@
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from ....utils import Buffer
 from .. import Lump, LumpInfo, lump_tag
 from ..bsp_file import BSPFile
 from ..datatypes.plane import Plane
 
+plane_dtype = np.dtype([
+    ('normal', np.float32, (3,)),
+    ('dist', np.float32),
+    ('type', np.int32),
+])
+
 
 @lump_tag(1, 'LUMP_PLANES')
 class PlaneLump(Lump):
 
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.planes: List[Plane] = []
+        self.plane_data: np.ndarray = np.zeros(0, plane_dtype)
+        self._planes: Optional[List[Plane]] = None
+
+    @property
+    def normals(self) -> np.ndarray:
+        return self.plane_data['normal']
+
+    @property
+    def dists(self) -> np.ndarray:
+        return self.plane_data['dist']
+
+    @property
+    def planes(self) -> List[Plane]:
+        if self._planes is None:
+            self._planes = [Plane(tuple(normal.tolist()), dist, plane_type)
+                            for normal, dist, plane_type in self.plane_data.tolist()]
+        return self._planes
 
     def parse(self, buffer: Buffer, bsp: 'BSPFile'):
-        while buffer:
-            plane = Plane.from_buffer(buffer, self.version, bsp)
-            self.planes.append(plane)
+        self.plane_data = np.frombuffer(buffer.read(), plane_dtype)
         return self
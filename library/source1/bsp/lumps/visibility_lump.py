@@ -0,0 +1,71 @@
+from typing import Optional
+
+import numpy as np
+
+from ....utils import Buffer
+from .. import Lump, LumpInfo, lump_tag
+from ..bsp_file import BSPFile
+
+
+def decompress_vis_rows(data: np.ndarray, row_offsets: np.ndarray, row_size: int) -> np.ndarray:
+    """Expand run-length encoded visibility rows into a (len(row_offsets), row_size) byte matrix.
+
+    A zero byte is followed by the number of zero bytes it stands for, any other byte is literal.
+    Neither literals nor counts are zero, so a byte is a count exactly when the byte before it is zero
+    and the whole lump can be tokenized at once, whatever order the rows are stored in.
+    """
+    if len(row_offsets) == 0 or row_size == 0:
+        return np.zeros((len(row_offsets), row_size), np.uint8)
+    data = np.asarray(data, np.uint8)
+    row_offsets = np.asarray(row_offsets, np.int64)
+    is_count = np.zeros(len(data), bool)
+    is_count[1:] = data[:-1] == 0
+    # Rows may directly follow the lump header, whose last byte says nothing about the row
+    is_count[row_offsets[row_offsets < len(data)]] = False
+    emitted = np.where(data == 0, 0, 1)
+    zero_runs = np.flatnonzero((data == 0) & ~is_count)
+    run_lengths = np.zeros(len(zero_runs), np.int64)
+    has_count = zero_runs + 1 < len(data)
+    run_lengths[has_count] = data[zero_runs[has_count] + 1]
+    emitted[zero_runs] = run_lengths
+    emitted[is_count] = 0
+
+    # Output position of every input byte, rows start wherever their first byte lands
+    output_starts = np.cumsum(emitted) - emitted
+    expanded = np.repeat(np.where(data == 0, 0, data).astype(np.uint8), emitted)
+    expanded = np.concatenate([expanded, np.zeros(row_size, np.uint8)])
+    row_starts = output_starts[row_offsets]
+    return expanded[row_starts[:, None] + np.arange(row_size)]
+
+
+@lump_tag(4, 'LUMP_VISIBILITY')
+class VisibilityLump(Lump):
+    PVS = 0
+    PAS = 1
+
+    def __init__(self, lump_info: LumpInfo):
+        super().__init__(lump_info)
+        self.cluster_count = 0
+        self.offsets: np.ndarray = np.zeros((0, 2), np.int32)
+        self._data: np.ndarray = np.zeros(0, np.uint8)
+        self._pvs: Optional[np.ndarray] = None
+
+    @property
+    def row_size(self):
+        return (self.cluster_count + 7) >> 3
+
+    @property
+    def pvs(self) -> np.ndarray:
+        """(clusters, row_size) bitset, bit N of row M is set when cluster N is potentially visible from M."""
+        if self._pvs is None:
+            self._pvs = decompress_vis_rows(self._data, self.offsets[:, self.PVS], self.row_size)
+        return self._pvs
+
+    def parse(self, buffer: Buffer, bsp: 'BSPFile'):
+        if buffer.size() < 4:
+            return self
+        self.cluster_count = buffer.read_int32()
+        self.offsets = np.frombuffer(buffer.read(self.cluster_count * 8), np.int32).reshape((-1, 2))
+        buffer.seek(0)
+        self._data = np.frombuffer(buffer.read(), np.uint8)
+        return self
@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .bsp_file import BSPFile
+
+PROP_ENTITY_CLASSES = ('prop_static', 'prop_dynamic', 'prop_dynamic_override', 'prop_physics',
+                       'prop_physics_override', 'prop_physics_multiplayer', 'prop_detail')
+
+
+def _parse_vectors(values) -> np.ndarray:
+    vectors = np.zeros((len(values), 3), np.float64)
+    for n, value in enumerate(values):
+        components = value.split()[:3]
+        vectors[n, :len(components)] = [float(component) for component in components]
+    return vectors
+
+
+def source_transforms(origins: np.ndarray, angles: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """Build (N, 4, 4) world matrices from Source origins, pitch/yaw/roll angles in degrees and (N, 3) scales."""
+    origins = np.asarray(origins, np.float64).reshape(-1, 3)
+    pitch, yaw, roll = np.radians(np.asarray(angles, np.float64).reshape(-1, 3)).T
+    sp, cp = np.sin(pitch), np.cos(pitch)
+    sy, cy = np.sin(yaw), np.cos(yaw)
+    sr, cr = np.sin(roll), np.cos(roll)
+
+    # Rz(yaw) @ Ry(pitch) @ Rx(roll), same order as XYZ euler built by convert_rotation_source1_to_blender
+    transforms = np.zeros((len(origins), 4, 4), np.float64)
+    transforms[:, 0, 0] = cy * cp
+    transforms[:, 0, 1] = cy * sp * sr - sy * cr
+    transforms[:, 0, 2] = cy * sp * cr + sy * sr
+    transforms[:, 1, 0] = sy * cp
+    transforms[:, 1, 1] = sy * sp * sr + cy * cr
+    transforms[:, 1, 2] = sy * sp * cr - cy * sr
+    transforms[:, 2, 0] = -sp
+    transforms[:, 2, 1] = cp * sr
+    transforms[:, 2, 2] = cp * cr
+    if scales is not None:
+        transforms[:, :3, :3] *= np.asarray(scales, np.float64).reshape(-1, 1, 3)
+    transforms[:, :3, 3] = origins
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+@dataclass(slots=True)
+class PropInstances:
+    """All placements of one model, columns share the instance order."""
+    model_path: str
+    transforms: np.ndarray
+    skins: np.ndarray
+    scales: np.ndarray
+    fade_min_dist: np.ndarray
+    fade_max_dist: np.ndarray
+    # Static prop index, or entity index for prop_* entities
+    source_ids: np.ndarray
+    from_entities: bool = False
+
+    def __len__(self):
+        return len(self.transforms)
+
+
+@dataclass(slots=True)
+class PropInstanceTable:
+    groups: List[PropInstances] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.groups)
+
+    def __iter__(self):
+        return iter(self.groups)
+
+    @property
+    def instance_count(self):
+        return sum(len(group) for group in self.groups)
+
+    def by_model(self) -> Dict[str, List[PropInstances]]:
+        result: Dict[str, List[PropInstances]] = {}
+        for group in self.groups:
+            result.setdefault(group.model_path, []).append(group)
+        return result
+
+    def _add_grouped(self, model_paths: np.ndarray, from_entities: bool, **columns: np.ndarray):
+        if len(model_paths) == 0:
+            return
+        unique_paths, inverse = np.unique(model_paths, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.cumsum(np.bincount(inverse, minlength=len(unique_paths)))[:-1]
+        split_columns = {name: np.split(column[order], splits) for name, column in columns.items()}
+        for n, model_path in enumerate(unique_paths.tolist()):
+            self.groups.append(PropInstances(model_path=model_path, from_entities=from_entities,
+                                             **{name: parts[n] for name, parts in split_columns.items()}))
+
+    def add_static_props(self, static_prop_lump) -> 'PropInstanceTable':
+        props = static_prop_lump.props
+        if len(props) == 0:
+            return self
+        names = props.dtype.names
+        scales = static_prop_lump.scales.astype(np.float64)
+        if 'uniform_scale' in names:
+            scales = scales * props['uniform_scale'][:, None]
+        count = len(props)
+        model_names = np.asarray(static_prop_lump.model_names, dtype=object)
+        self._add_grouped(model_names[props['prop_type'].astype(np.int64)], False,
+                          transforms=source_transforms(props['origin'], props['rotation'], scales),
+                          skins=props['skin'].astype(np.int32),
+                          scales=scales,
+                          fade_min_dist=(props['fade_min_dist'] if 'fade_min_dist' in names
+                                         else np.zeros(count, np.float32)),
+                          fade_max_dist=(props['fade_max_dist'] if 'fade_max_dist' in names
+                                         else np.zeros(count, np.float32)),
+                          source_ids=np.arange(count))
+        return self
+
+    def add_entities(self, entity_table, classnames=PROP_ENTITY_CLASSES) -> 'PropInstanceTable':
+        entity_ids = np.concatenate([entity_table.entities_of_class(classname) for classname in classnames])
+        entity_ids.sort()
+        model_paths = []
+        rows = []
+        for entity_id in entity_ids.tolist():
+            entity = entity_table.entity(entity_id)
+            model_path = entity.get('model', None)
+            if not model_path:
+                continue
+            model_paths.append(model_path)
+            rows.append((entity_id,
+                         entity.get('origin', '0 0 0'), entity.get('angles', '0 0 0'),
+                         entity.get('skin', '0'), entity.get('modelscale', '1'),
+                         entity.get('fademindist', '-1'), entity.get('fademaxdist', '0')))
+        if not rows:
+            return self
+        ids, origins, angles, skins, model_scales, fade_min, fade_max = zip(*rows)
+        origins = _parse_vectors(origins)
+        angles = _parse_vectors(angles)
+        scales = np.repeat(np.asarray(model_scales, np.float64)[:, None], 3, axis=1)
+        self._add_grouped(np.asarray(model_paths, dtype=object), True,
+                          transforms=source_transforms(origins, angles, scales),
+                          skins=np.asarray([int(float(skin)) for skin in skins], np.int32),
+                          scales=scales,
+                          fade_min_dist=np.asarray(fade_min, np.float32),
+                          fade_max_dist=np.asarray(fade_max, np.float32),
+                          source_ids=np.asarray(ids, np.int64))
+        return self
+
+
+def build_prop_instance_table(bsp: BSPFile, static_props: bool = True, entities: bool = True) -> PropInstanceTable:
+    """Collect static props and prop_* entities of the map into per model instance groups."""
+    table = PropInstanceTable()
+    if static_props:
+        game_lump = bsp.get_lump('LUMP_GAME_LUMP')
+        static_prop_lump = game_lump.game_lumps.get('sprp', None) if game_lump else None
+        if static_prop_lump is not None:
+            table.add_static_props(static_prop_lump)
+    if entities:
+        entity_lump = bsp.get_lump('LUMP_ENTITIES')
+        if entity_lump is not None and entity_lump.table is not None:
+            table.add_entities(entity_lump.table)
+    return table
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .bsp_file import BSPFile
+from .bsp_tree import BSPTree
+from .lumps.leaf_lump import LeafFacesLump, LeafLump
+from .lumps.visibility_lump import VisibilityLump
+
+
+@dataclass(slots=True)
+class PotentiallyVisibleSet:
+    """Decoded PVS of a map joined with the leaf and face mappings needed to cut a map down to what is visible."""
+    tree: BSPTree
+    pvs: np.ndarray
+    leaf_face_ranges: np.ndarray
+    leaf_faces: np.ndarray
+    face_count: int
+
+    @classmethod
+    def from_bsp(cls, bsp: BSPFile) -> Optional['PotentiallyVisibleSet']:
+        tree = BSPTree.from_bsp(bsp)
+        vis_lump: Optional[VisibilityLump] = bsp.get_lump('LUMP_VISIBILITY')
+        leaf_lump: Optional[LeafLump] = bsp.get_lump('LUMP_LEAFS')
+        leaf_faces_lump: Optional[LeafFacesLump] = bsp.get_lump('LUMP_LEAFFACES')
+        faces_lump = bsp.get_lump('LUMP_FACES')
+        if tree is None or vis_lump is None or vis_lump.cluster_count == 0 or leaf_faces_lump is None:
+            return None
+        leaf_data = leaf_lump.leaf_data
+        leaf_face_ranges = np.stack([leaf_data['first_leaf_face'], leaf_data['leaf_face_count']], axis=1)
+        return cls(tree, vis_lump.pvs, leaf_face_ranges.astype(np.int64), leaf_faces_lump.leaf_faces.astype(np.int64),
+                   len(faces_lump.faces) if faces_lump is not None else 0)
+
+    @property
+    def cluster_count(self):
+        return len(self.pvs)
+
+    def visible_clusters(self, clusters: Iterable[int]) -> np.ndarray:
+        """Boolean mask of clusters potentially visible from any of the given clusters."""
+        clusters = np.asarray(list(clusters), np.int64)
+        clusters = clusters[(clusters >= 0) & (clusters < self.cluster_count)]
+        if len(clusters) == 0:
+            # Outside of the world or in solid, nothing can be culled
+            return np.ones(self.cluster_count, bool)
+        rows = np.bitwise_or.reduce(self.pvs[clusters], axis=0)
+        mask = np.unpackbits(rows, bitorder='little')[:self.cluster_count].astype(bool)
+        mask[clusters] = True
+        return mask
+
+    def visible_from(self, positions: np.ndarray) -> np.ndarray:
+        """Cluster mask for camera positions in map units."""
+        return self.visible_clusters(self.tree.find_clusters(positions))
+
+    def visible_leafs(self, cluster_mask: np.ndarray) -> np.ndarray:
+        clusters = self.tree.leaf_clusters
+        return (clusters >= 0) & cluster_mask[np.clip(clusters, 0, None)]
+
+    def visible_faces(self, cluster_mask: np.ndarray) -> np.ndarray:
+        """Boolean mask over faces referenced by any visible leaf."""
+        ranges = self.leaf_face_ranges[self.visible_leafs(cluster_mask)]
+        counts = ranges[:, 1]
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        face_ids = self.leaf_faces[np.repeat(ranges[:, 0], counts) + local]
+        mask = np.zeros(self.face_count or int(face_ids.max(initial=-1)) + 1, bool)
+        mask[face_ids] = True
+        return mask
+
+    def visible_points(self, cluster_mask: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Boolean mask of points (prop origins, entity origins) lying in visible clusters.
+
+        Points outside of any cluster are kept, they can not be culled reliably.
+        """
+        clusters = self.tree.find_clusters(points)
+        return (clusters < 0) | cluster_mask[np.clip(clusters, 0, None)]
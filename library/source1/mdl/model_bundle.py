@@ -0,0 +1,81 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ....logger import SLoggingManager
+from ...shared.content_providers.content_manager import ContentManager
+from ...utils import Buffer, FileBuffer
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('Source1::ModelBundle')
+
+# Same priority as path_utilities.find_vtx_cm
+VTX_SUFFIXES = ('.dx90.vtx', '.dx12.vtx', '.vtx', '.dx11.vtx', '.dx80.vtx', '.dx70.vtx')
+MODEL_SUFFIXES = ('.mdl', '.vvd', *VTX_SUFFIXES, '.vvc', '.phy')
+
+# Offset of the checksum field in each file header
+_CHECKSUM_OFFSETS = {'mdl': 8, 'vvd': 8, 'vvc': 8, 'vtx': 16, 'phy': 12}
+
+
+def _read_checksum(buffer: Buffer, offset: int) -> Optional[int]:
+    if buffer.size() < offset + 4:
+        return None
+    with buffer.read_from_offset(offset):
+        return buffer.read_uint32()
+
+
+@dataclass(slots=True)
+class ModelBundle:
+    mdl_file: Buffer
+    vvd_file: Optional[Buffer]
+    vtx_file: Optional[Buffer]
+    vvc_file: Optional[Buffer]
+    phy_file: Optional[Buffer]
+
+    @classmethod
+    def from_files(cls, files: Dict[str, Buffer]) -> Optional['ModelBundle']:
+        if '.mdl' not in files:
+            return None
+        vtx_file = next((files[suffix] for suffix in VTX_SUFFIXES if suffix in files), None)
+        return cls(files['.mdl'], files.get('.vvd', None), vtx_file, files.get('.vvc', None), files.get('.phy', None))
+
+    @classmethod
+    def from_content_manager(cls, mdl_path: Union[str, Path],
+                             content_manager: Optional[ContentManager] = None) -> Optional['ModelBundle']:
+        content_manager = content_manager or ContentManager()
+        return cls.from_files(content_manager.find_sibling_files(Path(mdl_path), MODEL_SUFFIXES))
+
+    @classmethod
+    def from_path(cls, mdl_path: Path) -> Optional['ModelBundle']:
+        directory_listing = {entry.name.lower(): entry.path for entry in os.scandir(mdl_path.parent)
+                             if entry.is_file()}
+        files = {}
+        for suffix in MODEL_SUFFIXES:
+            sibling_path = directory_listing.get(mdl_path.with_suffix(suffix).name.lower(), None)
+            if sibling_path is not None:
+                files[suffix] = FileBuffer(sibling_path)
+        return cls.from_files(files)
+
+    def is_complete(self):
+        return self.mdl_file is not None and self.vvd_file is not None and self.vtx_file is not None
+
+    def checksum_mismatches(self) -> List[str]:
+        """Return names of sibling files whose checksum does not match the mdl one."""
+        mdl_checksum = _read_checksum(self.mdl_file, _CHECKSUM_OFFSETS['mdl'])
+        mismatched = []
+        for name, buffer in (('vvd', self.vvd_file), ('vtx', self.vtx_file),
+                             ('vvc', self.vvc_file), ('phy', self.phy_file)):
+            if buffer is None:
+                continue
+            if _read_checksum(buffer, _CHECKSUM_OFFSETS[name]) != mdl_checksum:
+                mismatched.append(name)
+        return mismatched
+
+    def validate(self) -> bool:
+        if self.mdl_file is None or self.mdl_file.size() == 0:
+            return False
+        mismatched = self.checksum_mismatches()
+        if mismatched:
+            logger.warn(f'Checksum mismatch between mdl and {", ".join(mismatched)} files')
+        return True
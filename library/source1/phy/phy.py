@@ -1,11 +1,18 @@
+import struct
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
 
 from ...shared.types import Vector3, Vector4
-from ...utils import Buffer, FileBuffer
+from ...utils import Buffer, FileBuffer, MemoryBuffer
+
+_TREE_NODE_STRUCT = struct.Struct('<2i')
+_LEDGE_STRUCT = struct.Struct('<3i2h')
+_LEDGE_HEADER_SIZE = _LEDGE_STRUCT.size
+_TRIANGLE_SIZE = 16
+_POINT_SIZE = 16
 
 
 @dataclass(slots=True)
@@ -129,19 +136,22 @@ class CollisionModel:
     values: Tuple[float, ...]
     surface: int
     offset_tree: int
-    root_tree: TreeNode
+    root_tree: Optional[TreeNode]
+    tree_offset: int = 0
 
     @classmethod
-    def from_buffer(cls, buffer: Buffer):
+    def from_buffer(cls, buffer: Buffer, parse_tree: bool = True):
         entry_offset = buffer.tell()
         values = buffer.read_fmt('7f')
         surface, offset_tree, *_ = buffer.read_fmt('4I')
         ivps_magic = buffer.read_fourcc()
         assert ivps_magic == 'IVPS'
-        with buffer.save_current_offset():
-            buffer.seek(entry_offset + offset_tree)
-            root_tree = TreeNode.from_buffer(buffer)
-        return cls(values, surface, offset_tree, root_tree)
+        root_tree = None
+        if parse_tree:
+            with buffer.save_current_offset():
+                buffer.seek(entry_offset + offset_tree)
+                root_tree = TreeNode.from_buffer(buffer)
+        return cls(values, surface, offset_tree, root_tree, entry_offset + offset_tree)
 
     @staticmethod
     def get_vertex_data(buffer: Buffer, convex_leaf: ConvexLeaf, vertex_count):
@@ -169,7 +179,7 @@ class SolidHeader:
     collision_model: CollisionModel
 
     @classmethod
-    def from_buffer(cls, buffer: Buffer):
+    def from_buffer(cls, buffer: Buffer, parse_tree: bool = True):
         solid_size = buffer.read_uint32()
         ident = buffer.read_fourcc()
         assert ident == 'VPHY'
@@ -178,7 +188,7 @@ class SolidHeader:
         size = buffer.read_uint32()
         areas = buffer.read_fmt('3f')
         axis_map_size = buffer.read_uint32()
-        collision_model = CollisionModel.from_buffer(buffer)
+        collision_model = CollisionModel.from_buffer(buffer, parse_tree)
         return cls(solid_size, version, type, size, areas, axis_map_size, collision_model)
 
     def end(self):
@@ -196,13 +206,13 @@ class Phy:
         return cls.from_buffer(FileBuffer(filepath))
 
     @classmethod
-    def from_buffer(cls, buffer: Buffer):
+    def from_buffer(cls, buffer: Buffer, parse_trees: bool = True):
         header = Header.from_buffer(buffer)
         buffer.seek(header.size)
         solids = []
         solid_start = buffer.tell()
         for _ in range(header.solid_count):
-            solid = SolidHeader.from_buffer(buffer)
+            solid = SolidHeader.from_buffer(buffer, parse_trees)
             buffer.seek(solid_start + solid.end())
             solid_start = buffer.tell()
             solids.append(solid)
@@ -210,3 +220,91 @@ class Phy:
             buffer.seek(solid_start + solids[-1].end())
         kv = buffer.read_ascii_string()
         return cls(header, solids, kv)
+
+    def collision_hulls(self, buffer: Buffer) -> 'CollisionHulls':
+        return CollisionHulls.from_buffer(buffer, [solid.collision_model.tree_offset for solid in self.solids])
+
+
+def iter_ledge_offsets(data: bytes, tree_offset: int, include_inner: bool = False) -> List[int]:
+    """Offsets of compact ledges reachable from the tree node at tree_offset, in depth first order.
+
+    Inner ledges are convex hulls of whole subtrees and only returned with include_inner.
+    """
+    ledges = []
+    stack = [tree_offset]
+    while stack:
+        node_offset = stack.pop()
+        right_node_offset, convex_offset = _TREE_NODE_STRUCT.unpack_from(data, node_offset)
+        is_leaf = right_node_offset == 0
+        if convex_offset and (is_leaf or include_inner):
+            ledges.append(node_offset + convex_offset)
+        if not is_leaf:
+            # Left child directly follows its parent node
+            stack.append(node_offset + right_node_offset)
+            stack.append(node_offset + 28)
+    return ledges
+
+
+@dataclass(slots=True)
+class CollisionHulls:
+    """Convex hulls of several solids in shared arrays.
+
+    Faces of hull N are faces[face_offsets[N]:face_offsets[N + 1]] and index the deduplicated vertices array.
+    """
+    vertices: np.ndarray
+    faces: np.ndarray
+    face_offsets: np.ndarray
+    hull_solids: np.ndarray
+    hull_bones: np.ndarray
+
+    def __len__(self):
+        return len(self.hull_solids)
+
+    def solid_faces(self, solid_id: int) -> np.ndarray:
+        hull_ids = np.flatnonzero(self.hull_solids == solid_id)
+        if len(hull_ids) == 0:
+            return np.zeros((0, 3), np.uint32)
+        return self.faces[self.face_offsets[hull_ids[0]]:self.face_offsets[hull_ids[-1] + 1]]
+
+    def solid_mesh(self, solid_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Vertices and faces re-indexed to only the vertices used by one solid."""
+        used_vertices, faces = np.unique(self.solid_faces(solid_id), return_inverse=True)
+        return self.vertices[used_vertices], faces.reshape((-1, 3)).astype(np.uint32)
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, tree_offsets: Iterable[int]) -> 'CollisionHulls':
+        if isinstance(buffer, MemoryBuffer):
+            data = buffer.data
+        else:
+            with buffer.save_current_offset():
+                buffer.seek(0)
+                data = buffer.read()
+        raw = np.frombuffer(data, np.uint8)
+
+        point_addresses = []
+        face_counts = []
+        hull_solids = []
+        hull_bones = []
+        for solid_id, tree_offset in enumerate(tree_offsets):
+            for ledge_offset in iter_ledge_offsets(data, tree_offset):
+                vertex_offset, bone_id, _, triangle_count, _ = _LEDGE_STRUCT.unpack_from(data, ledge_offset)
+                # Per triangle: int32 index followed by 3 edges of (uint16 start point, uint16 opposite edge)
+                triangles = np.frombuffer(data, np.uint16, triangle_count * _TRIANGLE_SIZE // 2,
+                                          ledge_offset + _LEDGE_HEADER_SIZE).reshape((-1, 8))[:, 2::2]
+                point_addresses.append(ledge_offset + vertex_offset + triangles.astype(np.int64) * _POINT_SIZE)
+                face_counts.append(triangle_count)
+                hull_solids.append(solid_id)
+                hull_bones.append(bone_id)
+
+        face_offsets = np.zeros(len(face_counts) + 1, np.int64)
+        np.cumsum(face_counts, out=face_offsets[1:])
+        if not point_addresses:
+            return cls(np.zeros((0, 3), np.float32), np.zeros((0, 3), np.uint32), face_offsets,
+                       np.zeros(0, np.int32), np.zeros(0, np.int32))
+
+        # Ledges of one solid share a point array, so equal addresses are the same vertex
+        unique_addresses, faces = np.unique(np.concatenate(point_addresses), return_inverse=True)
+        vertices = raw[unique_addresses[:, None] + np.arange(12)].view(np.float32).reshape((-1, 3)).copy()
+        vertices[:, [1, 2]] = vertices[:, [2, 1]]
+        return cls(vertices, faces.reshape((-1, 3)).astype(np.uint32), face_offsets,
+                   np.asarray(hull_solids, np.int32), np.asarray(hull_bones, np.int32))
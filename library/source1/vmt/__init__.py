@@ -1,17 +1,21 @@
 import traceback
 from math import radians
-from typing import IO, Union
+from typing import IO, List, Optional, Tuple, Union
 
 from ....logger import SLoggingManager
-from ...shared.content_providers.content_manager import ContentManager
 from ...utils.kv_parser import ValveKeyValueParser, KVDataProxy, KVLexerException
 
 log_manager = SLoggingManager()
 logger = log_manager.get_logger('Source1::VMT')
 
+# (provider name, provider, path, stamp) of one file a material was resolved from
+FileDependency = Tuple[str, object, str, Optional[Tuple[int, int]]]
+
 
 class VMT:
     def __init__(self, buffer: IO, filename: str):
+        # Files this material was resolved from besides its own, filled by patch includes
+        self.dependencies: List[FileDependency] = []
         data = buffer.read()
         if isinstance(data, bytes):
             data = data.decode('latin1')
@@ -27,14 +31,26 @@ class VMT:
             self.shader = "FAILED_TO_LOAD"
             self.data = KVDataProxy([])
 
+    @classmethod
+    def from_tree(cls, shader: str, data: KVDataProxy, dependencies: List[FileDependency] = ()) -> 'VMT':
+        """Material built from an already resolved tree, used by VMTCache."""
+        vmt = cls.__new__(cls)
+        vmt.shader = shader
+        vmt.data = data
+        vmt.dependencies = list(dependencies)
+        return vmt
+
+    def copy(self) -> 'VMT':
+        return VMT.from_tree(self.shader, self.data.copy(), self.dependencies)
+
     def _postprocess(self):
-        content_manager = ContentManager()
         if self.shader == 'patch':
-            original_material = content_manager.find_file(self.get_string('include'))
-            if not original_material:
+            from .vmt_cache import VMTCache
+            patched_vmt = VMTCache().load(self.get_string('include'))
+            if patched_vmt is None:
                 logger.error(f'Failed to find original material {self.get_string("include")!r}')
                 return
-            patched_vmt = VMT(original_material, self.get_string('include'))
+            self.dependencies.extend(patched_vmt.dependencies)
             if 'insert' in self:
                 patch_data = self.get('insert', {})
                 patched_vmt.data.merge(patch_data)
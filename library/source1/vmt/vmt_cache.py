@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from ....logger import SLoggingManager
+from ...shared.content_providers.content_manager import ContentManager
+from ...utils.singleton import SingletonMeta
+from . import VMT, FileDependency
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('Source1::VMTCache')
+
+
+def content_stamp(provider, filepath: Path) -> Optional[Tuple[int, int]]:
+    """(mtime in ns, size) of a provided file, archives are stamped as a whole.
+
+    None for providers that are not backed by a file on disk (like BSP pak lumps), their content can not change.
+    """
+    try:
+        real_path = provider.find_path(filepath)
+        if real_path is not None and Path(real_path).is_file():
+            stat = Path(real_path).stat()
+        elif isinstance(provider.filepath, Path) and provider.filepath.is_file():
+            stat = provider.filepath.stat()
+        else:
+            return None
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class VMTCache(metaclass=SingletonMeta):
+    """Process wide LRU cache of fully resolved materials.
+
+    Entries are keyed by the providing content provider and the normalised path and hold
+    the include closure of the material. An entry is dropped when any file of the closure
+    changed or its provider was replaced. Every load returns a copy, so callers are free to
+    modify the material.
+    """
+    MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self._entries: OrderedDict[Tuple[str, str], VMT] = OrderedDict()
+
+    def find_material(self, material_name: Union[str, Path], *, silent=False) -> Optional[VMT]:
+        """Cached counterpart of ContentManager.find_material."""
+        return self.load(material_name, 'materials', '.vmt', silent=silent)
+
+    def load(self, filepath: Union[str, Path], additional_dir: str = None, extension: str = None, *,
+             silent=False) -> Optional[VMT]:
+        content_manager = ContentManager()
+        found = content_manager.find_file_with_provider(filepath, additional_dir, extension, silent=silent)
+        if found is None:
+            return None
+        provider_name, provider, path, buffer = found
+        key = provider_name, path.as_posix().lower()
+
+        vmt = self._entries.get(key, None)
+        if vmt is not None:
+            if self._is_valid(content_manager, vmt):
+                self._entries.move_to_end(key)
+                return vmt.copy()
+            logger.debug(f'{path} or one of its includes changed, parsing again')
+            del self._entries[key]
+
+        vmt = VMT(buffer, path.as_posix())
+        vmt.dependencies.insert(0, (provider_name, provider, path.as_posix(), content_stamp(provider, path)))
+        self._entries[key] = vmt
+        while len(self._entries) > self.MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        return vmt.copy()
+
+    @staticmethod
+    def _is_valid(content_manager: ContentManager, vmt: VMT) -> bool:
+        for provider_name, provider, path, stamp in vmt.dependencies:
+            if content_manager.content_providers.get(provider_name, None) is not provider:
+                return False
+            if content_stamp(provider, Path(path)) != stamp:
+                return False
+        return True
+
+    def clear(self):
+        self._entries.clear()
@@ -1,3 +1,4 @@
+from ...shared.pixel_pipeline import PixelPipeline, apply_pipeline
 from ...utils.pylib import VTFLibV2
 from ....logger import SLoggingManager
 
@@ -5,11 +6,12 @@ log_manager = SLoggingManager()
 logger = log_manager.get_logger('Source1::VTF')
 
 
-def load_texture(file_object, hdr=False):
+def load_texture(file_object, hdr=False, pipeline: PixelPipeline = ()):
+    """Decode a VTF into RGBA float pixels, pipeline steps are applied to the decoded pixels."""
     data = file_object.read()
     lib = VTFLibV2(data)
     try:
-        rgba_data = lib.convert(True)
+        rgba_data = apply_pipeline(lib.convert(True), pipeline)
         return rgba_data, *rgba_data.shape[:2]
     except Exception as ex:
         logger.error('Caught exception "{}" '.format(ex))
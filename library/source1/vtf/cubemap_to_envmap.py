@@ -2,7 +2,7 @@ import numpy as np
 
 from ...shared.content_providers.content_manager import ContentManager
 from ...utils.thirdparty.equilib.cube2equi_numpy import run as convert_to_eq
-from ..vmt import VMT
+from ..vmt.vmt_cache import VMTCache
 from . import load_texture
 
 
@@ -19,15 +19,15 @@ class SkyboxException(Exception):
 
 def convert_skybox_to_equiangular(skyname, width=1024):
     content_manager = ContentManager()
+    vmt_cache = VMTCache()
     sides_names = {'F': 'ft', 'R': 'rt', 'B': 'bk', 'L': 'lf', 'U': 'dn', 'D': 'up'}
     sides = {}
     max_s = 0
     use_hdr = False
     for k, n in sides_names.items():
-        file_path = content_manager.find_material(f'skybox/{skyname}{n}')
-        if not file_path:
+        material = vmt_cache.find_material(f'skybox/{skyname}{n}')
+        if material is None:
             raise SkyboxException(f'Failed to find skybox material {skyname}{n}')
-        material = VMT(file_path, f'skybox/{skyname}{n}')
         use_hdr |= bool(material.get_string('$hdrbasetexture', material.get_string('$hdrcompressedtexture', False)))
         texture_path = material.get_string('$basetexture', None)
         if texture_path is None:
@@ -54,12 +54,9 @@ def convert_skybox_to_equiangular(skyname, width=1024):
     hdr_alpha_texture = None
     if use_hdr:
         for k, n in sides_names.items():
-            file_path = content_manager.find_material(f'skybox/{skyname}_hdr{n}')
-            if file_path is None:
-                file_path = content_manager.find_material(f'skybox/{skyname}{n}')
-                material = VMT(file_path, f'skybox/{skyname}{n}')
-            else:
-                material = VMT(file_path, f'skybox/{skyname}_hdr{n}')
+            material = vmt_cache.find_material(f'skybox/{skyname}_hdr{n}')
+            if material is None:
+                material = vmt_cache.find_material(f'skybox/{skyname}{n}')
             texture_path = material.get_string('$hdrbasetexture',
                                                material.get_string('$hdrcompressedTexture',
                                                                    material.get_string(
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
 from ...utils import Buffer
+from ...utils.math_utilities import group_weights_by_bone
 from .fixup import Fixup
 from .header import Header
 
@@ -100,3 +101,8 @@ class Vvd:
         assert not buffer
 
         return cls(header, lod_datas, extra_data)
+
+    @staticmethod
+    def weights_by_bone(vertices: npt.NDArray[vertex_t]) -> Dict[int, Tuple[npt.NDArray[np.uint32],
+                                                                        npt.NDArray[np.float32]]]:
+        return group_weights_by_bone(vertices['bone_id'], vertices['weight'])
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from .....utils import Buffer, MemoryBuffer
+from .....utils.math_utilities import group_weights_by_bone
 from .....utils.pylib import decode_vertex_buffer
 from .enums import DxgiFormat, SlotType
 
@@ -118,6 +119,19 @@ class VertexBuffer:
         np_dtype = self.generate_numpy_dtype()
         return np.frombuffer(self.data.data, np_dtype, self.vertex_count)
 
+    def get_weights_by_bone(self, vertices: np.ndarray,
+                            remap_table: Optional[np.ndarray] = None) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        if not self.has_attribute('BLENDINDICES'):
+            return {}
+        indices_array = vertices["BLENDINDICES"].astype(np.uint32)
+        if self.has_attribute('BLENDWEIGHT'):
+            weights_array = vertices["BLENDWEIGHT"] / 255
+        else:
+            weights_array = np.ones_like(indices_array, dtype=np.float32)
+        if remap_table is not None:
+            indices_array = remap_table[indices_array]
+        return group_weights_by_bone(indices_array, weights_array)
+
     def __str__(self) -> str:
         return f'<VertexBuffer ' \
                f'vertices:{self.vertex_count} ' \
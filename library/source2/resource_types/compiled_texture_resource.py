@@ -2,11 +2,13 @@ import io
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Type
+from typing import Dict, Mapping, Optional, Tuple, Type, TypeVar
 
 import numpy as np
 import numpy.typing as npt
 
+from ...shared.pixel_pipeline import (PixelPipeline, apply_pipeline, split_pixels,
+                                      to_float_pixels)
 from ..data_types.blocks.resource_edit_info import ResourceEditInfo
 from ...utils.pylib import ImageFormat, decompress_image, lz4_decompress, decode_bnc, BCnMode
 from ..data_types.blocks.base import BaseBlock
@@ -17,6 +19,8 @@ from .resource import CompiledResource
 
 logger = logging.getLogger('CompiledTextureResource')
 
+K = TypeVar('K')
+
 
 @dataclass(slots=True)
 class CompiledTextureResource(CompiledResource):
@@ -127,7 +131,27 @@ class CompiledTextureResource(CompiledResource):
         data = self._decompress_texture(face_data, False, height, pixel_format, width)
         return data, (width, height)
 
-    def get_texture_data(self, mip_level: int = 0, flip=True):
+    def get_texture_data(self, mip_level: int = 0, flip=True, pipeline: PixelPipeline = ()):
+        """Decoded RGBA float pixels of one mip, pipeline steps run on the decoded pixels (in uint8 where possible)."""
+        data, pixel_format, width, height = self._read_mip_data(mip_level)
+        data = self._decompress_texture(data, flip, height, pixel_format, width, pipeline)
+        return data, (width, height)
+
+    def get_texture_pixels(self, mip_level: int = 0, flip=True):
+        """Decoded pixels of one mip before any conversion, uint8 for 8 bit formats and float32 for HDR formats."""
+        data, pixel_format, width, height = self._read_mip_data(mip_level)
+        return self._decode_pixels(data, flip, height, pixel_format, width), (width, height)
+
+    def get_texture_outputs(self, outputs: Mapping[K, PixelPipeline], mip_level: int = 0,
+                            flip=True) -> Tuple[Dict[K, npt.NDArray], Tuple[int, int]]:
+        """Decode one mip once and run every pipeline on its own copy of the pixels."""
+        data, pixel_format, width, height = self._read_mip_data(mip_level)
+        pixels = self._decode_pixels(data, flip, height, pixel_format, width)
+        if not isinstance(pixels, np.ndarray):
+            return {key: pixels for key in outputs}, (width, height)
+        return {key: to_float_pixels(output) for key, output in split_pixels(pixels, outputs).items()}, (width, height)
+
+    def _read_mip_data(self, mip_level: int):
         logger.info(f'Loading texture {self._filepath.as_posix()!r}')
         info_block = None
         for block in self._header.blocks:
@@ -168,10 +192,16 @@ class CompiledTextureResource(CompiledResource):
         height = data_block.texture_info.height
         if self.is_cubemap():
             height *= 6
-        data = self._decompress_texture(data, flip, height, pixel_format, width)
-        return data, (width, height)
+        return data, pixel_format, width, height
+
+    def _decompress_texture(self, data, flip, height, pixel_format, width, pipeline: PixelPipeline = ()):
+        pixels = self._decode_pixels(data, flip, height, pixel_format, width)
+        if not isinstance(pixels, np.ndarray):
+            return pixels
+        return to_float_pixels(apply_pipeline(pixels, pipeline))
 
-    def _decompress_texture(self, data, flip, height, pixel_format, width):
+    def _decode_pixels(self, data, flip, height, pixel_format, width):
+        """Decoded pixels, uint8 for 8 bit formats and float32 for HDR formats."""
         resource_info_block: ResourceEditInfo
         resource_info_block, = self.get_data_block(block_name="REDI")
         if resource_info_block is None:
@@ -200,7 +230,7 @@ class CompiledTextureResource(CompiledResource):
                     y_co_cg = True
 
         if pixel_format == VTexFormat.RGBA8888:
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
             if flip:
                 data = np.flipud(data)
         elif pixel_format == VTexFormat.BC6H:
@@ -220,10 +250,10 @@ class CompiledTextureResource(CompiledResource):
             if invert:
                 output[:, :, 1] = np.invert(output[:, :, 1])
 
-            data = output.astype(np.float32) / 255
+            data = output
         elif pixel_format == VTexFormat.ATI1N:
             data = decompress_image(data, width, height, ImageFormat.ATI1, ImageFormat.RGBA8, flip)
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
         elif pixel_format == VTexFormat.ATI2N:
             data = decompress_image(data, width, height, ImageFormat.ATI2, ImageFormat.RGBA8, flip)
             data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
@@ -237,11 +267,9 @@ class CompiledTextureResource(CompiledResource):
             if invert:
                 output[:, :, 1] = np.invert(output[:, :, 1])
             data = output
-
-            data = data.astype(np.float32) / 255
         elif pixel_format == VTexFormat.DXT1:
             data = decompress_image(data, width, height, ImageFormat.BC1, ImageFormat.RGBA8, flip)
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
         elif pixel_format == VTexFormat.DXT5:
             data = decompress_image(data, width, height, ImageFormat.BC3, ImageFormat.RGBA8, flip)
             data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
@@ -257,7 +285,6 @@ class CompiledTextureResource(CompiledResource):
                 output[:, :, 1] = 1 - output[:, :, 1]
 
             data = output
-            data = data.astype(np.float32) / 255
         elif pixel_format == VTexFormat.RGBA16161616F:
             data = np.frombuffer(data, np.float16, width * height * 4).astype(np.float32).reshape((width, height, 4))
         return data
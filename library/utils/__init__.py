@@ -1,3 +1,3 @@
 from .extended_enum import ExtendedEnum
-from .file_utils import (Buffer, FileBuffer, MemoryBuffer, Readable,
-                         WritableMemoryBuffer)
+from .file_utils import (Buffer, FileBuffer, MappedFileBuffer, MemoryBuffer,
+                         Readable, WritableMemoryBuffer)
@@ -0,0 +1,61 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ....logger import SLoggingManager
+
+log_manager = SLoggingManager()
+logger = log_manager.get_logger('FGD Cache')
+
+FileStamp = Tuple[str, int, int]
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """(path, mtime in ns, size) of a file, None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+class FGDCache:
+    """Binary cache of parsed FGD files.
+
+    Every parsed file gets one pickle holding its parse state and the resolved entity schema,
+    keyed by the stamps of all files in its include closure. An entry is reused only while
+    none of those files changed, changed files and files including them are parsed again.
+    """
+    VERSION = 1
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, path: Path) -> Path:
+        digest = hashlib.sha1(str(Path(path).resolve()).encode('utf8')).hexdigest()
+        return self.cache_dir / f'{digest}.fgdcache'
+
+    def load(self, path: Path) -> Optional[dict]:
+        entry_path = self._entry_path(path)
+        if not entry_path.exists():
+            return None
+        try:
+            with entry_path.open('rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as ex:
+            logger.warn(f'Failed to read FGD cache {entry_path}: {ex}')
+            return None
+        if entry.get('version') != self.VERSION:
+            return None
+        for stamp in entry['stamps']:
+            if file_stamp(Path(stamp[0])) != tuple(stamp):
+                logger.debug(f'{stamp[0]} changed, {path} needs to be parsed again')
+                return None
+        return entry
+
+    def store(self, path: Path, stamps: List[FileStamp], state: dict, schema: Optional[dict] = None):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {'version': self.VERSION, 'stamps': stamps, 'state': state, 'schema': schema}
+        with self._entry_path(path).open('wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,4 +1,27 @@
-from typing import List
+from typing import Dict, List, Mapping, Union
+
+
+def _parse_source_value(value):
+    if type(value) is str:
+        if value.replace('.', '', 1).replace('-', '', 1).isdecimal():
+            return float(value) if '.' in value else int(value)
+        return 0
+    return value
+
+
+def _parse_int_vector(string):
+    return [_parse_source_value(val) for val in string.replace('  ', ' ').split(' ')]
+
+
+def _typed_default(value_type, default):
+    if default is None:
+        return None
+    if default == '':
+        return value_type()
+    try:
+        return value_type(_parse_source_value(default))
+    except (TypeError, ValueError):
+        return None
 
 
 class FGDProperty:
@@ -39,15 +62,14 @@ class FGDProperty:
     def default_value(self):
         return self._default_value
 
-    def parser_code(self):
-        buffer: List[str] = ['@property', f'def {self.name}(self):', f'\tif \"{self.name}\" in self._entity_data:']
+    def schema_entry(self) -> list:
+        """[name, key, decoder kind, default] entry of the entity property schema (library/shared/entity_schema.py)."""
         value_type = self.value_type.lower()
+        default = self.default_value
         if value_type == 'float':
-            buffer.append(f"\t\treturn float(self._entity_data.get('{self.name}'))")
-            buffer.append(f'\treturn float({self.default_value})')
+            return [self.name, self.name, 'float', _typed_default(float, default)]
         elif value_type in ['integer', 'int', 'node_id', 'node_dest', 'lod_level']:
-            buffer.append(f"\t\treturn int(self._entity_data.get('{self.name}'))")
-            buffer.append(f'\treturn int({self.default_value})')
+            return [self.name, self.name, 'int', _typed_default(int, default)]
         elif value_type in ['string', 'parentAttachment', 'target_source',
                             'target_destination', 'choices', 'studio',
                             'materialgroup', 'bodygroupchoices', 'parentattachment',
@@ -59,30 +81,18 @@ class FGDProperty:
                             'surface_properties', 'target_name_or_class', 'scene',
                             'modelstatechoices', 'resource_choices:model', 'resource:postprocessing',
                             'remove_key', ]:
-            buffer.append(f"\t\treturn self._entity_data.get('{self.name}')")
-            if self.default_value is None:
-                buffer.append(f'\treturn None')
-            else:
-                buffer.append(f'\treturn "{self.default_value}"')
+            return [self.name, self.name, 'string', None if default is None else str(default)]
         elif value_type in ['boolean', 'bool']:
-            buffer.append(f"\t\treturn bool(self._entity_data.get('{self.name}'))")
-            if type(self.default_value) is str:
-                default = self.default_value.replace("No", "False").replace("Yes", "True")
-                buffer.append(f'\treturn bool({default})')
-            else:
-                buffer.append(f'\treturn bool({self.default_value})')
+            if type(default) is str and default.lower() in ('yes', 'no'):
+                return [self.name, self.name, 'bool', default.lower() == 'yes']
+            return [self.name, self.name, 'bool', bool(_typed_default(float, default))]
         elif value_type == 'scriptlist':
-            buffer.append(f"\t\treturn self._entity_data.get('{self.name}')")
-            buffer.append(f'\treturn "{self.default_value}"')
+            return [self.name, self.name, 'string', str(default)]
         elif value_type in ['vector', 'angle', 'color255', 'local_point', 'vecline', 'sidelist', 'axis',
                             'node_id_list', 'world_point', 'curve']:
-            buffer.append(f"\t\treturn parse_int_vector(self._entity_data.get('{self.name}'))")
-            buffer.append(f'\treturn parse_int_vector("{self.default_value}")')
+            return [self.name, self.name, 'vector', _parse_int_vector(str(default))]
         else:
             raise NotImplementedError(f"Unsupported type:{value_type}")
-            # buffer.append(f"\t\treturn entity_data.get('{self.name}')")
-            # buffer.append(f'\treturn "{self.default_value}"')
-        return buffer
 
 
 class FGDChoiceProperty(FGDProperty):
@@ -102,18 +112,9 @@ class FGDFlagProperty(FGDProperty):
         super().__init__(name, value_type, display_name, default_value, description, meta)
         self._flags = flags
 
-    def parser_code(self):
-        buffer: List[str] = ['@property',
-                             f'def {self.name}(self):',
-                             "\tflags = []",
-                             f'\tif \"{self.name}\" in self._entity_data:',
-                             f"\t\tvalue = self._entity_data.get(\"{self.name}\",{self.default_value})"]
-        keys = self._flags
-        buffer.append(f"\t\tfor name,(key,_) in {keys}.items():")
-        buffer.append(f'\t\t\tif value&key>0:')
-        buffer.append(f'\t\t\t\tflags.append(name)')
-        buffer.append(f'\treturn flags')
-        return buffer
+    def schema_entry(self) -> list:
+        # Flag properties store their (name, mask) pairs in place of a default
+        return [self.name, self.name, 'flags', [[name, key] for name, (key, _) in self._flags.items()]]
 
     @property
     def flags(self):
@@ -156,49 +157,42 @@ class FGDEntity:
     def __str__(self):
         return f"{self.class_type}({self.name})"
 
-    def _find_parent_class(self, class_name, list_of_classes: List['FGDEntity']):
-        for c in list_of_classes:
-            if c.name == class_name:
-                return c
-        return None
+    def _find_parent_class(self, class_name, class_index: Mapping[str, 'FGDEntity']):
+        return class_index.get(class_name, None)
 
-    def _gather_all_bases(self, base_name, list_of_classes):
+    def _gather_all_bases(self, base_name, class_index: Mapping[str, 'FGDEntity']):
         bases = []
-        cls = self._find_parent_class(base_name, list_of_classes)
+        cls = self._find_parent_class(base_name, class_index)
         if cls:
             for base in cls.bases:
-                bases.extend(self._gather_all_bases(base, list_of_classes))
+                bases.extend(self._gather_all_bases(base, class_index))
                 bases.append(base)
         return bases
 
-    def parser_code(self, list_of_clases: List['FGDEntity']):
-        buffer = ''
+    def schema_entry(self, classes: Union[Mapping[str, 'FGDEntity'], List['FGDEntity']]) -> dict:
+        """Entry of this class in the entity property schema (library/shared/entity_schema.py)."""
+        class_index = build_class_index(classes)
+        entry = {}
         if self.bases:
             existing_bases = []
             for base in self.bases:
-                existing_bases += self._gather_all_bases(base, list_of_clases)
-
-            buffer += f'class {self.name}({", ".join([base for base in self.bases if base not in existing_bases])}):\n'
-        else:
-            buffer += f'class {self.name}:\n'
-        buffer += '\tpass\n\n'
+                existing_bases += self._gather_all_bases(base, class_index)
+            entry['bases'] = [base for base in self.bases if base not in existing_bases]
 
+        attributes = {}
         for name, definition in self.definitions:
             if not definition:
                 continue
             if name == 'iconsprite':
-                buffer += f'\ticon_sprite = "{definition[0]}"\n'
+                attributes['icon_sprite'] = definition[0]
             elif name == 'studio':
-                buffer += f'\t_model = "{definition[0]}"\n'
-        if not self.bases:
-            buffer += f'\tdef __init__(self, entity_data:dict):\n'
-            buffer += f'\t\tself._entity_data = entity_data\n\n'
-        for prop in self.properties:
-            for line in prop.parser_code():
-                buffer += '\t' + line + '\n'
-            buffer += '\n'
-        buffer += '\n'
-        return buffer
+                attributes['_model'] = definition[0]
+        if attributes:
+            entry['attributes'] = attributes
+        properties = [prop.schema_entry() for prop in self.properties]
+        if properties:
+            entry['properties'] = properties
+        return entry
 
     @property
     def definitions(self):
@@ -291,3 +285,13 @@ class FGDEntity:
                     self._properties[n].update(new_prop)
 
         self._description = doc
+
+
+def build_class_index(classes: Union[Mapping[str, FGDEntity], List[FGDEntity]]) -> Mapping[str, FGDEntity]:
+    """Name to class mapping, the first definition of a name wins like in a linear search."""
+    if isinstance(classes, Mapping):
+        return classes
+    class_index: Dict[str, FGDEntity] = {}
+    for cls in classes:
+        class_index.setdefault(cls.name, cls)
+    return class_index
@@ -1,8 +1,10 @@
+import json
 from enum import Enum
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ...shared.content_providers.content_manager import ContentManager
+from ...utils.fgd_parser.fgd_cache import FGDCache, FileStamp, file_stamp
 from ...utils.fgd_parser.fgd_classes import FGDEntity
 
 
@@ -169,18 +171,25 @@ class FGDLexer:
 
 
 class FGDParser:
-    def __init__(self, path: Union[Path, str] = None, buffer_and_name: Tuple[str, str] = None):
+    def __init__(self, path: Union[Path, str] = None, buffer_and_name: Tuple[str, str] = None,
+                 cache: Optional[FGDCache] = None):
+        self._source: Optional[Tuple[str, str]] = None
         if path is not None:
             self._path = Path(path)
-            with self._path.open() as f:
-                self._lexer = FGDLexer(f.read(), str(self._path))
         elif buffer_and_name is not None:
-            self._lexer = FGDLexer(*buffer_and_name)
+            self._source = buffer_and_name
             self._path = buffer_and_name[1]
-        self._tokens = self._lexer.lex()
+        self._lexer: Optional[FGDLexer] = None
+        self._tokens = None
         self._last_peek = None
+        self._cache = cache
+        # Only files on disk can be validated against the cache
+        self._cacheable = self._source is None
+        self._stamps: List[FileStamp] = []
+        self._schema: Optional[dict] = None
 
         self.classes: List[FGDEntity] = []
+        self.class_index: Dict[str, FGDEntity] = {}
         self.excludes = []
         self.pragmas = {}
         self.includes = []
@@ -217,6 +226,56 @@ class FGDParser:
         return False
 
     def parse(self):
+        if self._cache is not None and self._cacheable:
+            entry = self._cache.load(self._path)
+            if entry is not None:
+                self._set_state(entry['state'])
+                self._stamps = entry['stamps']
+                self._schema = entry['schema']
+                return
+        self._parse_source()
+        if self._cache is not None and self._cacheable:
+            self._cache.store(self._path, self._stamps, self._get_state())
+
+    @property
+    def schema(self) -> dict:
+        """Resolved entity property schema of all classes, persisted in the cache along with the parse state."""
+        if self._schema is None:
+            self._schema = {'classes': {cls.name: cls.schema_entry(self.class_index) for cls in self.classes}}
+            if self._cache is not None and self._cacheable:
+                self._cache.store(self._path, self._stamps, self._get_state(), self._schema)
+        return self._schema
+
+    def _get_state(self) -> dict:
+        return {'classes': self.classes, 'excludes': self.excludes, 'pragmas': self.pragmas,
+                'includes': self.includes, 'entity_groups': self.entity_groups, 'vis_groups': self.vis_groups}
+
+    def _set_state(self, state: dict):
+        self.classes = []
+        self.class_index = {}
+        for cls in state['classes']:
+            self._add_class(cls)
+        self.excludes = state['excludes']
+        self.pragmas = state['pragmas']
+        self.includes = state['includes']
+        self.entity_groups = state['entity_groups']
+        self.vis_groups = state['vis_groups']
+
+    def _add_class(self, cls: FGDEntity):
+        self.classes.append(cls)
+        self.class_index.setdefault(cls.name, cls)
+
+    def _parse_source(self):
+        if self._source is None:
+            stamp = file_stamp(self._path)
+            if stamp is None:
+                self._cacheable = False
+            else:
+                self._stamps.append(stamp)
+            with self._path.open() as f:
+                self._source = f.read(), str(self._path)
+        self._lexer = FGDLexer(*self._source)
+        self._tokens = self._lexer.lex()
         while self._lexer:
             if self.match(FGDToken.KEYWORD):
                 _, value = self.advance()
@@ -243,15 +302,25 @@ class FGDParser:
 
     def _parse_include(self):
         include = self.expect(FGDToken.STRING)
-        file = ContentManager().find_file(include)
-        if file is not None:
+        content_manager = ContentManager()
+        include_path = content_manager.find_path(include)
+        if include_path is not None and Path(include_path).is_file():
+            # Includes on disk have their own cache entries, only changed ones are parsed again
+            parsed_include = FGDParser(include_path, cache=self._cache)
+        else:
+            file = content_manager.find_file(include)
+            if file is None:
+                return
             parsed_include = FGDParser(buffer_and_name=(file.read().decode("ascii"), include))
-            parsed_include.parse()
-            self.classes.extend(parsed_include.classes)
-            self.pragmas.update(parsed_include.pragmas)
-            self.excludes.extend(parsed_include.excludes)
-            self.entity_groups.extend(parsed_include.entity_groups)
-            self.includes.append(include)
+        parsed_include.parse()
+        for cls in parsed_include.classes:
+            self._add_class(cls)
+        self.pragmas.update(parsed_include.pragmas)
+        self.excludes.extend(parsed_include.excludes)
+        self.entity_groups.extend(parsed_include.entity_groups)
+        self.includes.append(include)
+        self._stamps.extend(parsed_include._stamps)
+        self._cacheable = self._cacheable and parsed_include._cacheable
 
     def _parse_mapsize(self):
         self.expect(FGDToken.LPAREN)
@@ -274,10 +343,7 @@ class FGDParser:
         self.entity_groups.append(group)
 
     def _find_parent_class(self, class_name):
-        for cls in self.classes:
-            if cls.name == class_name:
-                return cls
-        return None
+        return self.class_index.get(class_name, None)
 
     def _parse_baseclass(self, class_type):
 
@@ -345,7 +411,7 @@ class FGDParser:
                 class_obj.override(definitions, doc, props, io)
         else:
             class_obj = FGDEntity(class_type, class_name, definitions, doc, props, io)
-        self.classes.append(class_obj)
+        self._add_class(class_obj)
 
     def _parse_fully_qualified_identifier(self):
         p1 = self.expect(FGDToken.IDENTIFIER)
@@ -514,8 +580,7 @@ if __name__ == '__main__':
     # test_file = Path(r"H:\SteamLibrary\SteamApps\common\SourceFilmmaker\game\bin\swarm.fgd")
     # test_file = Path(r"H:\SteamLibrary\SteamApps\common\SourceFilmmaker\game\bin\base.fgd")
     ContentManager().scan_for_content(test_file)
-    parser = FGDParser(test_file)
+    parser = FGDParser(test_file, cache=FGDCache(Path(__file__).parent / 'cache'))
     parser.parse()
-    for cls in parser.classes:
-        print(cls.parser_code())
-    pass
+    with open(f'../../../blender_bindings/source2/vwrld/entities/schemas/{test_file.stem}.json', 'w') as f:
+        json.dump(parser.schema, f, separators=(',', ':'))
@@ -2,6 +2,7 @@ import abc
 import binascii
 import contextlib
 import io
+import mmap
 import os
 import struct
 from pathlib import Path
@@ -252,7 +253,7 @@ class MemoryBuffer(Buffer):
         elif whence == io.SEEK_CUR:
             self._offset += offset
         elif whence == io.SEEK_END:
-            self._offset = self.size() - offset
+            self._offset = self.size() + offset
         else:
             raise ValueError("Invalid whence argument")
 
@@ -261,6 +262,12 @@ class MemoryBuffer(Buffer):
 
         return self._offset
 
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
     def __str__(self) -> str:
         return f'<MemoryBuffer {self.tell()}/{self.size()}>'
 
@@ -346,6 +353,44 @@ class FileBuffer(io.FileIO, Buffer):
             return MemoryBuffer(self.read(size))
 
 
+class MappedFileBuffer(MemoryBuffer):
+    """Read-only memory mapped file. Slices are views into the mapping, nothing is copied until read.
+
+    The mapping and file handle are released by close(), when leaving a with block or when the buffer is dropped.
+    """
+
+    def __init__(self, file: Union[str, Path]):
+        self._file = open(file, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(self._mmap)
+        self.name = str(file)
+
+    def __str__(self) -> str:
+        return f'<MappedFileBuffer: {self.name!r} {self.tell()}/{self.size()}>'
+
+    def close(self) -> None:
+        # Also called from __del__ when opening the file failed
+        if getattr(self, '_buffer', None) is None:
+            return
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            # Slices handed out earlier are still alive, mapping is freed together with them
+            pass
+        self._buffer = None
+        self._file.close()
+
+    def __enter__(self) -> 'MappedFileBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
 T = TypeVar("T")
 
 
@@ -355,4 +400,4 @@ class Readable(Protocol):
         ...
 
 
-__all__ = ['Buffer', 'MemoryBuffer', 'WritableMemoryBuffer', 'FileBuffer', 'Readable']
+__all__ = ['Buffer', 'MemoryBuffer', 'MappedFileBuffer', 'WritableMemoryBuffer', 'FileBuffer', 'Readable']
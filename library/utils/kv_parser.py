@@ -1,7 +1,8 @@
+import re
 import warnings
 from enum import Enum
 from pathlib import Path
-from typing import Iterator, List, Mapping, Tuple, Union
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 __all__ = ["KVLexerException", "KVParserException", "ValveKeyValueParser", "KeyValuePair", "KVDataProxy"]
 
@@ -21,6 +22,51 @@ class KVDataProxy(Mapping):
 
     def __init__(self, data: List[KeyValuePair]):
         self.data = data
+        # Lower case key -> indices of all its pairs, built on first lookup
+        self._index: Optional[Dict[str, List[int]]] = None
+        # Indices of pairs whose condition does not hold on the active platform
+        self._hidden: Set[int] = set()
+        self._children: Dict[int, 'KVDataProxy'] = {}
+
+    @classmethod
+    def condition_holds(cls, condition: Union[str, List[str]]) -> bool:
+        """Evaluate [$X360] style conditions, also accepts the token list produced by the parser."""
+        if not isinstance(condition, str):
+            condition = ''.join(condition)
+        for alternative in condition.split('||'):
+            for term in alternative.split('&&'):
+                term = term.strip()
+                if term.startswith('!'):
+                    if cls.known_conditions.get(term[1:], False):
+                        break
+                elif not cls.known_conditions.get(term, False):
+                    break
+            else:
+                return True
+        return False
+
+    @classmethod
+    def _is_visible(cls, value) -> bool:
+        if isinstance(value, tuple) and len(value) == 2:
+            return cls.condition_holds(value[1])
+        return True
+
+    def _build_index(self) -> Dict[str, List[int]]:
+        index = {}
+        hidden = set()
+        for i, (key, value) in enumerate(self.data):
+            index.setdefault(key.lower(), []).append(i)
+            if not self._is_visible(value):
+                hidden.add(i)
+        self._index = index
+        self._hidden = hidden
+        return index
+
+    def _indices(self, name: str) -> List[int]:
+        index = self._index
+        if index is None:
+            index = self._build_index()
+        return index.get(name.lower(), [])
 
     def __contains__(self, item):
         return self.get(item) is not None
@@ -39,47 +85,25 @@ class KVDataProxy(Mapping):
             raise KeyError(f'Key {item!r} not found')
 
     def __delitem__(self, name: str) -> None:
-        for item in self.data:
-            if item[0] == name:
-                self.data.remove(item)
-                return
+        indices = self._indices(name)
+        if indices:
+            del self.data[indices[0]]
+            # Every following pair moves, rebuild on next lookup
+            self._index = None
+            self._children.clear()
 
     def items(self):
         for key, value in self.data:
             yield key, self._wrap_value(value)
 
     def get(self, name, default=None) -> "KVDataProxy":
-        name = name.lower()
-        for key, value in self.data:
-            if key == name:
-                if isinstance(value, tuple) and len(value) == 2:
-                    value, cond = value
-                    if cond.startswith('!'):
-                        cond = not self.known_conditions[cond[1:]]
-                    else:
-                        cond = self.known_conditions[cond]
-                    if cond:
-                        return self._wrap_value(value)
-                else:
-                    return self._wrap_value(value)
+        for i in self._indices(name):
+            if i not in self._hidden:
+                return self._unpack_value(self.data[i][1])
         return default
 
     def get_multiple(self, name) -> List["KVDataProxy"]:
-        data = []
-        name = name.lower()
-        for key, value in self.data:
-            if key == name:
-                if isinstance(value, tuple) and len(value) == 2:
-                    value, cond = value
-                    if cond.startswith('!'):
-                        cond = not self.known_conditions[cond[1:]]
-                    else:
-                        cond = self.known_conditions[cond]
-                    if cond:
-                        data.append(self._wrap_value(value))
-                else:
-                    data.append(self._wrap_value(value))
-        return data
+        return [self._unpack_value(self.data[i][1]) for i in self._indices(name) if i not in self._hidden]
 
     def top(self) -> Tuple[str, Union[str, 'KVDataProxy']]:
         # assert len(self.data) == 1
@@ -92,11 +116,19 @@ class KVDataProxy(Mapping):
 
     def __setitem__(self, key, value):
         key = key.lower()
-        for i, (name, _) in enumerate(self.data):
-            if name == key:
-                self.data[i] = name, self._wrap_value(value)
-                return
-        self.data.append((key, self._wrap_value(value)))
+        value = self._wrap_value(value)
+        indices = self._indices(key)
+        if indices:
+            i = indices[0]
+            self.data[i] = key, value
+        else:
+            i = len(self.data)
+            self.data.append((key, value))
+            self._index[key] = [i]
+        if self._is_visible(value):
+            self._hidden.discard(i)
+        else:
+            self._hidden.add(i)
 
     def merge(self, other: 'KVDataProxy'):
         for o_item, o_value in other.items():
@@ -108,12 +140,35 @@ class KVDataProxy(Mapping):
             else:
                 self[o_item] = o_value
 
-    @staticmethod
-    def _wrap_value(value):
+    def _wrap_value(self, value):
         if isinstance(value, list):
-            return KVDataProxy(value)
+            # One proxy per nested block, so its index is built only once
+            proxy = self._children.get(id(value), None)
+            if proxy is None:
+                proxy = self._children[id(value)] = KVDataProxy(value)
+            return proxy
         return value
 
+    def _unpack_value(self, value):
+        if isinstance(value, tuple) and len(value) == 2:
+            value = value[0]
+        return self._wrap_value(value)
+
+    def copy(self) -> 'KVDataProxy':
+        """Deep copy, nested blocks of the copy can be modified without touching this tree."""
+        return KVDataProxy(self._copy_pairs(self.data))
+
+    @classmethod
+    def _copy_pairs(cls, pairs: List[KeyValuePair]) -> List[KeyValuePair]:
+        copied = []
+        for key, value in pairs:
+            if isinstance(value, KVDataProxy):
+                value = cls._copy_pairs(value.data)
+            elif isinstance(value, list):
+                value = cls._copy_pairs(value)
+            copied.append((key, value))
+        return copied
+
     def to_dict(self):
         items = {}
         for k, v in self.items():
@@ -147,28 +202,45 @@ class VKVToken(Enum):
     EOF = "End of file"
 
 
+# Whole tokens are matched in one go, bare words stop at whitespace, quotes, braces, brackets and $/% prefixes
+_TOKEN_RE = re.compile(r"""
+    (?P<newline>\n+)
+  | (?P<space>(?:\r\n|[^\S\n])+)
+  | (?P<comment>//(?:\r\n|[^\n])*)
+  | (?P<lbrace>\{)
+  | (?P<rbrace>\})
+  | (?P<lbracket>\[)
+  | (?P<rbracket>\])
+  | (?P<empty>["'](?:["']|\Z))
+  | (?P<dquote>"(?P<dquoted>[^"\n]*)(?P<dclosed>")?)
+  | (?P<squote>'(?P<squoted>[^'"\n]*)(?P<sclosed>')?)
+  | (?P<prefixed>[$%](?P<prefixed_word>[^\s$%{}\[\]"']*))
+  | (?P<word>[^\s$%{}\[\]"']+)
+""", re.VERBOSE)
+
+# Control symbols accepted inside strings
+_ALLOWED_CONTROLS = str.maketrans('\t\x7f\x1b', '   ')
+
+
+def _valid_prefix_length(text: str) -> int:
+    """Length of the leading part of text made of printable (or explicitly allowed) symbols."""
+    if text.isprintable():
+        return len(text)
+    text = text.translate(_ALLOWED_CONTROLS)
+    if text.isprintable():
+        return len(text)
+    for i, symbol in enumerate(text):
+        if not symbol.isprintable():
+            return i
+    return len(text)
+
+
 class ValveKeyValueLexer:
 
     def __init__(self, buffer: str, buffer_name: str = '<memory>'):
         self.buffer = buffer.replace('\r\n', '\n')
         self.buffer_name = buffer_name
         self._offset = 0
-        self._line = 1
-        self._column = 1
-
-    @property
-    def symbol(self):
-        if self._offset < len(self.buffer):
-            return self.buffer[self._offset]
-        else:
-            return ""
-
-    @property
-    def next_symbol(self):
-        if self._offset + 1 < len(self.buffer):
-            return self.buffer[self._offset + 1]
-        else:
-            return ""
 
     @property
     def leftover(self):
@@ -176,29 +248,24 @@ class ValveKeyValueLexer:
 
     @property
     def line(self):
-        return self._line
+        return self._position(self._offset)[0]
 
     @property
     def column(self):
-        return self._column
+        return self._position(self._offset)[1]
 
-    def advance(self):
-        symbol = self.symbol
-        if symbol:
-            if symbol == '\r' and self.next_symbol == '\n':
-                self._offset += 1
-
-            if symbol == '\n' or symbol == '\r':
-                self._line += 1
-                self._column = 1
-            else:
-                self._column += 1
-            self._offset += 1
-        return symbol
+    def _position(self, offset: int) -> Tuple[int, int]:
+        # Only needed for warnings and errors, so it is computed on demand
+        return self.buffer.count('\n', 0, offset) + 1, offset - self.buffer.rfind('\n', 0, offset)
 
-    def skip(self, count=1):
-        for _ in range(count):
-            self.advance()
+    def _unknown_symbol(self, offset: int):
+        line, column = self._position(offset)
+        return KVLexerException(
+            f'Unknown symbol {self.buffer[offset]!r} in {self.buffer_name!r} at {line}:{column}')
+
+    def _warn_unterminated(self, terminator: str, offset: int):
+        line, column = self._position(offset)
+        warnings.warn(f'Expected {terminator!r}, but got {self.buffer[offset:offset + 1]!r} at {line}:{column}')
 
     @staticmethod
     def _is_valid_symbol(symbol):
@@ -207,107 +274,86 @@ class ValveKeyValueLexer:
     def _is_valid_quoted_symbol(self, symbol):
         return self._is_valid_symbol(symbol) or symbol in '$%.,\'\\/<>=![]{}?'
 
-    def _is_escaped_symbol(self):
-        return self.next_symbol in '\'"\\'
+    def _read_quoted_string(self, offset: int) -> Tuple[str, int]:
+        """Symbol by symbol fallback for quoted strings with \\x sequences or control symbols."""
+        buffer = self.buffer
+        buffer_size = len(buffer)
+        terminator = buffer[offset]
+        offset += 1
+        string_buffer = []
 
-    def read_simple_string(self, terminators='\n'):
-        string_buffer = ""
-        while True:
-            symbol = self.symbol
-            if symbol == "\\" and self.next_symbol == "x":
-                self.advance()
-            # if symbol in '"\'':
-            #     self.advance()
-            #     break
-            if not self._is_valid_symbol(symbol) or symbol in terminators:
-                break
-            string_buffer += self.advance()
-        return string_buffer.strip().rstrip()
-
-    def read_quoted_string(self):
-        terminator = self.advance()
-        string_buffer = ""
+        def advance(offset: int) -> int:
+            # "\r\n" pairs left over after newline normalization are stepped over as one symbol
+            if buffer.startswith('\r\n', offset):
+                return offset + 2
+            return min(offset + 1, buffer_size)
 
         while True:
-            symbol = self.symbol
-            if symbol == "\\" and self.next_symbol == "x":
-                self.advance()
-                self.advance()
-                self.advance()
-            # if symbol == '\\' and self.next_symbol in '\'"ntr':
-            #     self.advance()
+            symbol = buffer[offset:offset + 1]
+            if symbol == "\\" and buffer[offset + 1:offset + 2] == "x":
+                offset = advance(advance(advance(offset)))
             if not self._is_valid_quoted_symbol(symbol) or symbol in terminator + '\n':
                 break
-
-            string_buffer += self.advance()
-        if self.symbol == terminator:
-            self.advance()
+            string_buffer.append(buffer[offset:offset + 1])
+            offset = advance(offset)
+        if buffer[offset:offset + 1] == terminator:
+            offset += 1
         else:
-            warnings.warn(f'Expected {terminator!r}, but got {self.symbol !r} at {self._line}:{self._column}')
-
-        return string_buffer.strip().rstrip()
+            self._warn_unterminated(terminator, offset)
+        return ''.join(string_buffer).strip(), offset
 
     def lex(self):
-        while self._offset < len(self.buffer):
-            symbol = self.symbol
-            if symbol == '\n':
-                if self.next_symbol == '\n':
-                    while self.next_symbol == '\n':
-                        self.advance()  # skip multiple new lines
-                yield VKVToken.NEWLINE, self.advance()
-            elif symbol.isspace():
-                self.advance()
+        buffer = self.buffer
+        buffer_size = len(buffer)
+        match_token = _TOKEN_RE.match
+        while self._offset < buffer_size:
+            offset = self._offset
+            match = match_token(buffer, offset)
+            kind = match.lastgroup
+            self._offset = match.end()
+            if kind == 'newline':
+                yield VKVToken.NEWLINE, '\n'
+            elif kind == 'space' or kind == 'comment':
                 continue
-            elif symbol == '/' and self.next_symbol == '/':
-                self.advance(), self.advance()
-                comment = ''
-                while self.symbol != '\n' and self:
-                    comment += self.advance()
-                # yield VKVToken.COMMENT, comment
-            elif symbol == '{':
-                yield VKVToken.LBRACE, self.advance()
-            elif symbol == '}':
-                yield VKVToken.RBRACE, self.advance()
-            elif self._is_valid_symbol(symbol):
-                string = self.read_simple_string(terminators=' \t\n')
+            elif kind == 'lbrace':
+                yield VKVToken.LBRACE, '{'
+            elif kind == 'rbrace':
+                yield VKVToken.RBRACE, '}'
+            elif kind == 'lbracket':
+                yield VKVToken.LBRACKET, '['
+            elif kind == 'rbracket':
+                yield VKVToken.RBRACKET, ']'
+            elif kind == 'empty':
+                yield VKVToken.STRING, ""
+            elif kind == 'dquote' or kind == 'squote':
+                quoted = match.group('dquoted' if kind == 'dquote' else 'squoted')
+                if '\\x' in quoted or _valid_prefix_length(quoted) != len(quoted):
+                    string, self._offset = self._read_quoted_string(offset)
+                else:
+                    if match.group('dclosed' if kind == 'dquote' else 'sclosed') is None:
+                        self._warn_unterminated(buffer[offset], self._offset)
+                    string = quoted.strip()
                 if string:
                     yield VKVToken.STRING, string
-            elif symbol in '\'"':
-                if self.next_symbol in '\'"':
-                    self.advance(), self.advance()
-                    yield VKVToken.STRING, ""
-                    continue
-                string = self.read_quoted_string()
+            elif kind == 'prefixed':
+                string = match.group('prefixed_word')
+                valid_length = _valid_prefix_length(string)
+                if valid_length != len(string):
+                    # The invalid symbol is reported by the next iteration
+                    string = string[:valid_length]
+                    self._offset = offset + 1 + valid_length
                 if string:
-                    yield VKVToken.STRING, string
-            elif symbol == '$':
-                self.advance()
-                string = self.read_simple_string(terminators=' \t\n')
-                if string:
-                    yield VKVToken.STRING, "$" + string
-            elif self.symbol in "<>=":
-                expr = ""
-                while True:
-                    if self.symbol not in "<>=":
-                        break
-                    expr += self.symbol
-                if expr:
-                    yield VKVToken.EXPRESSION, expr
-            elif symbol == '%':
-                self.advance()
-                string = self.read_simple_string(terminators=' \t\n')
-                if string:
-                    yield VKVToken.STRING, "%" + string
-            elif symbol == '[':
-                yield VKVToken.LBRACKET, self.advance()
-            elif symbol == ']':
-                yield VKVToken.RBRACKET, self.advance()
-            elif symbol.isprintable():
-                warnings.warn(f'Unknown symbol {self.advance()!r} at {self._line}:{self._column}')
-                continue
+                    yield VKVToken.STRING, buffer[offset] + string.replace('\\x', 'x')
             else:
-                raise KVLexerException(
-                    f'Unknown symbol {symbol!r} in {self.buffer_name!r} at {self._line}:{self._column}')
+                string = match.group('word')
+                valid_length = _valid_prefix_length(string)
+                if valid_length == 0:
+                    self._offset = offset
+                    raise self._unknown_symbol(offset)
+                if valid_length != len(string):
+                    string = string[:valid_length]
+                    self._offset = offset + valid_length
+                yield VKVToken.STRING, string.replace('\\x', 'x')
         yield VKVToken.EOF, None
 
     def __bool__(self):
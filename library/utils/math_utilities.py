@@ -1,5 +1,5 @@
 import math
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 
@@ -241,6 +241,47 @@ def sizeof_fmt(num):
         return '1 byte'
 
 
+def group_weights_by_bone(bone_indices: np.ndarray,
+                          weights: np.ndarray) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """Regroup per-vertex (bone, weight) slots into per-bone vertex lists.
+
+    bone_indices and weights are (vertex_count, slots) arrays. Returns a dict mapping bone index to a
+    sorted array of vertex indices and the matching weights. Zero weights are dropped and when one vertex
+    references the same bone more than once the last slot wins, same as vertex_group.add(..., 'REPLACE').
+    """
+    bone_indices = np.asarray(bone_indices)
+    weights = np.asarray(weights, np.float32)
+    vertex_count = bone_indices.shape[0]
+    bone_indices = bone_indices.reshape((vertex_count, -1))
+    weights = weights.reshape((vertex_count, -1))
+
+    vertex_ids = np.repeat(np.arange(vertex_count, dtype=np.uint32), bone_indices.shape[1])
+    flat_bones = bone_indices.ravel()
+    flat_weights = weights.ravel()
+    mask = flat_weights > 0
+    vertex_ids = vertex_ids[mask]
+    flat_bones = flat_bones[mask]
+    flat_weights = flat_weights[mask]
+    if flat_bones.size == 0:
+        return {}
+
+    # Stable sort keeps vertex ids ascending inside each bone run
+    order = np.argsort(flat_bones, kind='stable')
+    flat_bones = flat_bones[order]
+    vertex_ids = vertex_ids[order]
+    flat_weights = flat_weights[order]
+
+    keep = np.ones(flat_bones.size, dtype=bool)
+    keep[:-1] = (flat_bones[:-1] != flat_bones[1:]) | (vertex_ids[:-1] != vertex_ids[1:])
+    flat_bones = flat_bones[keep]
+    vertex_ids = vertex_ids[keep]
+    flat_weights = flat_weights[keep]
+
+    unique_bones, starts = np.unique(flat_bones, return_index=True)
+    return {int(bone): (ids, bone_weights) for bone, ids, bone_weights in
+            zip(unique_bones, np.split(vertex_ids, starts[1:]), np.split(flat_weights, starts[1:]))}
+
+
 def vector_normalize(v):
     norm = np.linalg.norm(v, ord=1)
     if norm == 0: